@@ -27,7 +27,7 @@ def get_baseline_from_file(filename: str) -> SecretsCollection:
     """
     try:
         # TODO: Should we upgrade this?
-        return baseline.load(baseline.load_from_file(filename), filename)
+        return baseline.load(baseline.load_from_file(filename, stream_results=True), filename)
     except (OSError, json.decoder.JSONDecodeError):
         io.print_error('Not a valid baseline file!')
         raise InvalidBaselineError
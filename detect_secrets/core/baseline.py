@@ -1,20 +1,30 @@
+import itertools
 import json
+import os
+import sqlite3
 import time
 from typing import Any
 from typing import Callable
 from typing import cast
 from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
+from . import compact_baseline
 from . import upgrades
 from ..__version__ import VERSION
 from ..exceptions import UnableToReadBaselineError
 from ..settings import configure_settings_from_baseline
 from ..settings import get_settings
+from ..util import json_stream
 from ..util.importlib import import_modules_from_package
 from ..util.semver import Version
+from .cache import ResultCache
+from .scan import get_changed_files
 from .scan import get_files_to_scan
 from .secrets_collection import SecretsCollection
 
@@ -24,12 +34,21 @@ def create(
     should_scan_all_files: bool = False,
     root: str = '',
     num_processors: Optional[int] = None,
+    cache_dir: str = '',
 ) -> SecretsCollection:
-    """Scans all the files recursively in path to initialize a baseline."""
-    kwargs = {}
+    """
+    Scans all the files recursively in path to initialize a baseline.
+
+    :param cache_dir: if specified, results will be cached in this directory, so that
+        unchanged files will not be rescanned on subsequent runs.
+    """
+    kwargs: Dict[str, Any] = {}
     if num_processors:
         kwargs['num_processors'] = num_processors
 
+    if cache_dir:
+        kwargs['cache'] = ResultCache(cache_dir)
+
     secrets = SecretsCollection(root=root)
     secrets.scan_files(
         *get_files_to_scan(*paths, should_scan_all_files=should_scan_all_files, root=root),
@@ -39,6 +58,77 @@ def create(
     return secrets
 
 
+def update(
+    old_secrets: SecretsCollection,
+    *paths: str,
+    since: str,
+    should_scan_all_files: bool = False,
+    root: str = '',
+    num_processors: Optional[int] = None,
+    cache_dir: str = '',
+) -> SecretsCollection:
+    """
+    Rather than rescanning every file to re-catalog the secrets in the repository, this only
+    rescans the files that have changed since the `since` git revision. Results for all other
+    files are carried over from the old secrets, and deleted files are dropped.
+
+    This assumes that the old secrets were obtained with the same settings.
+
+    :raises: CalledProcessError
+    """
+    changed_files = get_changed_files(
+        *paths,
+        since=since,
+        should_scan_all_files=should_scan_all_files,
+        root=root,
+    )
+
+    secrets = SecretsCollection(root=root)
+    secrets.scan_files(
+        *[
+            filename
+            for filename in sorted(changed_files)
+            if os.path.isfile(os.path.join(root, filename))
+        ],
+        num_processors=num_processors,
+        cache=ResultCache(cache_dir) if cache_dir else None,
+    )
+
+    # This preserves the labels of secrets in the rescanned files...
+    secrets.merge(old_secrets)
+
+    # ...and everything else is left untouched.
+    for filename in old_secrets.files:
+        if filename not in changed_files:
+            secrets[filename] = old_secrets[filename]
+
+    return secrets
+
+
+def create_from_history(
+    *commits: str,
+    root: str = '',
+    num_processors: Optional[int] = None,
+    old_secrets: Optional[SecretsCollection] = None,
+) -> SecretsCollection:
+    """
+    Scans the changes introduced by each git commit (oldest first), to catalog all secrets that
+    were ever committed to the repository, even if they have since been removed. Each secret is
+    recorded with the first commit it was found in.
+
+    :param old_secrets: if provided, the results of a previous history scan. These secrets
+        keep their original commits (and labels), and new secrets are added to them.
+    :raises: CalledProcessError
+    """
+    secrets = SecretsCollection(root=root)
+    if old_secrets:
+        for filename in old_secrets.files:
+            secrets[filename] = set(old_secrets[filename])
+
+    secrets.scan_commits(*commits, num_processors=num_processors)
+    return secrets
+
+
 def load(baseline: Dict[str, Any], filename: str = '') -> SecretsCollection:
     """
     With a given baseline file, load all settings and discovered secrets from it.
@@ -52,41 +142,127 @@ def load(baseline: Dict[str, Any], filename: str = '') -> SecretsCollection:
     return SecretsCollection.load_from_baseline(baseline)
 
 
-def load_from_file(filename: str) -> Dict[str, Any]:
+def load_from_file(
+    filename: str,
+    filenames: Optional[Iterable[str]] = None,
+    stream_results: bool = False,
+) -> Dict[str, Any]:
     """
+    :param filenames: if specified, only results for these files will be loaded. All other
+        results are never decoded (or, for compact baselines, never read).
+    :param stream_results: if True, results will be an iterator of (filename, secrets) pairs,
+        rather than a dictionary. These are decoded one file at a time as they are consumed
+        (e.g. by `load`), so that all results are never held in memory at once. This iterator
+        may raise UnableToReadBaselineError.
     :raises: UnableToReadBaselineError
     :raises: InvalidBaselineError
     """
+    include = _get_results_filter(filenames)
     try:
+        if compact_baseline.is_compact_baseline(filename):
+            output = compact_baseline.load(filename, filenames=filenames)
+            if stream_results and isinstance(output.get('results'), dict):
+                output['results'] = iter(output['results'].items())
+
+            return output
+
         with open(filename) as f:
-            return cast(Dict[str, Any], json.loads(f.read()))
-    except (FileNotFoundError, OSError, json.decoder.JSONDecodeError) as e:
+            # Results are decoded one file at a time, so the baseline's raw contents are never
+            # held in memory all at once. If they're streamed, they're skipped over for now.
+            output = cast(
+                Dict[str, Any],
+                json_stream.load(
+                    f,
+                    depth=2,
+                    include=(
+                        _get_results_filter(filenames=())
+                        if stream_results
+                        else include
+                    ),
+                ),
+            )
+    except (
+        FileNotFoundError,
+        OSError,
+        UnicodeDecodeError,
+        json.decoder.JSONDecodeError,
+        sqlite3.Error,
+    ) as e:
         raise UnableToReadBaselineError from e
 
+    if stream_results and isinstance(output.get('results'), dict):
+        output['results'] = _read_results(filename, include=include)
+
+    return output
+
 
-def format_for_output(secrets: SecretsCollection, is_slim_mode: bool = False) -> Dict[str, Any]:
+def _get_results_filter(
+    filenames: Optional[Iterable[str]],
+) -> Optional[json_stream.PathFilter]:
+    """
+    :returns: a filter for `json_stream`, that only decodes the results for these files.
+    """
+    if filenames is None:
+        return None
+
+    filenames = set(filenames)
+    return lambda path: path[0] != 'results' or len(path) == 1 or path[1] in filenames
+
+
+def _read_results(
+    filename: str,
+    include: Optional[json_stream.PathFilter] = None,
+) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+    """
+    :raises: UnableToReadBaselineError
+    """
+    try:
+        with open(filename) as f:
+            yield from json_stream.iter_items(f, ('results',), include=include)
+    except (OSError, UnicodeDecodeError, json.decoder.JSONDecodeError) as e:
+        raise UnableToReadBaselineError from e
+
+
+def format_for_output(
+    secrets: SecretsCollection,
+    is_slim_mode: bool = False,
+    stream_results: bool = False,
+) -> Dict[str, Any]:
+    """
+    :param stream_results: if True, results will be an iterator of (filename, secrets) pairs,
+        rather than a dictionary. When passed to `save_to_file`, these are serialized one file
+        at a time, rather than all being held in memory at once.
+    """
+    results = _iter_results(secrets, is_slim_mode=is_slim_mode)
     output = {
         'version': VERSION,
 
         # This will populate settings of filters and plugins,
         **get_settings().json(),
 
-        'results': secrets.json(),
+        'results': results if stream_results else dict(results),
     }
 
     if not is_slim_mode:
         output['generated_at'] = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
-    else:
-        # NOTE: This has a nice little side effect of keeping it ordered by line number,
-        # even though we don't output it.
-        for _, secret_list in cast(
-            Dict[str, List[Dict[str, Any]]],
-            output['results'],
-        ).items():
+
+    return output
+
+
+def _iter_results(
+    secrets: SecretsCollection,
+    is_slim_mode: bool,
+) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+    # Secrets are iterated in order of filename, so this groups them by file.
+    for filename, group in itertools.groupby(secrets, key=lambda item: item[0]):
+        secret_list = [secret.json() for _, secret in group]
+        if is_slim_mode:
+            # NOTE: This has a nice little side effect of keeping it ordered by line number,
+            # even though we don't output it.
             for secret_dict in secret_list:
                 secret_dict.pop('line_number')
 
-    return output
+        yield filename, secret_list
 
 
 def save_to_file(
@@ -96,7 +272,11 @@ def save_to_file(
     """
     :param secrets: if this is a SecretsCollection, it will output the baseline in its latest
         format. Otherwise, you should pass in a dictionary to this function, to manually
-        specify the baseline format to save as.
+        specify the baseline format to save as (results may be streamed, as returned by
+        `format_for_output(..., stream_results=True)`).
+
+        Baselines that are already compact, or whose filename ends with `.db`, are saved as
+        compact baselines (see `detect_secrets.core.compact_baseline`).
 
         If you're trying to decide the difference, ask yourself whether there are any changes
         that does not directly impact the results of the scan.
@@ -104,12 +284,59 @@ def save_to_file(
     # TODO: I wonder whether this should add the `detect_secrets.filters.common.is_baseline_file`
     # filter, since we know the filename already. However, one could argue that it would cause
     # this function to "do more than one thing".
-    output = secrets
-    if isinstance(secrets, SecretsCollection):
-        output = format_for_output(secrets)
+    output = (
+        format_for_output(secrets, stream_results=True)
+        if isinstance(secrets, SecretsCollection)
+        else secrets
+    )
+
+    if compact_baseline.should_save_as_compact_baseline(filename):
+        compact_baseline.save(output, filename)
+        return
 
     with open(filename, 'w') as f:
-        f.write(json.dumps(output, indent=2) + '\n')
+        json_stream.dump(output, f, indent=2)
+        f.write('\n')
+
+
+def replace_results(baseline: Dict[str, Any], results: Dict[str, List[Dict[str, Any]]]) -> None:
+    """
+    Replaces the results for the given files in the baseline (in place), keeping the order
+    of all other files.
+
+    :param results: files without secrets will be removed from the baseline.
+    """
+    output = {}
+    for filename, secrets in baseline['results'].items():
+        secrets = results.get(filename, secrets)
+        if secrets:
+            output[filename] = secrets
+
+    for filename, secrets in results.items():
+        if secrets and filename not in output:
+            output[filename] = secrets
+
+    baseline['results'] = output
+
+
+def replace_results_in_file(filename: str, results: Dict[str, List[Dict[str, Any]]]) -> None:
+    """
+    Replaces the results for the given files in a saved baseline, leaving the rest of it
+    (including its settings) untouched. For compact baselines, only the affected files are
+    rewritten.
+
+    :raises: UnableToReadBaselineError
+    """
+    try:
+        if compact_baseline.is_compact_baseline(filename):
+            compact_baseline.update(filename, results)
+            return
+    except (OSError, sqlite3.Error) as e:
+        raise UnableToReadBaselineError from e
+
+    output = load_from_file(filename)
+    replace_results(output, results)
+    save_to_file(output, filename)
 
 
 def upgrade(baseline: Dict[str, Any]) -> Dict[str, Any]:
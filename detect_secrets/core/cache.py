@@ -0,0 +1,83 @@
+"""
+Most files in a repository don't change between scans. To avoid doing the same work over and
+over again, we cache the results of scanning each file, keyed off the file's content (as well
+as the settings used to scan it). This way, unchanged files are never rescanned.
+
+NOTE: The plaintext secret values are *not* cached, for the same reason they are not saved in
+the baseline. As such, cached results behave just like results loaded from a baseline.
+"""
+import hashlib
+import json
+from typing import List
+from typing import Optional
+
+from ..__version__ import VERSION
+from ..filters.util import compute_file_hash
+from ..settings import get_settings
+from ..util.cache import FileCache
+from .log import log
+from .potential_secret import PotentialSecret
+
+
+class ResultCache:
+    def __init__(self, directory: str, max_size: int = FileCache.DEFAULT_MAX_SIZE) -> None:
+        self.storage = FileCache(directory, max_size=max_size)
+
+        # NOTE: This is computed once (rather than on every lookup), since it is relatively
+        # expensive, and the settings are not expected to change during a scan.
+        self.fingerprint = get_settings_fingerprint()
+
+    def get_key(self, filename: str) -> Optional[str]:
+        """
+        :returns: None, if the file cannot be read.
+        """
+        try:
+            content_hash = compute_file_hash(filename)
+        except OSError:
+            return None
+
+        # The filename is part of the key, since filters (and some plugins) behave differently
+        # depending on the file's name.
+        return hashlib.sha1(    # noqa: S324
+            f'{self.fingerprint}:{filename}:{content_hash}'.encode(),
+        ).hexdigest()
+
+    def get(self, key: str) -> Optional[List[PotentialSecret]]:
+        value = self.storage.get(key)
+        if value is None:
+            return None
+
+        try:
+            return [
+                PotentialSecret.load_secret_from_dict(item)
+                for item in json.loads(value)
+            ]
+        except (ValueError, KeyError, TypeError):
+            log.warning(f'Ignoring corrupted cache entry: {key}')
+            return None
+
+    def set(self, key: str, secrets: List[PotentialSecret]) -> None:
+        self.storage.set(
+            key,
+            json.dumps([secret.json() for secret in secrets]).encode(),
+        )
+
+    def evict(self) -> None:
+        self.storage.evict()
+
+
+def get_settings_fingerprint() -> str:
+    """
+    Any change to the plugins or filters used (including changes to their underlying models,
+    which are captured through their `file_hash`) can change the results of a scan. As such,
+    these are all part of the cache key.
+    """
+    return hashlib.sha1(    # noqa: S324
+        json.dumps(
+            {
+                'version': VERSION,
+                **get_settings().json(),
+            },
+            sort_keys=True,
+        ).encode(),
+    ).hexdigest()
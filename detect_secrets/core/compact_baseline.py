@@ -0,0 +1,275 @@
+"""
+JSON baselines are designed for easy reading (and reviewing), but every secret in them repeats
+its type, filename and verification status. For repositories with a large number of secrets,
+this adds up, and they need to be loaded in their entirety, even if we're only interested in a
+couple of files (e.g. in the pre-commit hook).
+
+Compact baselines store the same content in a SQLite database instead, with filenames and
+secret types only stored once, and secrets indexed by their file. They can be converted to and
+from JSON baselines losslessly, through `load` and `save`.
+"""
+import contextlib
+import json
+import os
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+
+FILE_EXTENSION = '.db'
+
+# https://www.sqlite.org/fileformat.html#the_database_header
+_HEADER = b'SQLite format 3\x00'
+
+_SCHEMA = """
+CREATE TABLE metadata (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE files (id INTEGER PRIMARY KEY, filename TEXT NOT NULL UNIQUE);
+CREATE TABLE types (id INTEGER PRIMARY KEY, type TEXT NOT NULL UNIQUE);
+CREATE TABLE secrets (
+    file_id INTEGER NOT NULL REFERENCES files (id),
+    type_id INTEGER REFERENCES types (id),
+    hashed_secret TEXT,
+    is_verified INTEGER,
+    line_number INTEGER,
+    extra TEXT
+);
+CREATE INDEX secrets_by_file ON secrets (file_id, hashed_secret);
+"""
+
+# These are the fields that are stored in their own columns. All others are stored in `extra`.
+_COLUMNS = ('type', 'hashed_secret', 'is_verified', 'line_number')
+
+
+def is_compact_baseline(filename: str) -> bool:
+    """
+    :raises: FileNotFoundError
+    """
+    with open(filename, 'rb') as f:
+        return f.read(len(_HEADER)) == _HEADER
+
+
+def should_save_as_compact_baseline(filename: str) -> bool:
+    """
+    Baselines are saved in the compact format if they already are, or if they are named as such.
+    """
+    if filename.endswith(FILE_EXTENSION):
+        return True
+
+    try:
+        return is_compact_baseline(filename)
+    except OSError:
+        return False
+
+
+def load(filename: str, filenames: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """
+    :param filenames: if specified, only results for these files will be loaded.
+    :returns: the baseline, in the same format as JSON baselines.
+    :raises: sqlite3.Error
+    """
+    # Opening it read-only ensures that we don't create an empty database if it doesn't exist.
+    uri = Path(os.path.abspath(filename)).as_uri() + '?mode=ro'
+    with closing(sqlite3.connect(uri, uri=True)) as connection:
+        baseline: Dict[str, Any] = {}
+        for key, value in connection.execute('SELECT key, value FROM metadata ORDER BY rowid'):
+            baseline[key] = json.loads(value) if value is not None else None
+
+        files = _get_files(connection, filenames)
+        types = dict(connection.execute('SELECT id, type FROM types'))
+
+        baseline['results'] = {
+            filename: [
+                _unpack(filename, types, row)
+                for row in connection.execute(
+                    'SELECT type_id, hashed_secret, is_verified, line_number, extra '
+                    'FROM secrets WHERE file_id = ? ORDER BY rowid',
+                    (file_id,),
+                )
+            ]
+            for file_id, filename in files
+        }
+
+    return baseline
+
+
+def save(baseline: Dict[str, Any], filename: str) -> None:
+    """
+    :param baseline: in the same format as JSON baselines. Its results may also be an iterator
+        of (filename, secrets) pairs.
+    :raises: sqlite3.Error
+    """
+    # The database is written to a temporary file first, so that the baseline is replaced
+    # atomically (and so that we never write to a database that is still being read from).
+    # NOTE: We let SQLite create this file, so that it has the same permissions as any other
+    # file we write (rather than those of a `tempfile`).
+    path = f'{filename}.{os.getpid()}.tmp'
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(path)
+
+    try:
+        with closing(sqlite3.connect(path)) as connection:
+            # Since this is a temporary file, there's no need to protect against corruption.
+            connection.execute('PRAGMA journal_mode = OFF')
+            connection.execute('PRAGMA synchronous = OFF')
+            connection.executescript(_SCHEMA)
+
+            # NOTE: Results are also recorded in the metadata table, so that the order of keys
+            # is preserved.
+            connection.executemany(
+                'INSERT INTO metadata (key, value) VALUES (?, ?)',
+                [
+                    (key, json.dumps(value) if key != 'results' else None)
+                    for key, value in baseline.items()
+                ],
+            )
+
+            results = baseline.get('results', {})
+            _save_results(connection, results.items() if isinstance(results, dict) else results)
+            connection.commit()
+
+        os.replace(path, filename)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)
+
+        raise
+
+
+def update(filename: str, results: Dict[str, List[Dict[str, Any]]]) -> None:
+    """
+    Replaces the results for the given files, leaving the rest of the baseline untouched.
+
+    :param results: files without secrets will be removed from the baseline.
+    :raises: sqlite3.Error
+    """
+    with closing(sqlite3.connect(filename)) as connection, connection:
+        types = {
+            secret_type: type_id
+            for type_id, secret_type in connection.execute('SELECT id, type FROM types')
+        }
+
+        for name, secrets in results.items():
+            row = connection.execute('SELECT id FROM files WHERE filename = ?', (name,)).fetchone()
+            if row:
+                file_id = row[0]
+                connection.execute('DELETE FROM secrets WHERE file_id = ?', (file_id,))
+                if not secrets:
+                    connection.execute('DELETE FROM files WHERE id = ?', (file_id,))
+                    continue
+
+            elif not secrets:
+                continue
+
+            else:
+                file_id = connection.execute(
+                    'INSERT INTO files (filename) VALUES (?)',
+                    (name,),
+                ).lastrowid
+
+            _insert_secrets(connection, file_id, name, types, secrets)
+
+
+def _save_results(
+    connection: sqlite3.Connection,
+    results: Iterable[Tuple[str, List[Dict[str, Any]]]],
+) -> None:
+    types: Dict[str, int] = {}
+    for file_id, (filename, secrets) in enumerate(results, start=1):
+        connection.execute('INSERT INTO files (id, filename) VALUES (?, ?)', (file_id, filename))
+        _insert_secrets(connection, file_id, filename, types, secrets)
+
+
+def _insert_secrets(
+    connection: sqlite3.Connection,
+    file_id: int,
+    filename: str,
+    types: Dict[str, int],
+    secrets: List[Dict[str, Any]],
+) -> None:
+    connection.executemany(
+        'INSERT INTO secrets '
+        '(file_id, type_id, hashed_secret, is_verified, line_number, extra) '
+        'VALUES (?, ?, ?, ?, ?, ?)',
+        [
+            (file_id, *_pack(connection, filename, types, secret))
+            for secret in secrets
+        ],
+    )
+
+
+def _pack(
+    connection: sqlite3.Connection,
+    filename: str,
+    types: Dict[str, int],
+    secret: Dict[str, Any],
+) -> Tuple[Any, ...]:
+    secret_type = secret.get('type')
+    type_id = None
+    if secret_type is not None:
+        try:
+            type_id = types[secret_type]
+        except KeyError:
+            type_id = types[secret_type] = max(types.values(), default=0) + 1
+            connection.execute(
+                'INSERT INTO types (id, type) VALUES (?, ?)',
+                (type_id, secret_type),
+            )
+
+    # Since secrets are stored under their filename, we only need to store it if it differs.
+    extra = {
+        key: value
+        for key, value in secret.items()
+        if key not in _COLUMNS and not (key == 'filename' and value == filename)
+    }
+
+    return (
+        type_id,
+        secret.get('hashed_secret'),
+        secret.get('is_verified'),
+        secret.get('line_number'),
+        json.dumps(extra) if extra else None,
+    )
+
+
+def _unpack(filename: str, types: Dict[int, str], row: Tuple[Any, ...]) -> Dict[str, Any]:
+    type_id, hashed_secret, is_verified, line_number, extra = row
+
+    # This follows the same order as `PotentialSecret.json`.
+    output: Dict[str, Any] = {}
+    if type_id is not None:
+        output['type'] = types[type_id]
+
+    output['filename'] = filename
+    if hashed_secret is not None:
+        output['hashed_secret'] = hashed_secret
+    if is_verified is not None:
+        output['is_verified'] = bool(is_verified)
+    if line_number is not None:
+        output['line_number'] = line_number
+    if extra is not None:
+        output.update(json.loads(extra))
+
+    return output
+
+
+def _get_files(
+    connection: sqlite3.Connection,
+    filenames: Optional[Iterable[str]],
+) -> List[Tuple[int, str]]:
+    if filenames is None:
+        return list(connection.execute('SELECT id, filename FROM files ORDER BY id'))
+
+    files: List[Tuple[int, str]] = []
+    for filename in set(filenames):
+        files.extend(
+            connection.execute('SELECT id, filename FROM files WHERE filename = ?', (filename,)),
+        )
+
+    # This keeps results in the same order as they were saved in.
+    return sorted(files)
@@ -0,0 +1,107 @@
+"""
+Filters are invoked through dependency injection: each filter declares the variables it needs,
+and is only run when those are available. Resolving this for every candidate (i.e. working out
+which filters apply, and which arguments to pass them) can cost as much as running the filters
+themselves.
+
+The filter pipeline resolves this once per combination of stage and available variables, and
+caches the result, so that running the filters is merely a matter of calling them.
+"""
+import inspect
+from typing import Any
+from typing import Dict
+from typing import FrozenSet
+from typing import List
+from typing import Tuple
+
+from ..custom_types import SelfAwareCallable
+from .log import log
+
+
+# (filter, names of variables to inject into it)
+BoundFilter = Tuple[SelfAwareCallable, Tuple[str, ...]]
+
+
+class FilterPipeline:
+    def __init__(self, filters: List[SelfAwareCallable]) -> None:
+        self.filters = filters
+
+        self._required_variables: Dict[SelfAwareCallable, FrozenSet[str]] = {
+            filter_fn: _get_required_variables(filter_fn)
+            for filter_fn in filters
+        }
+        self._stages: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], Tuple[BoundFilter, ...]] = {}
+
+    def is_filtered_out(self, stage: Tuple[str, ...], **kwargs: Any) -> bool:
+        """
+        :param stage: only filters that accept all of these variables will be run.
+        """
+        key = (stage, tuple(kwargs))
+        try:
+            bound_filters = self._stages[key]
+        except KeyError:
+            bound_filters = self._stages[key] = self._compile(stage, kwargs.keys())
+
+        for filter_fn, variables in bound_filters:
+            try:
+                if filter_fn(**{name: kwargs[name] for name in variables}):
+                    log.info(_get_debug_message(filter_fn, kwargs))
+                    return True
+            except TypeError:
+                # Skipping non-compatible filters
+                pass
+
+        return False
+
+    def _compile(self, stage: Tuple[str, ...], available: Any) -> Tuple[BoundFilter, ...]:
+        minimum_variables = set(stage)
+        available_variables = set(available)
+
+        return tuple(
+            (
+                filter_fn,
+                tuple(
+                    name
+                    for name in filter_fn.injectable_variables
+                    if name in available_variables
+                ),
+            )
+            for filter_fn in self.filters
+            if (
+                minimum_variables <= filter_fn.injectable_variables
+
+                # Otherwise, calling the filter would raise a TypeError, and be skipped.
+                and self._required_variables[filter_fn] <= available_variables
+            )
+        )
+
+
+def _get_required_variables(filter_fn: SelfAwareCallable) -> FrozenSet[str]:
+    try:
+        parameters = inspect.signature(filter_fn).parameters.values()
+    except (TypeError, ValueError):     # pragma: no cover
+        return frozenset()
+
+    return frozenset(
+        parameter.name
+        for parameter in parameters
+        if (
+            parameter.default is inspect.Parameter.empty
+            and parameter.kind not in {
+                inspect.Parameter.VAR_POSITIONAL,
+                inspect.Parameter.VAR_KEYWORD,
+            }
+        )
+    )
+
+
+def _get_debug_message(filter_fn: SelfAwareCallable, kwargs: Dict[str, Any]) -> str:
+    if 'secret' in kwargs:
+        return f'Skipping "{kwargs["secret"]}" due to `{filter_fn.path}`.'
+
+    if list(kwargs.keys()) == ['filename']:
+        # We want to make sure this is only run if we're skipping files (as compared
+        # to other filters that may include `filename` as a parameter).
+        return f'Skipping "{kwargs["filename"]}" due to `{filter_fn.path}`'
+
+    return f'Skipping secret due to `{filter_fn.path}`.'
@@ -0,0 +1,112 @@
+"""
+Scanning every line with every plugin is expensive, since each `RegexBasedDetector` runs its
+own set of regexes over the line. However, most lines in a codebase contain no secrets at all,
+and most detectors look for secrets with distinctive literal markers (e.g. `AKIA` for AWS keys,
+or `xox` for Slack tokens).
+
+The scan plan leverages this by compiling the `anchors` of all configured plugins into a single
+prefilter, so that a line is only dispatched to the plugins that could possibly find something
+in it. It also resolves the arguments that each plugin accepts once, so that dispatching a line
+to a plugin doesn't need to go through dependency injection every time.
+"""
+from __future__ import annotations
+
+import inspect
+import re
+from typing import Any
+from typing import Callable
+from typing import cast
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Pattern
+from typing import Set
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+from ..util.inject import call_function_with_arguments
+from ..util.inject import get_injectable_variables
+
+if TYPE_CHECKING:
+    from detect_secrets.core.potential_secret import PotentialSecret
+    from detect_secrets.plugins.base import BasePlugin
+
+
+class ScanPlan:
+    def __init__(self, plugins: List[BasePlugin]) -> None:
+        self.plugins = plugins
+
+        # NOTE: This is keyed by `id`, since plugins aren't hashable. This is safe, since we
+        # hold a reference to every plugin (so their ids can't be reused).
+        self._analyzers: Dict[int, Tuple[Callable[..., Set[PotentialSecret]], Tuple[str, ...]]] = {
+            id(plugin): (plugin.analyze_line, _get_analyze_line_variables(plugin))
+            for plugin in plugins
+        }
+
+        # Plugins without anchors need to see every line.
+        self.unanchored_plugins = [plugin for plugin in plugins if not plugin.anchors]
+
+        self._anchors_by_plugin: List[Tuple[BasePlugin, Tuple[str, ...]]] = [
+            (plugin, tuple(anchor.lower() for anchor in plugin.anchors))
+            for plugin in plugins
+        ]
+
+        self.prefilter: Optional[Pattern] = None
+        anchors = {
+            anchor
+            for _, plugin_anchors in self._anchors_by_plugin
+            for anchor in plugin_anchors
+        }
+        if anchors:
+            # NOTE: Longer anchors come first, so that the regex engine doesn't settle on a
+            # shorter prefix. This doesn't impact correctness (we only care whether *any*
+            # anchor matches), but keeps the alternation deterministic.
+            self.prefilter = re.compile(
+                '|'.join(
+                    re.escape(anchor)
+                    for anchor in sorted(anchors, key=lambda x: (-len(x), x))
+                ),
+            )
+
+    def get_plugins_for_line(self, line: str) -> List[BasePlugin]:
+        """
+        :returns: the plugins that should analyze this line, in the order they were configured.
+        """
+        if not self.prefilter:
+            return self.plugins
+
+        # Anchors are compared case-insensitively, since many detectors use case-insensitive
+        # regexes. This only makes the prefilter more permissive.
+        lowered = line.lower()
+        if not self.prefilter.search(lowered):
+            return self.unanchored_plugins
+
+        return [
+            plugin
+            for plugin, anchors in self._anchors_by_plugin
+            if not anchors or any(anchor in lowered for anchor in anchors)
+        ]
+
+    def analyze_line(self, plugin: BasePlugin, **kwargs: Any) -> Set[PotentialSecret]:
+        """
+        This is equivalent to `call_function_with_arguments(plugin.analyze_line, **kwargs)`.
+        """
+        try:
+            analyze_line, variables = self._analyzers[id(plugin)]
+        except KeyError:
+            # This plugin isn't part of the plan, so we can't take any shortcuts.
+            return cast(
+                Set['PotentialSecret'],
+                call_function_with_arguments(plugin.analyze_line, **kwargs),
+            )
+
+        return analyze_line(**{name: kwargs[name] for name in variables if name in kwargs})
+
+
+def _get_analyze_line_variables(plugin: BasePlugin) -> Tuple[str, ...]:
+    variables = get_injectable_variables(plugin.analyze_line)
+    if inspect.ismethod(plugin.analyze_line):
+        # The instance is already bound to the method, so we skip `self`.
+        variables = variables[1:]
+
+    return variables
@@ -0,0 +1,256 @@
+"""
+Spinning up worker processes (and configuring them with the current settings) is relatively
+expensive, as is sending every file to a worker (and every result back) individually. For
+repositories made up of many small files, this overhead can dominate the time spent scanning.
+
+As such, this pool keeps its workers around between scans, and dispatches files in batches.
+"""
+import multiprocessing as mp
+import os
+from functools import partial
+from types import TracebackType
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
+
+from ..settings import configure_settings_from_baseline
+from ..settings import get_settings
+from .cache import ResultCache
+from .potential_secret import PotentialSecret
+from .scan import scan_commit
+from .verification import get_verification_cache
+
+
+# This is the compact representation of a PotentialSecret that is sent between processes,
+# since the filename is shared by all secrets in a file (and needs not be repeated).
+SerializedSecret = Tuple[
+    str,                # type
+    Optional[str],      # secret_value
+    str,                # secret_hash
+    int,                # line_number
+    Optional[bool],     # is_secret
+    bool,               # is_verified
+    Optional[bool],     # is_added
+    Optional[bool],     # is_removed
+    Optional[bool],     # is_multiline
+    Optional[str],      # check_id
+    Optional[str],      # commit_hash
+]
+
+
+class ScanPool:
+    """
+    Usage:
+        >>> with ScanPool() as pool:
+        ...     for repository in repositories:
+        ...         secrets = SecretsCollection(root=repository)
+        ...         secrets.scan_files(*filenames, pool=pool)
+    """
+
+    # Files are grouped into chunks of approximately this many bytes, so that small files
+    # don't each cost a round-trip to a worker.
+    MAX_CHUNK_SIZE = 1024 * 1024
+
+    # To balance the load between workers, we aim for at least this many chunks per worker.
+    MIN_CHUNKS_PER_PROCESS = 4
+
+    # Commits are dispatched in batches of up to this many commits.
+    MAX_COMMITS_PER_CHUNK = 16
+
+    def __init__(self, num_processors: Optional[int] = None) -> None:
+        self.num_processors = num_processors or mp.cpu_count()
+
+        self._pool: Optional[Any] = None
+        self._settings: Optional[Dict[str, Any]] = None
+
+    def scan(
+        self,
+        *filenames: str,
+        cache: Optional[ResultCache] = None,
+    ) -> Iterator[Tuple[str, List[PotentialSecret]]]:
+        """
+        :returns: (filename, secrets) for every file scanned, in no particular order.
+        """
+        pool = self._get_pool()
+        for results in pool.imap_unordered(
+            partial(_scan_chunk, cache=cache),
+            self._get_chunks(filenames),
+        ):
+            for filename, secrets in results:
+                yield filename, [_deserialize_secret(filename, item) for item in secrets]
+
+    def scan_commits(
+        self,
+        *commits: str,
+        root: str = '',
+    ) -> Iterator[Tuple[str, List[PotentialSecret]]]:
+        """
+        :returns: (commit, secrets) for every commit scanned, in the order provided.
+        """
+        pool = self._get_pool()
+        chunk_size = max(
+            min(
+                len(commits) // (self.num_processors * self.MIN_CHUNKS_PER_PROCESS),
+                self.MAX_COMMITS_PER_CHUNK,
+            ),
+            1,
+        )
+
+        for commit, secrets in zip(
+            commits,
+            pool.imap(partial(_scan_commit, root=root), commits, chunksize=chunk_size),
+        ):
+            yield commit, [_deserialize_secret(filename, item) for filename, item in secrets]
+
+    def close(self) -> None:
+        if self._pool:
+            self._pool.terminate()
+            self._pool.join()
+
+        self._pool = None
+        self._settings = None
+
+    def _get_pool(self) -> Any:
+        # Workers are configured with the settings at the time they are started. Therefore,
+        # if settings have changed since then (e.g. a different baseline was loaded), we need
+        # to start afresh.
+        settings = {
+            **get_settings().json(),
+
+            # Verification results are shared through this, so it needs to be configured
+            # in the same way too.
+            'verification_cache': get_verification_cache().json(),
+        }
+        if self._pool and settings != self._settings:
+            self.close()
+
+        if not self._pool:
+            self._pool = mp.Pool(
+                processes=self.num_processors,
+                initializer=_initialize_worker,
+                initargs=(settings,),
+            )
+            self._settings = settings
+
+        return self._pool
+
+    def _get_chunks(self, filenames: Tuple[str, ...]) -> List[List[str]]:
+        sizes = {filename: _get_file_size(filename) for filename in filenames}
+
+        chunk_size = max(
+            min(
+                sum(sizes.values()) // (self.num_processors * self.MIN_CHUNKS_PER_PROCESS),
+                self.MAX_CHUNK_SIZE,
+            ),
+            1,
+        )
+
+        # Larger files are dispatched first, so that workers don't end up waiting on a
+        # straggler at the end of the scan.
+        chunks: List[List[str]] = []
+        current_chunk: List[str] = []
+        current_size = 0
+        for filename in sorted(filenames, key=lambda x: sizes[x], reverse=True):
+            current_chunk.append(filename)
+            current_size += sizes[filename]
+
+            if current_size >= chunk_size:
+                chunks.append(current_chunk)
+                current_chunk = []
+                current_size = 0
+
+        if current_chunk:
+            chunks.append(current_chunk)
+
+        return chunks
+
+    def __enter__(self) -> 'ScanPool':
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+def _initialize_worker(settings: Dict[str, Any]) -> None:
+    configure_settings_from_baseline(settings)
+    get_verification_cache().configure(**settings['verification_cache'])
+
+
+def _scan_chunk(
+    filenames: List[str],
+    cache: Optional[ResultCache] = None,
+) -> List[Tuple[str, List[SerializedSecret]]]:
+    # We need to import this here, otherwise it will result in a circular dependency.
+    from .secrets_collection import _scan_file_and_serialize
+
+    output = []
+    for filename in filenames:
+        secrets = _scan_file_and_serialize(filename, cache=cache)
+        if secrets:
+            output.append((filename, [_serialize_secret(secret) for secret in secrets]))
+
+    return output
+
+
+def _scan_commit(commit: str, root: str = '') -> List[Tuple[str, SerializedSecret]]:
+    return [
+        (secret.filename, _serialize_secret(secret))
+        for secret in scan_commit(commit, root=root)
+    ]
+
+
+def _serialize_secret(secret: PotentialSecret) -> SerializedSecret:
+    return (
+        secret.type,
+        secret.secret_value,
+        secret.secret_hash,
+        secret.line_number,
+        secret.is_secret,
+        secret.is_verified,
+        secret.is_added,
+        secret.is_removed,
+        secret.is_multiline,
+        secret.check_id,
+        secret.commit_hash,
+    )
+
+
+def _deserialize_secret(filename: str, data: SerializedSecret) -> PotentialSecret:
+    (
+        type, secret_value, secret_hash, line_number, is_secret, is_verified,
+        is_added, is_removed, is_multiline, check_id, commit_hash,
+    ) = data
+
+    secret = PotentialSecret(
+        type=type,
+        filename=filename,
+        secret=secret_value or '',
+        line_number=line_number,
+        is_secret=is_secret,
+        is_verified=is_verified,
+        is_added=is_added,
+        is_removed=is_removed,
+        is_multiline=is_multiline,
+        check_id=check_id,
+        commit_hash=commit_hash,
+    )
+    secret.secret_value = secret_value
+    secret.secret_hash = secret_hash
+
+    return secret
+
+
+def _get_file_size(filename: str) -> int:
+    try:
+        return os.path.getsize(filename)
+    except OSError:
+        return 0
@@ -1,7 +1,10 @@
 import hashlib
+import sys
 from typing import Any
+from typing import ClassVar
 from typing import Dict
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 from ..util.color import AnsiColor
@@ -21,6 +24,33 @@ class PotentialSecret:
     without actually knowing what the secret is.
     """
 
+    # Scanning a large repository (or its history) can result in millions of these, so we
+    # avoid the overhead of a per-instance `__dict__`.
+    __slots__ = (
+        '_hash',
+        'check_id',
+        'commit_hash',
+        'filename',
+        'is_added',
+        'is_multiline',
+        'is_removed',
+        'is_secret',
+        'is_verified',
+        'line_number',
+        'secret_hash',
+        'secret_value',
+        'type',
+    )
+
+    # If two PotentialSecrets have the same values for these fields,
+    # they are considered equal. Note that line numbers aren't included
+    # in this, because line numbers are subject to change.
+    fields_to_compare: ClassVar[Tuple[str, ...]] = ('filename', 'secret_hash', 'type')
+
+    # Since these objects are mostly used in sets, we only compute this once. As with any other
+    # object in a set, the fields it's derived from should not change after it's been added.
+    _hash: Optional[int]
+
     def __init__(
             self,
             type: str,
@@ -33,6 +63,7 @@ class PotentialSecret:
             is_removed: Optional[bool] = None,
             is_multiline: Optional[bool] = None,
             check_id: Optional[str] = None,
+            commit_hash: Optional[str] = None,
     ) -> None:
         """
         :param type: human-readable secret type, defined by the plugin
@@ -43,9 +74,14 @@ class PotentialSecret:
             Merely used as a reference for easy triage.
         :param is_secret: whether the secret is a true- or false- positive
         :param is_verified: whether the secret has been externally verified
+        :param commit_hash: when scanning git history, the first commit that the secret
+            was found in
         """
-        self.type = type
-        self.filename = filename
+        # These are repeated across many secrets, so interning them means that they're
+        # only stored once.
+        self.type = sys.intern(type)
+        self.filename = sys.intern(filename)
+
         self.line_number = line_number
         self.set_secret(secret)
         self.is_secret = is_secret
@@ -54,11 +90,9 @@ class PotentialSecret:
         self.is_removed = is_removed
         self.is_multiline = is_multiline
         self.check_id = check_id
+        self.commit_hash = commit_hash
 
-        # If two PotentialSecrets have the same values for these fields,
-        # they are considered equal. Note that line numbers aren't included
-        # in this, because line numbers are subject to change.
-        self.fields_to_compare = ['filename', 'secret_hash', 'type']
+        self._hash = None
 
     def set_secret(self, secret: str) -> None:
         self.secret_hash: str = self.hash_secret(secret)
@@ -96,6 +130,7 @@ class PotentialSecret:
             'is_removed',
             'is_multiline',
             'check_id',
+            'commit_hash',
         }:
             if parameter in data:
                 kwargs[parameter] = data[parameter]
@@ -115,45 +150,60 @@ class PotentialSecret:
             'is_verified': self.is_verified,
         }
 
-        if hasattr(self, 'line_number') and self.line_number:
+        if self.line_number:
             attributes['line_number'] = self.line_number
 
-        if hasattr(self, 'is_secret') and self.is_secret is not None:
+        if self.is_secret is not None:
             attributes['is_secret'] = self.is_secret
 
-        if hasattr(self, 'is_added') and self.is_added is not None:
+        if self.is_added is not None:
             attributes['is_added'] = self.is_added
 
-        if hasattr(self, 'is_removed') and self.is_removed is not None:
+        if self.is_removed is not None:
             attributes['is_removed'] = self.is_removed
 
-        if hasattr(self, 'is_multiline') and self.is_multiline is not None:
+        if self.is_multiline is not None:
             attributes['is_multiline'] = self.is_multiline
 
-        if hasattr(self, 'check_id') and self.check_id is not None:
+        if self.check_id is not None:
             attributes['check_id'] = self.check_id
 
+        if self.commit_hash is not None:
+            attributes['commit_hash'] = self.commit_hash
+
         return attributes
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # String hashes are randomized per process, so the cached hash can't be carried over.
+        return {
+            name: getattr(self, name)
+            for name in self.__slots__
+            if name != '_hash' and hasattr(self, name)
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._hash = None
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, PotentialSecret):
             return NotImplemented
 
-        return all(
-            getattr(self, field) == getattr(other, field)
-            for field in self.fields_to_compare
+        return (
+            self.filename == other.filename
+            and self.secret_hash == other.secret_hash
+            and self.type == other.type
         )
 
     def __ne__(self, other: Any) -> bool:
         return not self.__eq__(other)
 
     def __hash__(self) -> int:
-        return hash(
-            tuple(
-                getattr(self, x)
-                for x in self.fields_to_compare
-            ),
-        )
+        if self._hash is None:
+            self._hash = hash((self.filename, self.secret_hash, self.type))
+
+        return self._hash
 
     def __str__(self) -> str:
         return (
@@ -1,33 +1,45 @@
 from __future__ import annotations
 
+import io
+import itertools
 import os
 import subprocess
-from functools import lru_cache
 from typing import Any
 from typing import cast
 from typing import Generator
 from typing import Iterable
 from typing import List
+from typing import NamedTuple
 from typing import Optional
 from typing import Set
 from typing import Tuple
 from typing import TYPE_CHECKING
 from typing import Union
 
-from ..custom_types import NamedIO
+import requests
+
+from ..constants import VerifiedResult
 from ..custom_types import SelfAwareCallable
 from ..filters.allowlist import is_line_allowlisted
+from ..settings import disabled_filters
+from ..settings import get_filter_pipeline
 from ..settings import get_filters
 from ..settings import get_plugins
+from ..settings import get_scan_plan
 from ..settings import get_settings
 from ..transformers import get_transformed_file
 from ..util import git
 from ..util.code_snippet import CodeSnippet
 from ..util.code_snippet import get_code_snippet
-from ..util.inject import call_function_with_arguments
+from ..util.diff import split_diff_by_file
+from ..util.file_content import FileContent
 from ..util.path import get_relative_path
 from .log import log
 from .potential_secret import PotentialSecret
+from .verification import BATCH_SIZE
+from .verification import defer_verification
+from .verification import verify_secret
+from .verification import verify_secrets
 from detect_secrets.util.filetype import determine_file_type
 from detect_secrets.util.filetype import FileType
 
@@ -38,16 +50,6 @@ MIN_LINE_LENGTH = int(os.getenv('CHECKOV_MIN_LINE_LENGTH', '5'))
 MAX_LINE_LENGTH = int(os.getenv('CHECKOV_MAX_LINE_LENGTH', '100000'))
 
 
-@lru_cache(maxsize=1)
-def read_raw_lines(file_name: str) -> List[str]:
-    try:
-        with open(file_name) as f:
-            return f.readlines()
-    except OSError:
-        log.debug(f"Can't open file {file_name}")
-        return []
-
-
 def get_files_to_scan(
     *paths: str,
     should_scan_all_files: bool = False,
@@ -128,6 +130,44 @@ def get_files_to_scan(
                     yield relative_path
 
 
+def get_changed_files(
+    *paths: str,
+    since: str,
+    should_scan_all_files: bool = False,
+    root: str = '',
+) -> Set[str]:
+    """
+    Just like `get_files_to_scan`, but only lists the files (within the specified paths) that
+    have changed since the `since` git revision. Unlike `get_files_to_scan`, this also includes
+    files that have been deleted, so that the caller is able to drop them.
+
+    :raises: CalledProcessError
+    """
+    base = os.path.realpath(root or os.getcwd())
+    prefixes = set()
+    for path in paths:
+        prefix = os.path.relpath(os.path.realpath(path), base)
+        if prefix == os.curdir:
+            prefix = ''
+
+        prefixes.add(prefix)
+
+    return {
+        filename
+        for filename in git.get_changed_files(
+            since,
+            path=base,
+            include_untracked=should_scan_all_files,
+        )
+        if any(
+            not prefix
+            or filename == prefix
+            or filename.startswith(prefix + os.sep)
+            for prefix in prefixes
+        )
+    }
+
+
 def scan_line(line: str) -> Generator[PotentialSecret, None, None]:
     """Used for adhoc string scanning."""
     # Disable this, since it doesn't make sense to run this for adhoc usage.
@@ -169,7 +209,7 @@ def scan_file(filename: str) -> Generator[PotentialSecret, None, None]:
 
     try:
         has_secret = False
-        for lines in _get_lines_from_file(filename):
+        for lines, file_content in _get_lines_from_file(filename):
             lines_list = [
                 (number, value, False, False)
                 for number, value in enumerate(lines, start=1)
@@ -177,6 +217,7 @@ def scan_file(filename: str) -> Generator[PotentialSecret, None, None]:
             for secret in _process_line_based_plugins(
                     lines=lines_list,
                     filename=filename,
+                    file_content=file_content,
             ):
                 has_secret = True
                 yield secret
@@ -188,8 +229,13 @@ def scan_file(filename: str) -> Generator[PotentialSecret, None, None]:
         return
 
 
-def scan_diff(diff: str, commit_hash: Optional[str] = '') -> Generator[PotentialSecret, None, None]:
+def scan_diff(
+    diff: Union[str, Iterable[str]],
+    commit_hash: Optional[str] = '',
+) -> Generator[PotentialSecret, None, None]:
     """
+    :param diff: either the diff itself, or its lines (e.g. a file object, or a pipe). The latter
+        allows large diffs to be scanned without reading them into memory all at once.
     :raises: ImportError
     """
     if not get_plugins():   # pragma: no cover
@@ -200,6 +246,35 @@ def scan_diff(diff: str, commit_hash: Optional[str] = '') -> Generator[Potential
         yield from _process_line_based_plugins(lines, filename=filename, commit_hash=commit_hash)
 
 
+def scan_commit(commit: str, root: str = '') -> Generator[PotentialSecret, None, None]:
+    """
+    Scans the changes introduced by a git commit. Only secrets on added lines are reported,
+    since secrets on removed lines would have been introduced by an earlier commit.
+
+    :param root: the (git) directory to scan. Filenames will be relative to it.
+    :raises: CalledProcessError
+    :raises: ImportError
+    """
+    # Files may have been moved or deleted since this commit, but their secrets are still
+    # in the repository's history.
+    #
+    # NOTE: We scan the entire commit before yielding any secrets, so that the settings are
+    # only changed for the duration of the scan (rather than whenever the caller resumes).
+    with disabled_filters('detect_secrets.filters.common.is_invalid_file'):
+        secrets = list(scan_diff(git.get_commit_diff(commit, path=root), commit_hash=commit))
+
+    for secret in secrets:
+        if not secret.is_added:
+            continue
+
+        # These describe the diff, rather than the secret.
+        secret.is_added = None
+        secret.is_removed = None
+
+        secret.commit_hash = commit
+        yield secret
+
+
 def scan_for_allowlisted_secrets_in_file(filename: str) -> Generator[PotentialSecret, None, None]:
     """
     Developers are able to add individual lines to the allowlist using
@@ -222,7 +297,7 @@ def scan_for_allowlisted_secrets_in_file(filename: str) -> Generator[PotentialSe
     # NOTE: Unlike `scan_file`, we don't ever have to use eager file transformers, since we already
     # know which lines we want to scan.
     try:
-        for lines in _get_lines_from_file(filename):
+        for lines, _ in _get_lines_from_file(filename):
             lines_list = [
                 (number, value, False, False)
                 for number, value in enumerate(lines, start=1)
@@ -234,7 +309,9 @@ def scan_for_allowlisted_secrets_in_file(filename: str) -> Generator[PotentialSe
         return
 
 
-def scan_for_allowlisted_secrets_in_diff(diff: str) -> Generator[PotentialSecret, None, None]:
+def scan_for_allowlisted_secrets_in_diff(
+    diff: Union[str, Iterable[str]],
+) -> Generator[PotentialSecret, None, None]:
     if not get_plugins():   # pragma: no cover
         log.error('No plugins to scan with!')
         return
@@ -252,6 +329,7 @@ def _scan_for_allowlisted_secrets_in_lines(
     get_settings().disable_filters('detect_secrets.filters.allowlist.is_line_allowlisted')
     get_filters.cache_clear()
 
+    scan_plan = get_scan_plan()
     line_numbers, lines, is_added, is_removed = zip(*lines)
     line_content = [line.rstrip() for line in lines]
     for line_number, line in zip(line_numbers, line_content):
@@ -266,7 +344,7 @@ def _scan_for_allowlisted_secrets_in_lines(
         if _is_filtered_out(required_filter_parameters=['line'], filename=filename, line=line):
             continue
 
-        for plugin in get_plugins():
+        for plugin in scan_plan.get_plugins_for_line(line):
             yield from _scan_line(
                 plugin=plugin,
                 filename=filename,
@@ -276,72 +354,177 @@ def _scan_for_allowlisted_secrets_in_lines(
             )
 
 
-def _get_lines_from_file(filename: str) -> Generator[List[str], None, None]:
+def _get_lines_from_file(filename: str) -> Generator[Tuple[List[str], FileContent], None, None]:
     """
     This attempts to get lines in a given file. If no more lines are needed, the caller
     is responsible for breaking out of this loop.
 
+    The file is only read once: its content is yielded alongside the lines, so that it
+    can be shared with the rest of the scan.
+
     :raises: IOError
     :raises: FileNotFoundError
     """
-    with open(filename) as f:
-        log.info(f'Checking file: {filename}')
-
-        try:
-            lines = get_transformed_file(cast(NamedIO, f))
-            if not lines:
-                lines = f.readlines()
-        except UnicodeDecodeError:
-            # We flat out ignore binary files
-            return
+    try:
+        file_content = FileContent(filename)
+    except UnicodeDecodeError:
+        # We flat out ignore binary files
+        return
 
-        yield lines
+    log.info(f'Checking file: {filename}')
 
-        # If the above lines don't prove to be useful to the caller, try using eager transformers.
-        f.seek(0)
-        lines = get_transformed_file(cast(NamedIO, f), use_eager_transformers=True)
-        if not lines:
-            return
+    lines = get_transformed_file(file_content.open())
+    if not lines:
+        lines = file_content.lines
+
+    yield lines, file_content
+
+    # If the above lines don't prove to be useful to the caller, try using eager transformers.
+    lines = get_transformed_file(file_content.open(), use_eager_transformers=True)
+    if not lines:
+        return
 
-        yield lines
+    yield lines, file_content
 
 
-def _get_lines_from_diff(diff: str) -> \
+def _get_lines_from_diff(diff: Union[str, Iterable[str]]) -> \
         Generator[Tuple[str, List[Tuple[int, str, bool, bool]]], None, None]:
     """
+    Files are parsed (and yielded) one at a time, so that only a single file's patch is held
+    in memory at any given time.
+
     :raises: ImportError
     """
     # Local imports, so that we don't need to require unidiff for versions of
     # detect-secrets that don't use it.
     from unidiff import PatchSet  # type:ignore[import-untyped]
 
-    patch_set = PatchSet.from_string(diff)
-    for patch_file in patch_set:
-        filename = patch_file.path
-        if _is_filtered_out(required_filter_parameters=['filename'], filename=filename):
-            continue
+    if isinstance(diff, str):
+        diff = io.StringIO(diff)
+
+    for patch in split_diff_by_file(diff):
+        for patch_file in PatchSet(patch):
+            filename = patch_file.path
+            if _is_filtered_out(required_filter_parameters=['filename'], filename=filename):
+                continue
+
+            yield (
+                filename,
+                [
+                    (
+                        line.target_line_no if line.target_line_no
+                        else line.source_line_no, line.value, line.is_added, line.is_removed,
+                    )
+                    for chunk in patch_file
+                    # target_lines refers to incoming (new) changes
+                    for line in list(chunk)
+                    if line.is_added or line.is_removed
+                ],
+            )
 
-        yield (
-            filename,
-            [
-                (
-                    line.target_line_no if line.target_line_no
-                    else line.source_line_no, line.value, line.is_added, line.is_removed,
-                )
-                for chunk in patch_file
-                # target_lines refers to incoming (new) changes
-                for line in list(chunk)
-                if line.is_added or line.is_removed
-            ],
-        )
+
+class _LineScan(NamedTuple):
+    plugin: BasePlugin
+    line: str
+    line_number: int
+    is_added: bool
+    is_removed: bool
+    context: CodeSnippet
+    raw_context: CodeSnippet
+    raw_context_lines: List[str]
 
 
 def _process_line_based_plugins(
     lines: List[Tuple[int, str, bool, bool]],
     filename: str,
     commit_hash: Optional[str] = '',
+    file_content: Optional[FileContent] = None,
 ) -> Generator[PotentialSecret, None, None]:
+    """
+    :param file_content: if scanning a file (rather than a diff), this is its original content.
+    """
+    candidates: Iterable[Tuple[_LineScan, PotentialSecret]] = (
+        (line_scan, secret)
+        for line_scan in _get_line_scans(lines, filename, file_content)
+        for secret in _scan_line(
+            plugin=line_scan.plugin,
+            filename=filename,
+            line=line_scan.line,
+            line_number=line_scan.line_number,
+            context=line_scan.context,
+            raw_context=line_scan.raw_context,
+            commit_hash=commit_hash,
+            file_content=file_content,
+        )
+    )
+
+    should_verify = (
+        'detect_secrets.filters.common.is_ignored_due_to_verification_policies'
+        in get_settings().filters
+    )
+    if should_verify:
+        candidates = _verify_in_batches(candidates)
+
+    for line_scan, secret in candidates:
+        if should_verify:
+            secret.is_verified = _is_verified(secret, line_scan)
+
+        secret.is_removed = line_scan.is_removed
+        secret.is_added = line_scan.is_added
+        if not _is_filtered_out(
+                required_filter_parameters=['context'],
+                filename=secret.filename,
+                secret=secret.secret_value,
+                plugin=line_scan.plugin,
+                line=line_scan.line,
+                context=line_scan.context,
+        ):
+            if determine_file_type(filename) == FileType.YAML and secret.secret_value:
+                # YAML specifically has multi-line string parsing that groups the
+                # different lines as 1.
+                # Calculate actual line number in case of YAML multi-line string
+                actual_line_number = line_scan.line_number
+                for i, cline in enumerate(line_scan.raw_context_lines[actual_line_number - 1:]):
+                    if secret.secret_value in cline:
+                        actual_line_number += i
+                        break
+                secret.line_number = actual_line_number
+            yield secret
+
+
+def _verify_in_batches(
+    candidates: Iterable[Tuple[_LineScan, PotentialSecret]],
+) -> Generator[Tuple[_LineScan, PotentialSecret], None, None]:
+    """
+    Verifying secrets as they are found would stall the scan on every network round-trip.
+    Instead, we find secrets in batches (deferring their verification), and then verify each
+    batch concurrently before yielding it.
+
+    NOTE: Plugins can be stateful (e.g. `PrivateKeyDetector` only scans each file once), so we
+    keep the secrets found, rather than scanning their lines again.
+    """
+    candidates = iter(candidates)
+    while True:
+        with defer_verification() as pending:
+            batch = list(itertools.islice(candidates, BATCH_SIZE))
+
+        if not batch:
+            return
+
+        verify_secrets(pending)
+        yield from batch
+
+
+def _get_line_scans(
+    lines: List[Tuple[int, str, bool, bool]],
+    filename: str,
+    file_content: FileContent | None = None,
+) -> Generator[_LineScan, None, None]:
+    """
+    :returns: every (line, plugin) pair that should be scanned.
+    """
     line_content = [line[1] for line in lines]
+    scan_plan = get_scan_plan()
 
     # NOTE: We iterate through lines *then* plugins, because we want to quit early if any of the
     # filters return True.
@@ -355,7 +538,7 @@ def _process_line_based_plugins(
 
         if not is_added and not is_removed:
             code_snippet_line_number = line_number
-            raw_code_snippet_lines = read_raw_lines(filename)
+            raw_code_snippet_lines = file_content.lines if file_content else []
         else:
             code_snippet_line_number = index
             raw_code_snippet_lines = line_content
@@ -378,37 +561,17 @@ def _process_line_based_plugins(
         ):
             continue
 
-        for plugin in get_plugins():
-            for secret in _scan_line(
-                    plugin=plugin,
-                    filename=filename,
-                    line=line,
-                    line_number=line_number,
-                    context=code_snippet,
-                    raw_context=raw_code_snippet,
-                    commit_hash=commit_hash,
-            ):
-                secret.is_removed = is_removed
-                secret.is_added = is_added
-                if not _is_filtered_out(
-                        required_filter_parameters=['context'],
-                        filename=secret.filename,
-                        secret=secret.secret_value,
-                        plugin=plugin,
-                        line=line,
-                        context=code_snippet,
-                ):
-                    if determine_file_type(filename) == FileType.YAML and secret.secret_value:
-                        # YAML specifically has multi-line string parsing that groups the
-                        # different lines as 1.
-                        # Calculate actual line number in case of YAML multi-line string
-                        actual_line_number = line_number
-                        for i, cline in enumerate(raw_code_snippet_lines[actual_line_number - 1:]):
-                            if secret.secret_value in cline:
-                                actual_line_number += i
-                                break
-                        secret.line_number = actual_line_number
-                    yield secret
+        for plugin in scan_plan.get_plugins_for_line(line):
+            yield _LineScan(
+                plugin=plugin,
+                line=line,
+                line_number=line_number,
+                is_added=is_added,
+                is_removed=is_removed,
+                context=code_snippet,
+                raw_context=raw_code_snippet,
+                raw_context_lines=raw_code_snippet_lines,
+            )
 
 
 def _scan_line(
@@ -421,8 +584,8 @@ def _scan_line(
 ) -> Generator[PotentialSecret, None, None]:
     # NOTE: We don't apply filter functions here yet, because we don't have any filters
     # that operate on (filename, line, plugin) without `secret`
-    secrets = call_function_with_arguments(
-        plugin.analyze_line,
+    secrets = get_scan_plan().analyze_line(
+        plugin,
         filename=filename,
         line=line,
         line_number=line_number,
@@ -445,26 +608,29 @@ def _scan_line(
     )
 
 
+def _is_verified(secret: PotentialSecret, line_scan: _LineScan) -> bool:
+    """
+    This is equivalent to how `BasePlugin.analyze_line` verifies secrets, except that the
+    result is (usually) cached already.
+    """
+    if not secret.secret_value:
+        return secret.is_verified
+
+    try:
+        verified_result = verify_secret(
+            line_scan.plugin,
+            secret=secret.secret_value,
+            context=line_scan.context,
+            raw_context=line_scan.raw_context,
+        )
+    except requests.exceptions.RequestException:
+        return False
+
+    return verified_result == VerifiedResult.VERIFIED_TRUE
+
+
 def _is_filtered_out(required_filter_parameters: Iterable[str], **kwargs: Any) -> bool:
-    for filter_fn in get_filters_with_parameter(*required_filter_parameters):
-        try:
-            if call_function_with_arguments(filter_fn, **kwargs):
-                if 'secret' in kwargs:
-                    debug_msg = f'Skipping "{kwargs["secret"]}" due to `{filter_fn.path}`.'
-                elif list(kwargs.keys()) == ['filename']:
-                    # We want to make sure this is only run if we're skipping files (as compared
-                    # to other filters that may include `filename` as a parameter).
-                    debug_msg = f'Skipping "{kwargs["filename"]}" due to `{filter_fn.path}`'
-                else:
-                    debug_msg = f'Skipping secret due to `{filter_fn.path}`.'
-
-                log.info(debug_msg)
-                return True
-        except TypeError:
-            # Skipping non-compatible filters
-            pass
-
-    return False
+    return get_filter_pipeline().is_filtered_out(tuple(required_filter_parameters), **kwargs)
 
 
 def get_filters_with_parameter(*parameters: str) -> List[SelfAwareCallable]:
@@ -1,18 +1,20 @@
-import multiprocessing as mp
 import os
 from collections import defaultdict
 from typing import Any
 from typing import Dict
 from typing import Generator
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Set
 from typing import Tuple
+from typing import Union
 
 from . import scan
+from .cache import ResultCache
+from .log import log
+from .pool import ScanPool
 from .potential_secret import PotentialSecret
-from detect_secrets.settings import configure_settings_from_baseline
-from detect_secrets.settings import get_settings
 
 
 class SecretsCollection:
@@ -23,54 +25,111 @@ class SecretsCollection:
             relative to root, since we're running as if it was in a different directory,
             rather than scanning a different directory.
         """
-        self.data: Dict[str, Set[PotentialSecret]] = defaultdict(set)
+        # Sorting results is relatively expensive, so we cache the sorted order. This is
+        # invalidated whenever the results may have changed (see `_invalidate`).
+        self._sorted_files: Optional[List[str]] = None
+        self._sorted_secrets: Dict[str, List[PotentialSecret]] = {}
+
+        self.data = defaultdict(set)
         self.root = root
 
     @classmethod
     def load_from_baseline(cls, baseline: Dict[str, Any]) -> 'SecretsCollection':
+        """
+        Results may either be a dictionary, or an iterator of (filename, secrets) pairs (e.g.
+        as streamed by `baseline.load_from_file`).
+        """
+        results = baseline['results']
+        if isinstance(results, dict):
+            results = results.items()
+
         output = cls()
-        for filename in baseline['results']:
-            for item in baseline['results'][filename]:
-                secret = PotentialSecret.load_secret_from_dict({'filename': filename, **item})
-                output[filename].add(secret)
+        for filename, items in results:
+            secrets = {
+                PotentialSecret.load_secret_from_dict({'filename': filename, **item})
+                for item in items
+            }
+            if secrets:
+                output[filename] = secrets
 
         return output
 
+    @property
+    def data(self) -> Dict[str, Set[PotentialSecret]]:
+        """
+        NOTE: The iteration order is cached, and only invalidated by changes made through this
+        collection. Changes made directly to these results may therefore not be reflected in it
+        (unless they change the number of files, or secrets in a file).
+        """
+        return self._data
+
+    @data.setter
+    def data(self, value: Dict[str, Set[PotentialSecret]]) -> None:
+        self._data = value
+        self._invalidate()
+
     @property
     def files(self) -> Set[str]:
         return set(self.data.keys())
 
-    def scan_files(self, *filenames: str, num_processors: Optional[int] = None) -> None:
-        """Just like scan_file, but optimized through parallel processing."""
-        if len(filenames) == 1:
-            self.scan_file(filenames[0])
+    def scan_files(
+        self,
+        *filenames: str,
+        num_processors: Optional[int] = None,
+        cache: Optional[ResultCache] = None,
+        pool: Optional[ScanPool] = None,
+    ) -> None:
+        """
+        Just like scan_file, but optimized through parallel processing.
+
+        :param pool: if provided, its workers will be reused (rather than starting new ones
+            for every call). This is recommended when scanning multiple repositories.
+        """
+        if not filenames:
             return
 
-        if not num_processors:
-            num_processors = mp.cpu_count()
-
-        child_process_settings = get_settings().json()
-
-        with mp.Pool(
-            processes=num_processors,
-            initializer=configure_settings_from_baseline,
-            initargs=(child_process_settings,),
-        ) as p:
-            for secrets in p.imap_unordered(
-                _scan_file_and_serialize,
-                [os.path.join(self.root, filename) for filename in filenames],
-            ):
-                for secret in secrets:
-                    self[os.path.relpath(secret.filename, self.root)].add(secret)
-
-    def scan_file(self, filename: str) -> None:
-        for secret in scan.scan_file(os.path.join(self.root, filename)):
+        self._invalidate()
+        if len(filenames) == 1:
+            self.scan_file(filenames[0], cache=cache)
+        elif pool:
+            self._scan_files_in_parallel(*filenames, pool=pool, cache=cache)
+        else:
+            with ScanPool(num_processors=num_processors) as pool:
+                self._scan_files_in_parallel(*filenames, pool=pool, cache=cache)
+
+        if cache:
+            # This is done once per batch (rather than per file), since it's relatively expensive.
+            cache.evict()
+
+    def _scan_files_in_parallel(
+        self,
+        *filenames: str,
+        pool: ScanPool,
+        cache: Optional[ResultCache] = None,
+    ) -> None:
+        for filename, secrets in pool.scan(
+            *[os.path.join(self.root, filename) for filename in filenames],
+            cache=cache,
+        ):
+            self[os.path.relpath(filename, self.root)].update(secrets)
+
+    def scan_file(self, filename: str, cache: Optional[ResultCache] = None) -> None:
+        """
+        :param cache: if provided, results will be replayed from it if the file is unchanged
+            since it was last scanned (and stored in it otherwise).
+        """
+        self._invalidate()
+        for secret in _scan_file_and_serialize(os.path.join(self.root, filename), cache=cache):
             self[filename].add(secret)
 
-    def scan_diff(self, diff: str) -> None:
+    def scan_diff(self, diff: Union[str, Iterable[str]]) -> None:
         """
+        :param diff: either the diff itself, or its lines (e.g. a file object, or a pipe).
+            The latter is processed one file at a time, so that large diffs don't need to be
+            read into memory all at once.
         :raises: UnidiffParseError
         """
+        self._invalidate()
         try:
             for secret in scan.scan_diff(diff):
                 self[secret.filename].add(secret)
@@ -80,6 +139,38 @@ class SecretsCollection:
                 'installing that package, and try again.',
             )
 
+    def scan_commits(
+        self,
+        *commits: str,
+        num_processors: Optional[int] = None,
+        pool: Optional[ScanPool] = None,
+    ) -> None:
+        """
+        Scans the changes introduced by each git commit, in parallel. Commits should be provided
+        oldest first: secrets are only recorded once, with the first commit they were found in.
+
+        :param pool: if provided, its workers will be reused (rather than starting new ones).
+        :raises: CalledProcessError
+        """
+        if not commits:
+            return
+
+        self._invalidate()
+        if len(commits) == 1:
+            for secret in scan.scan_commit(commits[0], root=self.root):
+                self[secret.filename].add(secret)
+        elif pool:
+            self._scan_commits_in_parallel(*commits, pool=pool)
+        else:
+            with ScanPool(num_processors=num_processors) as pool:
+                self._scan_commits_in_parallel(*commits, pool=pool)
+
+    def _scan_commits_in_parallel(self, *commits: str, pool: ScanPool) -> None:
+        for _, secrets in pool.scan_commits(*commits, root=self.root):
+            for secret in secrets:
+                # Secrets that were already found in an earlier commit are left untouched.
+                self[secret.filename].add(secret)
+
     def merge(self, old_results: 'SecretsCollection') -> None:
         """
         We operate under an assumption that the latest results are always more accurate,
@@ -90,6 +181,7 @@ class SecretsCollection:
         Therefore, this function serves to extract this information from the old results,
         and amend the new results with it.
         """
+        self._invalidate()
         for filename in old_results.files:
             if filename not in self.files:
                 continue
@@ -201,30 +293,48 @@ class SecretsCollection:
         return self.__eq__(other, strict=True)      # type: ignore
 
     def __getitem__(self, filename: str) -> Set[PotentialSecret]:
+        # The caller may change these secrets (or add a new file), so this can't assume that
+        # the order stays the same.
+        self._invalidate()
         return self.data[filename]
 
     def __setitem__(self, filename: str, value: Set[PotentialSecret]) -> None:
+        self._invalidate()
         self.data[filename] = value
 
     def __iter__(self) -> Generator[Tuple[str, PotentialSecret], None, None]:
-        for filename in sorted(self.files):
-            secrets = self[filename]
-
+        # As a safeguard against changes made directly to `self.data`, we also check that the
+        # number of files (and secrets) still matches.
+        if self._sorted_files is None or len(self._sorted_files) != len(self.data):
+            self._sorted_files = sorted(self.data)
+            self._sorted_secrets = {}
+
+        for filename in self._sorted_files:
+            current = self.data.get(filename, ())
+            secrets = self._sorted_secrets.get(filename)
+            if secrets is None or len(secrets) != len(current):
+                secrets = list(current)
+
+            # NOTE: Line numbers may still have changed since these were sorted (e.g. by a
+            # caller iterating through them). Since sorting an already sorted list takes linear
+            # time, we sort them every time anyway.
             # NOTE: If line numbers aren't supplied, they are supposed to default to 0.
-            for secret in sorted(
-                secrets,
-                key=lambda secret: (
-                    getattr(secret, 'line_number', 0),
-                    secret.secret_hash,
-                    secret.type,
-                ),
-            ):
+            secrets = self._sorted_secrets[filename] = sorted(secrets, key=_get_sort_key)
+
+            for secret in secrets:
                 yield filename, secret
 
+    def __len__(self) -> int:
+        return sum(len(secrets) for secrets in self.data.values())
+
     def __bool__(self) -> bool:
         # This checks whether there are secrets, rather than just empty files.
         # Empty files can occur with SecretsCollection subtraction.
-        return bool(list(self))
+        return any(self.data.values())
+
+    def _invalidate(self) -> None:
+        self._sorted_files = None
+        self._sorted_secrets = {}
 
     def __eq__(self, other: Any, strict: bool = False) -> bool:
         """
@@ -255,16 +365,15 @@ class SecretsCollection:
             for secret_a in self_mapping.values():
                 secret_b = other_mapping[(secret_a.secret_hash, secret_a.type)]
 
-                values_a = vars(secret_a)
-                values_a.pop('secret_value')
-                values_b = vars(secret_b)
-                values_b.pop('secret_value')
+                # NOTE: This excludes the secret value, which we don't want to compare.
+                values_a = secret_a.json()
+                values_b = secret_b.json()
 
-                if values_a['line_number'] == 0 or values_b['line_number'] == 0:
+                if not secret_a.line_number or not secret_b.line_number:
                     # If line numbers are not provided (for either one), then don't compare
                     # line numbers.
-                    values_a.pop('line_number')
-                    values_b.pop('line_number')
+                    values_a.pop('line_number', None)
+                    values_b.pop('line_number', None)
 
                 if values_a != values_b:
                     return False
@@ -282,14 +391,14 @@ class SecretsCollection:
         # We want to create a copy to follow convention and adhere to the principle
         # of least surprise.
         output = SecretsCollection()
-        for filename in other.files:
-            if filename not in self.files:
+        for filename in other.data:
+            if filename not in self.data:
                 continue
 
             output[filename] = self[filename] - other[filename]
 
-        for filename in self.files:
-            if filename in other.files:
+        for filename in self.data:
+            if filename in other.data:
                 continue
 
             output[filename] = self[filename]
@@ -297,6 +406,28 @@ class SecretsCollection:
         return output
 
 
-def _scan_file_and_serialize(filename: str) -> List[PotentialSecret]:
+def _scan_file_and_serialize(
+    filename: str,
+    cache: Optional[ResultCache] = None,
+) -> List[PotentialSecret]:
     """Used for multiprocessing, since lambdas can't be serialized."""
-    return list(scan.scan_file(filename))
+    if not cache:
+        return list(scan.scan_file(filename))
+
+    key = cache.get_key(filename)
+    if key:
+        secrets = cache.get(key)
+        if secrets is not None:
+            log.info(f'Using cached results for {filename}')
+            return secrets
+
+    secrets = list(scan.scan_file(filename))
+    if key:
+        cache.set(key, secrets)
+
+    return secrets
+
+
+def _get_sort_key(secret: PotentialSecret) -> Tuple[int, str, str]:
+    return (secret.line_number or 0, secret.secret_hash, secret.type)
+
@@ -21,13 +21,22 @@ def parse_args(args: argparse.Namespace) -> None:
         return initialize_plugin_settings(args)
 
     try:
-        loaded_baseline = baseline.load_from_file(args.baseline[0])
-    except UnableToReadBaselineError:
-        raise argparse.ArgumentTypeError('Unable to read baseline.')
+        # The pre-commit hook only needs the results for the files it's checking, so we don't
+        # need to load (and compare) the entire baseline.
+        loaded_baseline = baseline.load_from_file(
+            args.baseline[0],
+            filenames=getattr(args, 'filenames', None),
+            stream_results=True,
+        )
 
-    try:
         args.baseline_filename = args.baseline[0]
         args.baseline_version = loaded_baseline['version']
+        args.baseline_revision = loaded_baseline.get('revision', '')
+        args.baseline_history_revision = loaded_baseline.get('history_revision', '')
+
+        # Since results are streamed, they are only read here.
         args.baseline = baseline.load(loaded_baseline, filename=args.baseline_filename)
+    except UnableToReadBaselineError:
+        raise argparse.ArgumentTypeError('Unable to read baseline.')
     except KeyError:
         raise argparse.ArgumentTypeError('Invalid baseline.')
@@ -7,6 +7,8 @@ from urllib.parse import urlparse
 from ... import filters
 from ...constants import VerifiedResult
 from ...core.log import log
+from ...core.verification import get_verification_cache
+from ...core.verification import VerificationCache
 from ...exceptions import InvalidFile
 from ...settings import get_settings
 from ...util.importlib import import_file_as_module
@@ -34,6 +36,24 @@ def add_filter_options(parent: argparse.ArgumentParser) -> None:
         action='store_true',
         help='Only flags secrets that can be verified.',
     )
+    parser.add_argument(
+        '--verification-cache-dir',
+        metavar='DIRECTORY',
+        help=(
+            'Caches the results of verifying secrets in this directory, so that secrets are '
+            'not verified again on subsequent runs.'
+        ),
+    )
+    parser.add_argument(
+        '--verification-cache-ttl',
+        type=int,
+        default=VerificationCache.DEFAULT_TTL,
+        metavar='SECONDS',
+        help=(
+            'Number of seconds that cached verification results are valid for. '
+            'Defaults to %(default)s.'
+        ),
+    )
 
     parser.add_argument(
         '--exclude-lines',
@@ -178,6 +198,11 @@ def parse_args(args: argparse.Namespace) -> None:
                 else VerifiedResult.UNVERIFIED
             ).value,
         }
+
+        get_verification_cache().configure(
+            directory=args.verification_cache_dir,
+            ttl=args.verification_cache_ttl,
+        )
     else:
         get_settings().disable_filters(
             'detect_secrets.filters.common.is_ignored_due_to_verification_policies',
@@ -76,6 +76,39 @@ def _add_initialize_baseline_options(parser: argparse.ArgumentParser) -> None:
             'latest plugins'
         ),
     )
+    group.add_argument(
+        '--since',
+        nargs='?',
+        const='',
+        metavar='REVISION',
+        help=(
+            'Requires --baseline. Rather than rescanning the entire repository, only rescans '
+            'files that have changed since this git revision, and keeps the existing results for '
+            'all other files. If no revision is specified, the revision recorded in the baseline '
+            'will be used.'
+        ),
+    )
+    group.add_argument(
+        '--history',
+        nargs='?',
+        const='HEAD',
+        metavar='REVISION_RANGE',
+        help=(
+            'Rather than scanning the current files, scans the changes introduced by each '
+            '(non-merge) commit in this git revision range (defaults to HEAD, i.e. all commits). '
+            'Each secret is reported once, with the first commit it was found in. If --baseline '
+            'is provided, it must be from an earlier history scan, and only commits made since '
+            'then will be scanned.'
+        ),
+    )
+    group.add_argument(
+        '--cache-dir',
+        metavar='DIRECTORY',
+        help=(
+            'Caches scan results in this directory, keyed off file contents and scan settings. '
+            'Unchanged files will not be rescanned on subsequent runs.'
+        ),
+    )
     group.add_argument(
         '--slim',
         action='store_true',
@@ -96,3 +129,18 @@ def parse_args(args: argparse.Namespace) -> None:
     if args.baseline is not None and args.force_use_all_plugins:
         get_settings().plugins.clear()
         initialize_plugin_settings(args)
+
+    if args.history is not None and (args.since is not None or args.only_allowlisted):
+        raise argparse.ArgumentTypeError(
+            '--history cannot be used with --since or --only-allowlisted.',
+        )
+
+    if args.since is not None:
+        if args.baseline is None:
+            raise argparse.ArgumentTypeError('--since requires --baseline.')
+
+        if not args.since:
+            if not args.baseline_revision:
+                raise argparse.ArgumentTypeError('No revision recorded in baseline.')
+
+            args.since = args.baseline_revision
@@ -0,0 +1,257 @@
+"""
+Verifying a secret generally requires a network call. The same secret is verified by both the
+plugin that found it (to record whether it is verified) and the verification policy filter (to
+decide whether to report it), and the same secrets tend to be found in multiple places (or on
+every run, e.g. in CI). As such, verification results are cached in memory, and optionally on
+disk, so that they are shared across runs.
+
+Secrets that still need to be verified can also be verified in (concurrent) batches (see
+`defer_verification`), so that scanning doesn't stall on every network round-trip.
+
+NOTE: Just like `detect_secrets.core.cache`, the plaintext secret values are *not* cached.
+"""
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any
+from typing import cast
+from typing import Dict
+from typing import Iterator
+from typing import NamedTuple
+from typing import Optional
+
+import requests
+
+from ..constants import VerifiedResult
+from ..util.cache import FileCache
+from ..util.code_snippet import CodeSnippet
+from ..util.inject import call_function_with_arguments
+from ..util.inject import make_function_self_aware
+from .log import log
+from .potential_secret import PotentialSecret
+
+
+# This bounds the number of secrets that are verified concurrently.
+# See `detect_secrets.util.http` for the number of concurrent requests to each host.
+MAX_WORKERS = 16
+
+# This bounds the number of secrets that are held back (rather than reported) while they are
+# waiting to be verified.
+BATCH_SIZE = 4 * MAX_WORKERS
+
+
+class VerificationRequest(NamedTuple):
+    plugin: Any     # BasePlugin
+    secret: str
+    context: Optional[CodeSnippet]
+    raw_context: Optional[CodeSnippet]
+
+
+@lru_cache(maxsize=1)
+def get_verification_cache() -> 'VerificationCache':
+    """
+    This is a singleton (just like `detect_secrets.settings.get_settings`), so that results are
+    shared between all plugins and filters.
+    """
+    return VerificationCache()
+
+
+def verify_secret(
+    plugin: Any,
+    secret: str,
+    context: Optional[CodeSnippet] = None,
+    raw_context: Optional[CodeSnippet] = None,
+) -> VerifiedResult:
+    """
+    :type plugin: BasePlugin
+    :raises: requests.exceptions.RequestException
+    :raises: TypeError
+    """
+    # Only the context that the plugin uses to verify the secret affects its result.
+    injectable_variables = make_function_self_aware(plugin.verify).injectable_variables
+    key = hashlib.sha1(    # noqa: S324
+        ':'.join([
+            plugin.secret_type,
+            PotentialSecret.hash_secret(secret),
+            _hash_context(context) if 'context' in injectable_variables else '',
+            _hash_context(raw_context) if 'raw_context' in injectable_variables else '',
+        ]).encode(),
+    ).hexdigest()
+
+    cache = get_verification_cache()
+    result = cache.get(key)
+    if result is not None:
+        return result
+
+    request = VerificationRequest(plugin, secret, context, raw_context)
+    if cache.pending is not None:
+        cache.pending[key] = request
+        return VerifiedResult.UNVERIFIED
+
+    result = _verify(request)
+    cache.set(key, result)
+    return result
+
+
+@contextmanager
+def defer_verification() -> Iterator[Dict[str, VerificationRequest]]:
+    """
+    Within this context, secrets that haven't been verified yet are reported as UNVERIFIED, and
+    collected rather than verified. They can then all be verified at once with `verify_secrets`,
+    after which `verify_secret` will return their actual results.
+
+    Usage:
+        >>> with defer_verification() as pending:
+        ...     verify_secret(plugin, secret)
+        >>> verify_secrets(pending)
+        >>> verify_secret(plugin, secret)   # This is cached now.
+    """
+    cache = get_verification_cache()
+    cache.pending = {}
+    try:
+        yield cache.pending
+    finally:
+        cache.pending = None
+
+
+def verify_secrets(pending: Dict[str, VerificationRequest]) -> None:
+    """
+    This verifies secrets concurrently, and caches their results.
+
+    Just like plugins and filters do, secrets that fail to be verified (due to a request error)
+    are considered to be UNVERIFIED. However, this is only remembered for the current run.
+    Any other errors are raised when the secret is verified again, outside of a batch.
+    """
+    if not pending:
+        return
+
+    cache = get_verification_cache()
+    executor = _get_executor()
+    futures = {
+        key: executor.submit(_verify, request)
+        for key, request in pending.items()
+    }
+
+    # NOTE: Results are cached from this thread (rather than the workers), since the
+    # cache isn't thread-safe.
+    for key, future in futures.items():
+        error = future.exception()
+        if error is None:
+            cache.set(key, future.result())
+        elif isinstance(error, requests.exceptions.RequestException):
+            cache.set(key, VerifiedResult.UNVERIFIED, persist=False)
+
+
+class VerificationCache:
+    DEFAULT_TTL = 24 * 60 * 60
+
+    # This bounds the number of results kept in memory.
+    MAX_SIZE = 2 ** 16
+
+    def __init__(self) -> None:
+        self.results: Dict[str, VerifiedResult] = {}
+
+        self.storage: Optional[FileCache] = None
+        self.ttl = self.DEFAULT_TTL
+
+        # This is only set within `defer_verification`.
+        self.pending: Optional[Dict[str, VerificationRequest]] = None
+
+    def configure(
+        self,
+        directory: Optional[str] = None,
+        ttl: int = DEFAULT_TTL,
+    ) -> 'VerificationCache':
+        """
+        :param directory: if specified, results will also be cached in this directory, so
+            that they can be shared across runs.
+        :param ttl: number of seconds for which results stored on disk remain valid.
+        """
+        self.storage = FileCache(directory) if directory else None
+        self.ttl = ttl
+        return self
+
+    def get(self, key: str) -> Optional[VerifiedResult]:
+        try:
+            return self.results[key]
+        except KeyError:
+            pass
+
+        value = self.storage.get(key) if self.storage else None
+        if value is None:
+            return None
+
+        try:
+            entry = json.loads(value)
+            if time.time() - entry['verified_at'] > self.ttl:
+                return None
+
+            result = VerifiedResult(entry['result'])
+        except (ValueError, KeyError, TypeError):
+            log.warning(f'Ignoring corrupted verification cache entry: {key}')
+            return None
+
+        self._remember(key, result)
+        return result
+
+    def set(self, key: str, result: VerifiedResult, persist: bool = True) -> None:
+        """
+        :param persist: if False, the result is only cached in memory.
+        """
+        self._remember(key, result)
+        if persist and self.storage:
+            self.storage.set(
+                key,
+                json.dumps({'verified_at': time.time(), 'result': result.value}).encode(),
+            )
+
+    def json(self) -> Dict[str, Any]:
+        """This is used to configure other processes in the same way."""
+        return {
+            'directory': self.storage.directory if self.storage else None,
+            'ttl': self.ttl,
+        }
+
+    def _remember(self, key: str, result: VerifiedResult) -> None:
+        if len(self.results) >= self.MAX_SIZE:
+            # Dictionaries are ordered, so this evicts the oldest result.
+            del self.results[next(iter(self.results))]
+
+        self.results[key] = result
+
+
+@lru_cache(maxsize=1)
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    Workers are kept alive between batches, so that they keep their sessions (and therefore,
+    their connections). See `detect_secrets.util.http.get_session`.
+    """
+    return ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
+
+# Worker threads aren't carried over to a forked process (e.g. a worker in `ScanPool`).
+if hasattr(os, 'register_at_fork'):    # pragma: no branch
+    os.register_at_fork(after_in_child=_get_executor.cache_clear)
+
+
+def _verify(request: VerificationRequest) -> VerifiedResult:
+    return cast(
+        VerifiedResult,
+        call_function_with_arguments(
+            request.plugin.verify,
+            secret=request.secret,
+            context=request.context,
+            raw_context=request.raw_context,
+        ),
+    )
+
+
+def _hash_context(context: Optional[CodeSnippet]) -> str:
+    if context is None:
+        return ''
+
+    return hashlib.sha1('\n'.join(context.lines).encode()).hexdigest()     # noqa: S324
@@ -8,9 +8,9 @@ from typing import TYPE_CHECKING
 import requests
 
 from ..constants import VerifiedResult
+from ..core.verification import verify_secret
 from ..settings import get_settings
 from ..util.code_snippet import CodeSnippet
-from ..util.inject import call_function_with_arguments
 from .util import get_caller_path
 
 if TYPE_CHECKING:
@@ -46,11 +46,7 @@ def is_ignored_due_to_verification_policies(
     something, and it's verified false, why are you still including it as a valid secret?
     """
     try:
-        verify_result = call_function_with_arguments(
-            plugin.verify,
-            secret=secret,
-            context=context,
-        )
+        verify_result = verify_secret(plugin, secret=secret, context=context)
     except requests.exceptions.RequestException:
         verify_result = VerifiedResult.UNVERIFIED
 
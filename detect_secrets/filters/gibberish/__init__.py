@@ -18,6 +18,9 @@ if TYPE_CHECKING:
 
 
 Model = Any
+Detector = Any
+
+HEX_CHARSET = frozenset(string.hexdigits + '-')
 
 
 def is_feature_enabled() -> bool:
@@ -59,6 +62,11 @@ def initialize(model_path: Optional[str] = None, limit: float = 3.7) -> None:
     path = f'{__name__}.should_exclude_secret'
     get_settings().filters[path] = config
 
+    # The model (or limit) may have changed, so previous verdicts no longer apply.
+    get_detector.cache_clear()
+    is_gibberish.cache_clear()
+    get_detector()
+
 
 def should_exclude_secret(secret: str, plugin: BasePlugin | None = None) -> bool:
     """
@@ -73,25 +81,41 @@ def should_exclude_secret(secret: str, plugin: BasePlugin | None = None) -> bool
     # works best with non-hex strings, since hex strings have a too limited charset
     # to fit our trained models. As such, we cannot make a deterministic decision
     # in such cases.
-    if not (set(secret) - set(string.hexdigits + '-')):
+    if HEX_CHARSET.issuperset(secret):
         return False
 
-    if not get_model().data or not get_model().charset:
-        raise AssertionError('Attempting to use uninitialized gibberish model.')
-
-    from gibberish_detector.detector import Detector  # type:ignore[import-untyped]
-    detector = Detector(
-        model=get_model(),
-        threshold=get_settings().filters[f'{__name__}.should_exclude_secret']['limit'],
-    )
-
     # TODO: secret.lower() is only used currently, since the default model is only
     # trained with lower case letters. However, in the future, if people want to train
     # a model that is case-sensitive, we can figure out how to change this.
     # Unfortunately, it's not straight-forward to just remove the `.lower()` function call,
     # since if the string is *not* lowered (and the model expects it to be), the results
     # will be quite different.
-    return not detector.is_gibberish(secret.lower())
+    return not is_gibberish(secret.lower())
+
+
+@lru_cache(maxsize=2 ** 16)
+def is_gibberish(secret: str) -> bool:
+    """
+    The same secrets tend to show up many times in a scan (e.g. across files, or when
+    flagged by multiple plugins), so verdicts are memoized.
+    """
+    return bool(get_detector().is_gibberish(secret))
+
+
+@lru_cache(maxsize=1)
+def get_detector() -> Detector:
+    """
+    :raises: AssertionError
+    """
+    model = get_model()
+    if not model.data or not model.charset:
+        raise AssertionError('Attempting to use uninitialized gibberish model.')
+
+    from gibberish_detector.detector import Detector  # type:ignore[import-untyped]
+    return Detector(
+        model=model,
+        threshold=get_settings().filters[f'{__name__}.should_exclude_secret']['limit'],
+    )
 
 
 @lru_cache(maxsize=1)
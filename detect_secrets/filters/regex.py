@@ -1,9 +1,10 @@
-import re
 from functools import lru_cache
 from typing import List
 from typing import Pattern
+from typing import Tuple
 
 from ..settings import get_settings
+from .util import compile_patterns
 from .util import get_caller_path
 
 
@@ -15,18 +16,24 @@ def should_exclude_line(line: str) -> bool:
 @lru_cache(maxsize=1)
 def _get_line_exclusion_regex() -> List[Pattern]:
     path = get_caller_path(offset=1)
-    return [re.compile(regex) for regex in get_settings().filters[path]['pattern']]
+    return compile_patterns(tuple(get_settings().filters[path]['pattern']))
 
 
 def should_exclude_file(filename: str) -> bool:
-    regexes = _get_file_exclusion_regex()
+    # The same files are often checked multiple times (e.g. when scanning history), so these
+    # decisions are memoized for each set of patterns.
+    regexes = _get_file_exclusion_regex(f'{__name__}.should_exclude_file')
+    return _should_exclude_file(regexes, filename)
+
+
+@lru_cache(maxsize=2 ** 16)
+def _should_exclude_file(regexes: Tuple[Pattern, ...], filename: str) -> bool:
     return any(regex.search(filename) for regex in regexes)
 
 
 @lru_cache(maxsize=1)
-def _get_file_exclusion_regex() -> List[Pattern]:
-    path = get_caller_path(offset=1)
-    return [re.compile(regex) for regex in get_settings().filters[path]['pattern']]
+def _get_file_exclusion_regex(path: str) -> Tuple[Pattern, ...]:
+    return tuple(compile_patterns(tuple(get_settings().filters[path]['pattern'])))
 
 
 def should_exclude_secret(secret: str) -> bool:
@@ -37,4 +44,4 @@ def should_exclude_secret(secret: str) -> bool:
 @lru_cache(maxsize=1)
 def _get_secret_exclusion_regex() -> List[Pattern]:
     path = get_caller_path(offset=1)
-    return [re.compile(regex) for regex in get_settings().filters[path]['pattern']]
+    return compile_patterns(tuple(get_settings().filters[path]['pattern']))
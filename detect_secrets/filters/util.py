@@ -1,5 +1,17 @@
 import hashlib
 import inspect
+import re
+from functools import lru_cache
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Pattern
+from typing import Tuple
+
+
+# Patterns without any of these are just literal strings.
+_METACHARACTERS = re.compile(r'[.^$*+?{}\[\]\\|()]')
 
 
 def get_caller_path(offset: int = 0) -> str:
@@ -48,3 +60,85 @@ def compute_file_hash(filename: str, buffer_size: int = 64 * 1024) -> str:
             data = f.read(buffer_size)
 
     return sha1.hexdigest()
+
+
+@lru_cache(maxsize=16)
+def compile_patterns(patterns: Tuple[str, ...]) -> List[Pattern]:
+    """
+    Configurations can have a large number of patterns, and searching a string for each of
+    them in turn gets expensive. However, most of them tend to be literal strings (e.g. known
+    test values), which we combine into a single pattern, so that a string only needs to be
+    searched once for all of them.
+
+    NOTE: The remaining patterns are compiled separately. While they could also be combined
+    (as an alternation), this defeats the optimizations of Python's regex engine (e.g. for
+    literal prefixes), and ends up being slower than searching for them one by one.
+
+    NOTE: These are cached by the patterns themselves (rather than the settings that they
+    come from), so they need not be recompiled when the settings are reconfigured.
+
+    :returns: regexes, such that a string matches any of them iff it matches any pattern.
+    :raises: re.error
+    """
+    literals: List[str] = []
+    regexes: List[Pattern] = []
+    for pattern in dict.fromkeys(patterns):
+        if _METACHARACTERS.search(pattern):
+            regexes.append(re.compile(pattern))
+        else:
+            literals.append(pattern)
+
+    if literals:
+        regexes.insert(0, re.compile(_get_trie_pattern(literals)))
+
+    return regexes
+
+
+def _get_trie_pattern(literals: Iterable[str]) -> str:
+    """
+    Rather than a plain alternation (e.g. `abc|abd`), which the regex engine would try one
+    by one, we factor out their common prefixes (e.g. `ab(?:c|d)`).
+    """
+    trie: Dict[str, Any] = {}
+    for literal in literals:
+        node = trie
+        for character in literal:
+            node = node.setdefault(character, {})
+
+        # This marks the end of a literal.
+        node[''] = {}
+
+    # NOTE: Literals can be long enough (e.g. excluded secrets) to exceed the recursion limit,
+    # so the trie is traversed with an explicit stack instead. Children are rendered before
+    # their parents.
+    patterns: Dict[int, str] = {}
+    stack = [(trie, False)]
+    while stack:
+        node, is_rendered = stack.pop()
+        if is_rendered:
+            patterns[id(node)] = _get_trie_node_pattern(node, patterns)
+        else:
+            stack.append((node, True))
+            stack.extend((child, False) for child in node.values())
+
+    return patterns[id(trie)]
+
+
+def _get_trie_node_pattern(node: Dict[str, Any], patterns: Dict[int, str]) -> str:
+    """
+    :param patterns: the rendered patterns of this node's children, keyed by their id.
+    """
+    alternatives = [
+        re.escape(character) + patterns[id(child)]
+        for character, child in sorted(node.items())
+        if character
+    ]
+    if not alternatives:
+        return ''
+
+    output = alternatives[0] if len(alternatives) == 1 else f'(?:{"|".join(alternatives)})'
+    if '' in node:
+        # Since this is the end of a literal, the rest of it is optional.
+        output = f'(?:{output})?'
+
+    return output
@@ -6,6 +6,7 @@ use of the Aho-Corasick algorithm.
 """
 from functools import lru_cache
 from typing import Any
+from typing import Optional
 
 from ..settings import get_settings
 from .util import compute_file_hash
@@ -28,24 +29,10 @@ def initialize(wordlist_filename: str, min_length: int = 3, file_hash: str = '')
         words. As a result, our recall will decrease without a precision boost.
         Tweak this value to customize it based on your own findings.
 
-    :param file_hash: this is currently used for baseline reporting purposes only, rather than
-        engine's functionality. One can imagine a future where this automaton model is
-        cached and keyed off the hash, and thus, this file_hash can be used to see if the
-        cache needs to be invalidated.
-
-        But alas, this functionality has yet to be implemented.
+    :param file_hash: this is currently used for baseline reporting purposes only. Since
+        the wordlist may have changed since the baseline was made, we always recompute it
+        (rather than trusting this value) before using it to key the built automaton.
     """
-    # See https://pyahocorasick.readthedocs.io/en/latest/ for more information.
-    automaton = get_automaton()
-    with open(wordlist_filename) as f:
-        for line in f.readlines():
-            line = line.lower().strip()
-
-            if len(line) < min_length:
-                continue
-
-            automaton.add_word(line, line)
-
     path = f'{__name__}.should_exclude_secret'
     get_settings().filters[path] = {
         'min_length': min_length,
@@ -53,8 +40,8 @@ def initialize(wordlist_filename: str, min_length: int = 3, file_hash: str = '')
         'file_hash': compute_file_hash(wordlist_filename),
     }
 
-    automaton.make_automaton()
-    return automaton
+    get_automaton.cache_clear()
+    return get_automaton()
 
 
 def should_exclude_secret(secret: str) -> bool:
@@ -68,5 +55,41 @@ def should_exclude_secret(secret: str) -> bool:
 
 @lru_cache(maxsize=1)
 def get_automaton() -> Automaton:
+    config = get_settings().filters.get(f'{__name__}.should_exclude_secret', {})
+    return _build_automaton(
+        wordlist_filename=config.get('file_name'),
+        file_hash=config.get('file_hash'),
+        min_length=config.get('min_length', 0),
+    )
+
+
+@lru_cache(maxsize=1)
+def _build_automaton(
+    wordlist_filename: Optional[str],
+    file_hash: Optional[str],   # noqa: ARG001
+    min_length: int,
+) -> Automaton:
+    """
+    Building the automaton for a large wordlist takes a while. Since it only depends on the
+    wordlist's content (as captured by its hash) and the minimum word length, there's no need
+    to rebuild it when the wordlist filter is re-initialized with the same values. Notably,
+    this happens whenever scan workers are configured: if they're forked from a process that
+    has already built it, they inherit (and share) its automaton instead.
+    """
+    # See https://pyahocorasick.readthedocs.io/en/latest/ for more information.
     import ahocorasick  # type:ignore[import-not-found]
-    return ahocorasick.Automaton()
+    automaton = ahocorasick.Automaton()
+    if not wordlist_filename:
+        return automaton
+
+    with open(wordlist_filename) as f:
+        for line in f.readlines():
+            line = line.lower().strip()
+
+            if len(line) < min_length:
+                continue
+
+            automaton.add_word(line, line)
+
+    automaton.make_automaton()
+    return automaton
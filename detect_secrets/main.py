@@ -1,5 +1,7 @@
 import argparse
+import contextlib
 import json
+import subprocess
 import sys
 from typing import List
 from typing import Optional
@@ -16,6 +18,7 @@ from .core.usage import ParserBuilder
 from .exceptions import InvalidBaselineError
 from .settings import get_plugins
 from .settings import get_settings
+from .util import git
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -67,11 +70,33 @@ def handle_scan_action(args: argparse.Namespace) -> None:
         print(json.dumps(baseline.format_for_output(secrets), indent=2))
         return
 
+    if args.history is not None:
+        handle_history_scan(args)
+        return
+
+    if args.since:
+        try:
+            secrets = baseline.update(
+                args.baseline,
+                *args.path,
+                since=args.since,
+                should_scan_all_files=args.all_files,
+                root=args.custom_root,
+                num_processors=args.num_cores,
+                cache_dir=args.cache_dir,
+            )
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            log.warning(f'Unable to determine changes since {args.since}. Rescanning all files.')
+        else:
+            save_baseline(secrets, args)
+            return
+
     secrets = baseline.create(
         *args.path,
         should_scan_all_files=args.all_files,
         root=args.custom_root,
         num_processors=args.num_cores,
+        cache_dir=args.cache_dir,
     )
     if args.baseline is not None:
         # The pre-commit hook's baseline upgrade is to trim the supplied baseline for non-existent
@@ -84,11 +109,59 @@ def handle_scan_action(args: argparse.Namespace) -> None:
         # default.
         secrets.merge(args.baseline)
 
-        baseline.save_to_file(secrets, args.baseline_filename)
+        save_baseline(secrets, args)
     else:
         print(json.dumps(baseline.format_for_output(secrets, is_slim_mode=args.slim), indent=2))
 
 
+def handle_history_scan(args: argparse.Namespace) -> None:
+    # If the baseline was created by a history scan, we can resume from where it left off.
+    history_revision = args.baseline_history_revision if args.baseline is not None else ''
+    if args.baseline is not None and not history_revision:
+        # Otherwise, we would mix the results of both scans (whose line numbers aren't even
+        # comparable, since a history scan records them relative to each commit's diff).
+        log.error('The baseline was not created by a history scan.')
+        sys.exit(1)
+
+    try:
+        commits = git.get_commits(args.history, path=args.custom_root, since=history_revision)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        log.error(f'Unable to list commits in `{args.history}`.')
+        sys.exit(1)
+
+    secrets = baseline.create_from_history(
+        *commits,
+        root=args.custom_root,
+        num_processors=args.num_cores,
+        old_secrets=args.baseline,
+    )
+
+    if args.baseline is not None:
+        output = baseline.format_for_output(secrets, stream_results=True)
+    else:
+        output = baseline.format_for_output(secrets, is_slim_mode=args.slim)
+
+    # This allows subsequent history scans to only scan newer commits.
+    if commits:
+        history_revision = commits[-1]
+    if history_revision:
+        output['history_revision'] = history_revision
+
+    if args.baseline is not None:
+        baseline.save_to_file(output, args.baseline_filename)
+    else:
+        print(json.dumps(output, indent=2))
+
+
+def save_baseline(secrets: SecretsCollection, args: argparse.Namespace) -> None:
+    output = baseline.format_for_output(secrets, stream_results=True)
+    with contextlib.suppress(subprocess.CalledProcessError, FileNotFoundError):
+        # This allows subsequent scans to only rescan the files that have changed since.
+        output['revision'] = git.get_head_revision(args.custom_root)
+
+    baseline.save_to_file(output, args.baseline_filename)
+
+
 def scan_adhoc_string(line: str) -> str:
     registered_plugins = get_plugins()
 
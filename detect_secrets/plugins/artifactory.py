@@ -7,6 +7,7 @@ class ArtifactoryDetector(RegexBasedDetector):
     """Scans for Artifactory credentials."""
     secret_type = 'Artifactory Credentials'
 
+    anchors = ('AKC', 'artif', 'jfrog', 'buildkit')
     denylist = [
         # Artifactory tokens begin with AKC
         # API token:
@@ -11,10 +11,9 @@ from typing import cast
 from typing import List
 from typing import Union
 
-import requests
-
 from ..constants import VerifiedResult
 from ..util.code_snippet import CodeSnippet
+from ..util.http import get_session
 from .base import RegexBasedDetector
 
 
@@ -24,6 +23,7 @@ class AWSKeyDetector(RegexBasedDetector):
 
     secret_keyword = r'(?:key|pwd|pw|password|pass|token)'
 
+    anchors = ('A3T', 'ABIA', 'ACCA', 'AKIA', 'ASIA', 'aws')
     denylist = (
         re.compile(r'\b(?:A3T[A-Z0-9]|ABIA|ACCA|AKIA|ASIA)[0-9A-Z]{16}\b'),
 
@@ -186,7 +186,7 @@ def verify_aws_secret_access_key(key: str, secret: str) -> bool:  # pragma: no c
     )
 
     # Step #5: Finally send the request
-    response = requests.post(
+    response = get_session().post(
         'https://sts.amazonaws.com',
         headers=headers,
         data=body,
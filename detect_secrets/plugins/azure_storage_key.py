@@ -25,6 +25,7 @@ class AzureStorageKeyDetector(RegexBasedDetector):
     max_part_length = 2000
     integrity_regex = re.compile(r'integrity[:=]|sha256|sha384|sha512')
 
+    anchors = ('==',)
     denylist = [
         # Account Key (AccountKey=xxxxxxxxx)
         re.compile(
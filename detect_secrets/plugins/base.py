@@ -16,17 +16,23 @@ from typing import Generator
 from typing import Iterable
 from typing import Pattern
 from typing import Set
+from typing import Tuple
 
 import requests
 
 from ..constants import VerifiedResult
 from ..core.potential_secret import PotentialSecret
+from ..core.verification import verify_secret
 from ..settings import get_settings
 from detect_secrets.util.code_snippet import CodeSnippet
-from detect_secrets.util.inject import call_function_with_arguments
 
 
 class BasePlugin(ABC):
+    # Literal substrings, at least one of which MUST appear in a line (case-insensitively) for
+    # this plugin to find a secret in it. These allow the scanner to skip this plugin for lines
+    # that can't possibly contain its secrets. If empty, the plugin will analyze every line.
+    anchors: Tuple[str, ...] = ()
+
     @property
     @abstractmethod
     def secret_type(self) -> str:
@@ -56,17 +62,19 @@ class BasePlugin(ABC):
     ) -> Set[PotentialSecret]:
         """This examines a line and finds all possible secret values in it."""
         output = set()
+
+        # If the filter is disabled it means --no-verify flag was passed
+        # We won't run verification in that case
+        should_verify = (
+            'detect_secrets.filters.common.is_ignored_due_to_verification_policies'
+            in get_settings().filters
+        )
         for match in self.analyze_string(line, **kwargs):
             is_verified: bool = False
-            # If the filter is disabled it means --no-verify flag was passed
-            # We won't run verification in that case
-            if (
-                    'detect_secrets.filters.common.is_ignored_due_to_verification_policies'
-                    in get_settings().filters
-            ):
+            if should_verify:
                 try:
-                    verified_result = call_function_with_arguments(
-                        self.verify,
+                    verified_result = verify_secret(
+                        self,
                         secret=match,
                         context=context,
                         raw_context=raw_context,
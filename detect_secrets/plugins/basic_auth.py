@@ -21,6 +21,7 @@ class BasicAuthDetector(RegexBasedDetector):
     """Scans for Basic Auth formatted URIs."""
     secret_type = 'Basic Auth Credentials'
 
+    anchors = ('://',)
     denylist = [
         re.compile(
             r'://[^{}\s]+:([^{}\s]+)@'.format(
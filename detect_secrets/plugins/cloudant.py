@@ -5,6 +5,7 @@ import requests
 
 from ..constants import VerifiedResult
 from ..util.code_snippet import CodeSnippet
+from ..util.http import get_session
 from .base import RegexBasedDetector
 
 
@@ -25,6 +26,7 @@ class CloudantDetector(RegexBasedDetector):
     at = r'\@'
     http = r'(?:https?\:\/\/)'
     cloudant_api_url = r'cloudant\.com'
+    anchors = ('cl',)
     denylist = [
         RegexBasedDetector.build_assignment_regex(
             prefix_regex=cl,
@@ -120,7 +122,7 @@ def verify_cloudant_key(hostname: str, token: str) -> VerifiedResult:
         )
 
     try:
-        response = requests.get(
+        response = get_session().get(
             request_url,
             headers=headers,
         )
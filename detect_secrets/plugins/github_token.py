@@ -10,6 +10,7 @@ class GitHubTokenDetector(RegexBasedDetector):
     """Scans for GitHub tokens."""
     secret_type = 'GitHub Token'
 
+    anchors = ('ghp_', 'gho_', 'ghu_', 'ghs_', 'ghr_')
     denylist = [
         # ref. https://github.blog/2021-04-05-behind-githubs-new-authentication-token-formats/
         re.compile(r'(ghp|gho|ghu|ghs|ghr)_[A-Za-z0-9_]{36}'),
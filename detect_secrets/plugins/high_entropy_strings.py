@@ -4,6 +4,7 @@ import math
 import re
 import string
 from abc import ABCMeta
+from collections import Counter
 from contextlib import contextmanager
 from typing import Any
 from typing import cast
@@ -96,11 +97,18 @@ class HighEntropyStringsPlugin(BasePlugin, metaclass=ABCMeta):
         if not data:  # pragma: no cover
             return 0
 
+        # NOTE: We count all characters in a single pass (rather than calling `data.count` for
+        # every character in the charset), but still sum in charset order, so that the result
+        # is numerically identical.
+        get_count = Counter(data).get
+        length = len(data)
+
         entropy = 0.0
         for x in self.charset:
-            p_x = float(data.count(x)) / len(data)
-            if p_x > 0:
-                entropy += - p_x * math.log(p_x, 2)
+            count = get_count(x)
+            if count:
+                p_x = count / length
+                entropy -= p_x * math.log(p_x, 2)
 
         return entropy
 
@@ -9,6 +9,7 @@ import requests
 from ..constants import VerifiedResult
 from ..core.potential_secret import PotentialSecret
 from ..util.code_snippet import CodeSnippet
+from ..util.http import get_session
 from .base import RegexBasedDetector
 from .high_entropy_strings import Base64HighEntropyString
 
@@ -24,6 +25,7 @@ class IbmCloudIamDetector(RegexBasedDetector):
     opt_api = r'(?:api|platform|)'
     key_or_pass = r'(?:key|pwd|password|pass|token)'
     secret = r'([a-zA-Z0-9_\-]{44}(?![a-zA-Z0-9_\-]))'
+    anchors = ('key', 'pwd', 'pass', 'token')
     denylist = [
         RegexBasedDetector.build_assignment_regex(
             prefix_regex=opt_ibm_cloud_iam + opt_dash_underscore + opt_api,
@@ -71,7 +73,7 @@ def verify_cloud_iam_api_key(apikey: Union[str, bytes]) -> requests.Response:  #
         'Content-Type': 'application/x-www-form-urlencoded',
         'Accept': 'application/json',
     }
-    response = requests.post(
+    response = get_session().post(
         'https://iam.cloud.ibm.com/identity/token',
         headers=headers,
         data={
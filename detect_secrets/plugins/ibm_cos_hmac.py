@@ -8,6 +8,7 @@ import requests
 
 from ..constants import VerifiedResult
 from ..util.code_snippet import CodeSnippet
+from ..util.http import get_session
 from .base import RegexBasedDetector
 
 
@@ -24,6 +25,7 @@ class IbmCosHmacDetector(RegexBasedDetector):
     token_prefix = r'(?:(?:ibm)?[-_]?cos[-_]?(?:hmac)?|)'
     password_keyword = r'(?:secret[-_]?(?:access)?[-_]?key)'
     password = r'([a-f0-9]{48}(?![a-f0-9]))'
+    anchors = ('secret',)
     denylist = (
         RegexBasedDetector.build_assignment_regex(
             prefix_regex=token_prefix,
@@ -160,6 +162,6 @@ def query_ibm_cos_hmac(
     # the 'requests' package automatically adds the required 'host' header
     request_url = endpoint + standardized_resource + standardized_querystring
 
-    request = requests.get(request_url, headers=headers)
+    request = get_session().get(request_url, headers=headers)
 
     return request
@@ -12,6 +12,7 @@ from .base import RegexBasedDetector
 class JwtTokenDetector(RegexBasedDetector):
     """Scans for JWTs."""
     secret_type = 'JSON Web Token'
+    anchors = ('eyJ',)
     denylist = [
         re.compile(r'eyJ[A-Za-z0-9-_=]+\.[A-Za-z0-9-_=]+\.?[A-Za-z0-9-_.+/=]*'),
     ]
@@ -80,6 +80,13 @@ ALLOWLIST = (
     'userPWD',
     'example',
 )
+LOWERED_ALLOWLIST = tuple(allowed.lower() for allowed in ALLOWLIST)
+
+# Every match of the DENYLIST contains at least one of these keywords. This allows us to skip
+# running the (relatively expensive) regexes below, for lines that can't possibly match them.
+# NOTE: Lines are casefolded before being compared to these, since case-insensitive regexes
+# also match some non-ASCII characters (e.g. the "long s", U+017F, for "s").
+DENYLIST_KEYWORDS = ('key', 'pass', 'token', 'pwd', 'secret', 'contrase')
 # Includes ], ', " as closing
 CLOSING = r'[]\'"]{0,2}'
 AFFIX_REGEX = r'\w*'
@@ -322,7 +329,12 @@ class KeywordDetector(BasePlugin):
         string: str,
         denylist_regex_to_group: Optional[Dict[Pattern, int]] = None,
     ) -> Generator[str, None, None]:
-        if any(allowed.lower() in string.lower() for allowed in ALLOWLIST):
+        lowered_string = string.lower()
+        if any(allowed in lowered_string for allowed in LOWERED_ALLOWLIST):
+            return
+
+        folded_string = string.casefold()
+        if not any(keyword in folded_string for keyword in DENYLIST_KEYWORDS):
             return
 
         if self.keyword_exclude and self.keyword_exclude.search(string):
@@ -10,6 +10,7 @@ class NpmDetector(RegexBasedDetector):
     """Scans for NPM tokens."""
     secret_type = 'NPM tokens'
 
+    anchors = ('npm', '_authToken')
     denylist = [
         # npmrc authToken
         # ref. https://stackoverflow.com/questions/53099434/using-auth-tokens-in-npmrc
@@ -34,6 +34,7 @@ from typing import Tuple
 
 from ..core.potential_secret import PotentialSecret
 from ..util.code_snippet import CodeSnippet
+from ..util.file_content import FileContent
 from .base import RegexBasedDetector
 
 
@@ -78,8 +79,13 @@ class PrivateKeyDetector(RegexBasedDetector):
             context: Optional[CodeSnippet] = None,
             raw_context: Optional[CodeSnippet] = None,
             commit_hash: Optional[str] = '',
+            file_content: Optional[FileContent] = None,
             **kwargs: Any,
     ) -> Set[PotentialSecret]:
+        """
+        :param file_content: if provided, this will be used (rather than re-reading the file)
+            to search for private keys that span multiple lines.
+        """
         output: Set[PotentialSecret] = set()
 
         output.update(
@@ -95,34 +101,37 @@ class PrivateKeyDetector(RegexBasedDetector):
         # for git history
         if commit_hash:
             if (filename, commit_hash) not in self._commit_hashes:
-                file_content = ''
+                text = ''
                 for file_line in context.lines:  # type: ignore
-                    file_content += file_line
+                    text += file_line
                 found_secrets = super().analyze_line(
-                    filename=filename, line=file_content, line_number=1,
+                    filename=filename, line=text, line_number=1,
                     context=context, raw_context=raw_context, **kwargs,
                 )
                 updated_secrets = self._get_updated_secrets(
                     found_secrets=found_secrets,
-                    file_content=file_content,
+                    file_content=text,
                     split_by_newline=True,
                 )
                 output.update(updated_secrets)
                 self._commit_hashes.add((filename, commit_hash))
             return output
 
-        if filename not in self._analyzed_files \
-                and 0 < self.get_file_size(filename) < PrivateKeyDetector.MAX_FILE_SIZE:
+        if filename in self._analyzed_files:
+            return output
+
+        file_size = file_content.size if file_content else self.get_file_size(filename)
+        if 0 < file_size < PrivateKeyDetector.MAX_FILE_SIZE:
             self._analyzed_files.add(filename)
-            file_content = self.read_file(filename)
-            if file_content:
+            text = file_content.text if file_content else self.read_file(filename)
+            if text:
                 found_secrets = super().analyze_line(
-                    filename=filename, line=file_content, line_number=1,
+                    filename=filename, line=text, line_number=1,
                     context=context, raw_context=raw_context, **kwargs,
                 )
                 updated_secrets = self._get_updated_secrets(
                     found_secrets=found_secrets,
-                    file_content=file_content,
+                    file_content=text,
                 )
                 output.update(updated_secrets)
         return output
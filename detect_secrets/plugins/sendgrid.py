@@ -10,6 +10,7 @@ class SendGridDetector(RegexBasedDetector):
     """Scans for SendGrid API keys."""
     secret_type = 'SendGrid API Key'
 
+    anchors = ('SG.',)
     denylist = [
         # SendGrid API key
         # ref. https://d2w67tjf43xwdp.cloudfront.net/Classroom/Basics/API/what_is_my_api_key.html
@@ -6,9 +6,8 @@ from typing import Any
 from typing import cast
 from typing import Dict
 
-import requests
-
 from ..constants import VerifiedResult
+from ..util.http import get_session
 from .base import RegexBasedDetector
 
 
@@ -16,6 +15,7 @@ class SlackDetector(RegexBasedDetector):
     """Scans for Slack tokens."""
     secret_type = 'Slack Token'
 
+    anchors = ('xox', 'hooks.slack.com')
     denylist = (
         # Slack Token
         re.compile(r'xox(?:a|b|p|o|s|r)-(?:\d+-)+[a-z0-9]+', flags=re.IGNORECASE),
@@ -28,7 +28,7 @@ class SlackDetector(RegexBasedDetector):
 
     def verify(self, secret: str) -> VerifiedResult:  # pragma: no cover
         if secret.startswith('https://hooks.slack.com/services/T'):
-            response = requests.post(
+            response = get_session().post(
                 secret,
                 json={
                     'text': '',
@@ -36,7 +36,7 @@ class SlackDetector(RegexBasedDetector):
             )
             valid = response.text in ['missing_text_or_fallback_or_attachments', 'no_text']
         else:
-            response = requests.post(
+            response = get_session().post(
                 'https://slack.com/api/auth.test',
                 data={
                     'token': secret,
@@ -5,6 +5,7 @@ import requests
 
 from ..constants import VerifiedResult
 from ..util.code_snippet import CodeSnippet
+from ..util.http import get_session
 from .base import RegexBasedDetector
 
 
@@ -17,6 +18,7 @@ class SoftlayerDetector(RegexBasedDetector):
     sl = r'(?:softlayer|sl)(?:_|-|)(?:api|)'
     key_or_pass = r'(?:key|pwd|password|pass|token)'
     secret = r'([a-z0-9]{64})'
+    anchors = ('sl', 'softlayer')
     denylist = [
         RegexBasedDetector.build_assignment_regex(
             prefix_regex=sl,
@@ -72,7 +74,7 @@ def find_username(context: CodeSnippet) -> List[str]:
 def verify_softlayer_key(username: str, token: str) -> VerifiedResult:
     headers = {'Content-type': 'application/json'}
     try:
-        response = requests.get(
+        response = get_session().get(
             'https://api.softlayer.com/rest/v3/SoftLayer_Account.json',
             auth=(username, token), headers=headers,
         )
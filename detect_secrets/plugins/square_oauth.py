@@ -7,6 +7,7 @@ class SquareOAuthDetector(RegexBasedDetector):
     """Scans for Square OAuth Secrets"""
     secret_type = 'Square OAuth Secret'
 
+    anchors = ('sq0csp-',)
     denylist = [
         re.compile(r'sq0csp-[0-9A-Za-z\\\-_]{43}'),
     ]
@@ -1,9 +1,8 @@
 import re
 from base64 import b64encode
 
-import requests
-
 from ..constants import VerifiedResult
+from ..util.http import get_session
 from .base import RegexBasedDetector
 
 
@@ -11,13 +10,14 @@ class StripeDetector(RegexBasedDetector):
     """Scans for Stripe keys."""
     secret_type = 'Stripe Access Key'
 
+    anchors = ('k_live_',)
     denylist = (
         # Stripe standard keys begin with sk_live and restricted with rk_live
         re.compile(r'(?:r|s)k_live_[0-9a-zA-Z]{24}'),
     )
 
     def verify(self, secret: str) -> VerifiedResult:  # pragma: no cover
-        response = requests.get(
+        response = get_session().get(
             'https://api.stripe.com/v1/charges',
             headers={
                 'Authorization': b'Basic ' + b64encode(
@@ -10,6 +10,7 @@ class TwilioKeyDetector(RegexBasedDetector):
     """Scans for Twilio API keys."""
     secret_type = 'Twilio API Key'
 
+    anchors = ('AC', 'SK')
     denylist = [
         # Account SID (ACxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx)
         re.compile(r'AC[a-z0-9]{32}'),
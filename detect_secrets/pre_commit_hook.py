@@ -3,12 +3,15 @@ import json
 import os
 import sys
 import textwrap
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 from detect_secrets.__version__ import VERSION
 from detect_secrets.core import baseline
 from detect_secrets.core.log import log
+from detect_secrets.core.potential_secret import PotentialSecret
 from detect_secrets.core.secrets_collection import SecretsCollection
 from detect_secrets.core.usage import ParserBuilder
 from detect_secrets.util import color
@@ -29,8 +32,10 @@ def main(argv: Optional[List[str]] = None) -> int:
     for filename in args.filenames:
         secrets.scan_file(filename)
 
+    # NOTE: The baseline only contains the results for `args.filenames`, as these are the only
+    # ones that we compare against (and update).
     new_secrets = secrets
-    if args.baseline:
+    if args.baseline is not None:
         new_secrets = secrets - args.baseline
 
     if new_secrets:
@@ -40,7 +45,7 @@ def main(argv: Optional[List[str]] = None) -> int:
             pretty_print_diagnostics(new_secrets)
         return 1
 
-    if not args.baseline:
+    if args.baseline is None:
         return 0
 
     # Only attempt baseline modifications if we don't find any new secrets.
@@ -52,16 +57,20 @@ def main(argv: Optional[List[str]] = None) -> int:
     )
 
     if is_modified:
-        if args.baseline_version != VERSION:
-            with open(args.baseline_filename) as f:
-                old_baseline = json.loads(f.read())
+        # Override the results, because these have been updated in `should_update_baseline`.
+        results = {
+            **{filename: [] for filename in args.filenames},
+            **args.baseline.json(),
+        }
 
-            # Override the results, because this has been updated in `should_update_baseline`.
-            old_baseline['results'] = args.baseline.json()
+        if args.baseline_version != VERSION:
+            old_baseline = baseline.load_from_file(args.baseline_filename)
+            baseline.replace_results(old_baseline, results)
 
-            args.baseline = baseline.upgrade(old_baseline)
+            baseline.save_to_file(baseline.upgrade(old_baseline), filename=args.baseline_filename)
+        else:
+            baseline.replace_results_in_file(args.baseline_filename, results)
 
-        baseline.save_to_file(args.baseline, filename=args.baseline_filename)
         print(
             'The baseline file was updated.\n'
             'Probably to keep line numbers of secrets up-to-date.\n'
@@ -77,7 +86,7 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     :raises: ValueError
     """
     output = ParserBuilder().add_pre_commit_arguments().parse_args(argv)
-    if output.baseline:
+    if output.baseline is not None:
         raise_exception_if_baseline_file_is_unstaged(output.baseline_filename)
 
     return output
@@ -108,19 +117,29 @@ def should_update_baseline(
     """
     :returns: True if changes occurred.
     """
-    original = SecretsCollection.load_from_baseline({'results': secrets.json()})
+    # Trimming only ever removes secrets, or updates their line numbers, so this is all we need
+    # to keep track of.
+    original = _get_line_numbers(secrets)
 
     secrets.trim(scanned_results=scanned_results, filelist=filelist)
 
     if baseline_version != VERSION:
         return True
 
-    if not secrets.exactly_equals(original):
+    if _get_line_numbers(secrets) != original:
         return True
 
     return False
 
 
+def _get_line_numbers(secrets: SecretsCollection) -> Dict[Tuple[str, PotentialSecret], int]:
+    return {
+        (filename, secret): secret.line_number
+        for filename, secret_set in secrets.data.items()
+        for secret in secret_set
+    }
+
+
 def pretty_print_diagnostics(secrets: SecretsCollection, width: int = 80) -> None:
     # Header
     print(
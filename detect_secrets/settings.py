@@ -7,11 +7,16 @@ from typing import Any
 from typing import Dict
 from typing import Generator
 from typing import List
+from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
 from .exceptions import InvalidFile
 from .util.importlib import import_file_as_module
 
+if TYPE_CHECKING:
+    from .core.pipeline import FilterPipeline
+    from .core.plan import ScanPlan
+
 
 @lru_cache(maxsize=1)
 def get_settings() -> 'Settings':
@@ -88,10 +93,30 @@ def transient_settings(config: Dict[str, Any]) -> Generator['Settings', None, No
         configure_settings_from_baseline(original_settings)
 
 
+@contextmanager
+def disabled_filters(*filter_paths: str) -> Generator['Settings', None, None]:
+    """
+    Unlike `Settings.disable_filters`, this only disables the filters (including default
+    filters) for the duration of the context.
+    """
+    settings = get_settings()
+    original_filters = settings.filters
+
+    settings.filters = {**original_filters}
+    try:
+        yield settings.disable_filters(*filter_paths)
+    finally:
+        settings.filters = original_filters
+        get_filters.cache_clear()
+        get_filter_pipeline.cache_clear()
+
+
 def cache_bust() -> None:
     get_plugins.cache_clear()
+    get_scan_plan.cache_clear()
 
     get_filters.cache_clear()
+    get_filter_pipeline.cache_clear()
     for path in get_settings().filters:
         # Need to also clear the individual caches (e.g. cached regex patterns).
         parts = urlparse(path)
@@ -173,6 +198,7 @@ class Settings:
             self.plugins[name] = plugin
 
         get_plugins.cache_clear()
+        get_scan_plan.cache_clear()
         return self
 
     def disable_plugins(self, *plugin_names: str) -> 'Settings':
@@ -181,6 +207,7 @@ class Settings:
                 self.plugins.pop(name)
 
         get_plugins.cache_clear()
+        get_scan_plan.cache_clear()
         return self
 
     def configure_filters(self, config: List[Dict[str, Any]]) -> 'Settings':
@@ -206,6 +233,7 @@ class Settings:
             self.filters[path] = filter_config
 
         get_filters.cache_clear()
+        get_filter_pipeline.cache_clear()
         return self
 
     def disable_filters(self, *filter_paths: str) -> 'Settings':
@@ -213,6 +241,7 @@ class Settings:
             self.filters.pop(filter_path, None)
 
         get_filters.cache_clear()
+        get_filter_pipeline.cache_clear()
         return self
 
     def json(self) -> Dict[str, Any]:
@@ -268,6 +297,13 @@ def get_plugins() -> List:
     ]
 
 
+@lru_cache(maxsize=1)
+def get_scan_plan() -> 'ScanPlan':
+    from .core.plan import ScanPlan
+
+    return ScanPlan(get_plugins())
+
+
 @lru_cache(maxsize=1)
 def get_filters() -> List:
     from .core.log import log
@@ -306,3 +342,10 @@ def get_filters() -> List:
         function.path = path
 
     return output
+
+
+@lru_cache(maxsize=1)
+def get_filter_pipeline() -> 'FilterPipeline':
+    from .core.pipeline import FilterPipeline
+
+    return FilterPipeline(get_filters())
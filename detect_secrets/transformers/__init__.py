@@ -5,8 +5,11 @@ from typing import Any
 from typing import Iterable
 from typing import List
 from typing import Optional
+from typing import Tuple
 
 from ..custom_types import NamedIO
+from ..util.filetype import determine_file_type
+from ..util.filetype import FileType
 from ..util.importlib import import_types_from_package
 from .base import BaseTransformer
 from .exceptions import ParsingError
@@ -16,13 +19,10 @@ def get_transformed_file(
     file: NamedIO,
     use_eager_transformers: bool = False,
 ) -> Optional[List[str]]:
-    for transformer in get_transformers():
-        if not transformer.should_parse_file(file.name):
-            continue
-
-        if use_eager_transformers != transformer.is_eager:
-            continue
-
+    for transformer in get_transformers_for_file_type(
+        determine_file_type(file.name),
+        use_eager_transformers=use_eager_transformers,
+    ):
         try:
             return transformer.parse_file(file)
         except ParsingError:
@@ -44,6 +44,21 @@ def get_transformers() -> Iterable[BaseTransformer]:
     ]
 
 
+@lru_cache(maxsize=len(FileType) * 2)
+def get_transformers_for_file_type(
+    file_type: FileType,
+    use_eager_transformers: bool = False,
+) -> Tuple[BaseTransformer, ...]:
+    return tuple(
+        transformer
+        for transformer in get_transformers()
+        if (
+            transformer.is_eager == use_eager_transformers
+            and transformer.should_parse_file_type(file_type)
+        )
+    )
+
+
 def _is_valid_transformer(attribute: Any) -> bool:
     return (
         inspect.isclass(attribute)
@@ -3,6 +3,8 @@ from abc import abstractmethod
 from typing import List
 
 from ..custom_types import NamedIO
+from ..util.filetype import determine_file_type
+from ..util.filetype import FileType
 
 
 class BaseTransformer(metaclass=ABCMeta):
@@ -27,8 +29,15 @@ class BaseTransformer(metaclass=ABCMeta):
         """
         return False
 
-    @abstractmethod
     def should_parse_file(self, filename: str) -> bool:
+        return self.should_parse_file_type(determine_file_type(filename))
+
+    @abstractmethod
+    def should_parse_file_type(self, file_type: FileType) -> bool:
+        """
+        Transformers are selected by file type (rather than by filename), so that this only
+        needs to be determined once per file type.
+        """
         raise NotImplementedError
 
     @abstractmethod
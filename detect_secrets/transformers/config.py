@@ -2,13 +2,13 @@
 This handles `.ini` files, or more generally known as `config` files.
 """
 import configparser
+import io
 import re
 from typing import Iterator
 from typing import List
 from typing import Tuple
 
 from ..custom_types import NamedIO
-from ..util.filetype import determine_file_type
 from ..util.filetype import FileType
 from .base import BaseTransformer
 from .exceptions import ParsingError
@@ -16,7 +16,9 @@ from detect_secrets.filters.allowlist import get_allowlist_regexes
 
 
 class ConfigFileTransformer(BaseTransformer):
-    def should_parse_file(self, filename: str) -> bool:
+    def should_parse_file_type(self, file_type: FileType) -> bool:
+        # Config files are commonly found with all sorts of file extensions (e.g. `.example`),
+        # so we rely on IniFileParser to quickly rule out files that aren't config files.
         return True
 
     def parse_file(self, file: NamedIO) -> List[str]:
@@ -30,8 +32,8 @@ class EagerConfigFileTransformer(BaseTransformer):
     # NOTE: Currently eager, since `determine_file_type` is minimalistic right now.
     is_eager = True
 
-    def should_parse_file(self, filename: str) -> bool:
-        return determine_file_type(filename) == FileType.OTHER
+    def should_parse_file_type(self, file_type: FileType) -> bool:
+        return file_type == FileType.OTHER
 
     def parse_file(self, file: NamedIO) -> List[str]:
         try:
@@ -95,6 +97,15 @@ class IniFileParser:
         self.parser.optionxform = str  # type: ignore
 
         content = file.read()
+        if not _is_possibly_config_file(content, add_header=add_header):
+            # configparser would fail to parse this too, but possibly only after reading
+            # through the whole file.
+            raise configparser.Error
+
+        # Hacky way to keep track of line location
+        self.lines = [line.strip() for line in content.split('\n')]
+        self.line_offset = 0
+
         if add_header:
             # This supports environment variables, or other files that look
             # like config files, without a section header.
@@ -102,11 +113,6 @@ class IniFileParser:
 
         self.parser.read_string(content)
 
-        # Hacky way to keep track of line location
-        file.seek(0)
-        self.lines = [line.strip() for line in file.readlines()]
-        self.line_offset = 0
-
     def __iter__(self) -> Iterator[Tuple[str, str, int]]:
         if not self.parser.sections():
             # To prevent cases where it's not an ini file, but the parser
@@ -125,6 +131,10 @@ class IniFileParser:
     def _get_value_and_line_offset(self, key: str, values: str) -> List[Tuple[str, int]]:
         """Returns the index of the location of key, value pair in lines.
 
+        This assumes that keys are requested in the order they appear in the file, and resumes
+        searching from where the previous key left off (self.line_offset), so that the file is
+        only traversed once.
+
         :param key: key, in config file.
         :param values: values for key, in config file. This is plural,
             because you can have multiple values per key. e.g.
@@ -140,15 +150,14 @@ class IniFileParser:
         current_value_list_index = 0
         output = []
 
-        for line_offset, line in enumerate(self.lines):
+        for line_offset in range(self.line_offset, len(self.lines)):
+            line = self.lines[line_offset]
+
             # Check 'pragma: allowlist nextline secret' comment on a single line
             # The IniFileParser strips out comments however it is important to
             # persist this speific comment type so filtering works properly.
             if _is_allowlist_nextline_secret_comment(line):
-                output.append((
-                    line,
-                    self.line_offset + line_offset + 1,
-                ))
+                output.append((line, line_offset + 1))
                 continue
 
             # Check ignored lines before checking values, because
@@ -160,21 +169,15 @@ class IniFileParser:
             # As such, we should handle it differently.
             if current_value_list_index == 0:
                 # In situations where the first line does not have an associated value,
-                # it will be an empty string. However, this regex still does its job because
+                # it will be an empty string. However, this still does its job because
                 # it's not necessarily the case where the first line is a non-empty one.
                 #
                 # Therefore, we *only* advance the current_value_list_index when we identify
                 # the key used.
-                first_line_regex = re.compile(
-                    r'^\s*{key}[ :=]+{value}'.format(
-                        key=re.escape(key),
-                        value=re.escape(values_list[current_value_list_index]),
-                    ),
-                )
-                if first_line_regex.match(line):
+                if _is_first_line(line, key, values_list[current_value_list_index]):
                     output.append((
                         values_list[current_value_list_index],
-                        self.line_offset + line_offset + 1,
+                        line_offset + 1,
                     ))
                     current_value_list_index += 1
 
@@ -182,26 +185,70 @@ class IniFileParser:
 
             # There's no more values to iterate over.
             if current_value_list_index == len(values_list):
-                if line_offset == 0:
-                    line_offset = 1  # Don't want to count the same line again
-
-                self.line_offset += line_offset
-                self.lines = self.lines[line_offset:]
-
+                # Don't want to count the same line again
+                self.line_offset = max(line_offset, self.line_offset + 1)
                 break
 
             # This handles all other cases, when it isn't an empty or blank line.
             output.append((
                 values_list[current_value_list_index],
-                self.line_offset + line_offset + 1,
+                line_offset + 1,
             ))
             current_value_list_index += 1
         else:
-            self.lines = []
+            self.line_offset = len(self.lines)
 
         return output
 
 
+def _is_first_line(line: str, key: str, value: str) -> bool:
+    """
+    This is equivalent to matching `{key}[ :=]+{value}` against the start of the (stripped)
+    line, without needing to compile a regex for every key.
+    """
+    if not line.startswith(key):
+        return False
+
+    remainder = line[len(key):]
+    separator_length = len(remainder) - len(remainder.lstrip(' :='))
+
+    # The value may itself start with separator characters, so we need to consider
+    # every possible split (as the regex would, by backtracking).
+    return any(
+        remainder.startswith(value, index)
+        for index in range(1, separator_length + 1)
+    )
+
+
+def _is_possibly_config_file(content: str, add_header: bool = False) -> bool:
+    """
+    This is a cheap way to rule out files that configparser would fail to parse, without
+    actually parsing them. It is conservative: a file that passes this check may still
+    fail to parse.
+
+    Ignoring blank lines and comments, the first line must be a section header (unless
+    we're adding one), and every line that isn't indented (and therefore can't be
+    continuing a multi-line value) must be either a section header or an option.
+    """
+    has_section = add_header
+
+    # This is how configparser splits lines, but allows us to stop early.
+    for line in io.StringIO(content):
+        value = line.strip()
+        if not value or value[0] in {'#', ';'}:
+            continue
+
+        if has_section and line[0].isspace():
+            continue
+
+        if configparser.ConfigParser.SECTCRE.match(value):
+            has_section = True
+        elif not has_section or ('=' not in value and ':' not in value):
+            return False
+
+    return True
+
+
 def _construct_values_list(values: str) -> List[str]:
     """
     This values_list is a strange construction, because of ini format.
@@ -18,22 +18,21 @@ from yaml.tokens import FlowEntryToken
 from yaml.tokens import KeyToken
 
 from ..custom_types import NamedIO
-from ..util.filetype import determine_file_type
 from ..util.filetype import FileType
 from .base import BaseTransformer
 from .exceptions import ParsingError
 
 
 class YAMLTransformer(BaseTransformer):
-    def should_parse_file(self, filename: str) -> bool:
-        return determine_file_type(filename) == FileType.YAML
+    def should_parse_file_type(self, file_type: FileType) -> bool:
+        return file_type == FileType.YAML
 
     def parse_file(self, file: NamedIO) -> List[str]:
         """
         :raises: ParsingError
         """
         try:
-            items = sorted(YAMLFileParser(file), key=lambda x: x.line_number)
+            items = sorted(_get_yaml_values(file), key=lambda x: x.line_number)
         except yaml.YAMLError:
             raise ParsingError
 
@@ -113,6 +112,20 @@ class YAMLValue(NamedTuple):
     line: str
 
 
+def _get_yaml_values(file: NamedIO) -> List[YAMLValue]:
+    """
+    :raises: yaml.YAMLError
+    """
+    if LibYAMLFileParser.is_supported():
+        try:
+            return list(LibYAMLFileParser(file))
+        except (UnsupportedYAMLError, yaml.YAMLError):
+            # Let the reference implementation decide whether this is actually invalid.
+            file.seek(0)
+
+    return list(YAMLFileParser(file))
+
+
 class YAMLFileParser:
     """
     Yaml config files are interesting, because they don't necessarily conform
@@ -344,3 +357,125 @@ def _create_key_value_pair_for_mapping_node_value(
             value=value,
         ),
     )
+
+
+class UnsupportedYAMLError(Exception):
+    """Raised when LibYAMLFileParser can't guarantee the same results as YAMLFileParser."""
+    pass
+
+
+class LibYAMLFileParser:
+    """
+    YAMLFileParser relies on intercepting the pure-Python parser, which makes it rather slow
+    for large files. Instead, this composes the file with LibYAML (through `yaml.CSafeLoader`),
+    and recovers the same values from the resulting nodes.
+
+    YAMLFileParser determines the line number of a value as the line of the `:` that precedes
+    it. This is easy enough to recover for block mappings. However, for constructs where the
+    line numbers depend on parser internals (e.g. flow mappings, anchors and aliases), this
+    raises an UnsupportedYAMLError, and the caller is expected to fall back to YAMLFileParser.
+    """
+
+    @staticmethod
+    def is_supported() -> bool:
+        return hasattr(yaml, 'CSafeLoader')
+
+    def __init__(self, file: NamedIO) -> None:
+        self.content = file.read()
+        self.loader = yaml.CSafeLoader(self.content)
+
+    def __iter__(self) -> Iterator[YAMLValue]:
+        """
+        :raises: yaml.YAMLError
+        :raises: UnsupportedYAMLError
+        """
+        try:
+            root = self.loader.get_single_node()
+            if root is None:
+                return
+
+            # This is done for validation purposes, so that we raise the same errors as
+            # YAMLFileParser (e.g. for unknown tags).
+            self.loader.construct_document(root)
+        finally:
+            self.loader.dispose()
+
+        lines = self.content.splitlines()
+        line_numbers = set()
+        for key, value, line_number in self._get_mapping_values(root):
+            if line_number in line_numbers:
+                # Values that share a line are ordered by YAMLFileParser's traversal.
+                raise UnsupportedYAMLError
+
+            line_numbers.add(line_number)
+            yield YAMLValue(
+                key=key.value,
+                value=(
+                    self.loader.construct_yaml_binary(cast(yaml.nodes.ScalarNode, value))
+                    if value.tag.endswith(':binary')
+                    else value.value
+                ),
+                line_number=line_number,
+                line=lines[line_number - 1],
+            )
+
+    def _get_mapping_values(
+        self,
+        root: yaml.nodes.Node,
+    ) -> Iterator[Tuple[yaml.nodes.Node, yaml.nodes.Node, int]]:
+        visited = set()
+        to_search = [root]
+        while to_search:
+            node = to_search.pop()
+            if id(node) in visited:
+                # This happens with aliases.
+                raise UnsupportedYAMLError
+
+            visited.add(id(node))
+            if isinstance(node, yaml.nodes.SequenceNode):
+                to_search.extend(node.value)
+                continue
+
+            if not isinstance(node, yaml.nodes.MappingNode):
+                continue
+
+            if node.flow_style and node.value:
+                raise UnsupportedYAMLError
+
+            keys = set()
+            for key, value in node.value:
+                if not isinstance(key, yaml.nodes.ScalarNode) or key.tag.endswith(':merge'):
+                    raise UnsupportedYAMLError
+
+                # Duplicate keys are collapsed by YAMLFileParser.
+                constructed_key = self.loader.construct_object(key)
+                if constructed_key in keys:
+                    raise UnsupportedYAMLError
+
+                keys.add(constructed_key)
+                if not (
+                    node.tag.endswith(':map')
+                    and (value.tag.endswith(':str') or value.tag.endswith(':binary'))
+                ):
+                    to_search.append(value)
+                    continue
+
+                if id(value) in visited:
+                    raise UnsupportedYAMLError
+
+                visited.add(id(value))
+                yield key, value, self._get_line_number(key)
+
+    def _get_line_number(self, key: yaml.nodes.Node) -> int:
+        """
+        :returns: the line number of the `:` following the key.
+        """
+        index = key.end_mark.index
+        while index < len(self.content) and self.content[index] == ' ':
+            index += 1
+
+        if index >= len(self.content) or self.content[index] != ':':
+            # e.g. complex keys, or tabs (which LibYAML is more lenient with).
+            raise UnsupportedYAMLError
+
+        return cast(int, key.end_mark.line) + 1
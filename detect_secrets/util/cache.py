@@ -0,0 +1,104 @@
+import contextlib
+import os
+import tempfile
+import time
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from ..core.log import log
+
+
+class FileCache:
+    """
+    A size-bounded, on-disk key-value store. Entries are stored as individual files, and
+    when the total size exceeds `max_size`, the least recently used entries (as determined by
+    their modification time, which is bumped on every read) are evicted first.
+
+    Writes are atomic, so multiple processes can safely share the same cache directory.
+    """
+
+    DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+    # Entries are written to temporary files first. These are only evicted once they are this
+    # many seconds old, since they may still be written to by another process.
+    TEMP_FILE_SUFFIX = '.tmp'
+    TEMP_FILE_MAX_AGE = 60 * 60
+
+    def __init__(self, directory: str, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.directory = directory
+        self.max_size = max_size
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._get_path(key)
+        try:
+            with open(path, 'rb') as f:
+                value = f.read()
+
+            # Mark this entry as recently used.
+            os.utime(path)
+        except OSError:
+            return None
+
+        return value
+
+    def set(self, key: str, value: bytes) -> None:
+        path = self._get_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+            fd, temp_path = tempfile.mkstemp(
+                dir=os.path.dirname(path),
+                suffix=self.TEMP_FILE_SUFFIX,
+            )
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(value)
+
+                os.replace(temp_path, path)
+            except BaseException:
+                # Otherwise, the incomplete entry would be left behind.
+                os.remove(temp_path)
+                raise
+        except OSError:
+            log.warning(f'Unable to write to cache: {path}')
+
+    def evict(self) -> None:
+        """Removes the least recently used entries, until the cache fits within `max_size`."""
+        entries: List[Tuple[float, int, str]] = []
+        total_size = 0
+        now = time.time()
+        for root, _, filenames in os.walk(self.directory):
+            for filename in filenames:
+                path = os.path.join(root, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+
+                if filename.endswith(self.TEMP_FILE_SUFFIX):
+                    # Temporary files that are this old were left behind by a process that
+                    # didn't get to finish writing them.
+                    if now - stat.st_mtime > self.TEMP_FILE_MAX_AGE:
+                        with contextlib.suppress(OSError):
+                            os.remove(path)
+
+                    continue
+
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total_size += stat.st_size
+
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+
+            total_size -= size
+
+    def _get_path(self, key: str) -> str:
+        # Shard the entries, so that directories don't get too large.
+        return os.path.join(self.directory, key[:2], key[2:])
@@ -1,5 +1,6 @@
 from typing import Generator
 from typing import List
+from typing import Optional
 
 from .color import AnsiColor
 from .color import colorize
@@ -16,6 +17,10 @@ def get_code_snippet(
     :param line_number: line which you want to focus on
     :param lines_of_context: how many lines to display around the line you want
         to focus on.
+
+    NOTE: The snippet is a view over `lines`, which is only sliced when it is needed.
+    This is because we create snippets for (almost) every line scanned, but most of them
+    are never used.
     """
     target_line_index = line_number - 1
     end_line_index = target_line_index + lines_of_context + 1
@@ -30,9 +35,10 @@ def get_code_snippet(
         start_line_index = 0
         end_line_index = len(lines)
 
-    return CodeSnippet(
-        snippet=lines[start_line_index:end_line_index],
+    return LazyCodeSnippet(
+        lines=lines,
         start_line=start_line_index,
+        end_line=end_line_index,
         target_index=target_line_index,
     )
 
@@ -100,3 +106,64 @@ class CodeSnippet:
 
     def __iter__(self) -> Generator[str, None, None]:
         yield from self.lines
+
+
+class LazyCodeSnippet(CodeSnippet):
+    def __init__(
+        self,
+        lines: List[str],
+        start_line: int,
+        end_line: int,
+        target_index: int,
+    ) -> None:
+        """
+        :param lines: all lines in the file
+        :param start_line: first line number in segment
+        :param end_line: line number after the last line in segment
+        :param target_index: index in snippet of target line
+        """
+        self._source = lines
+        self._end_line = end_line
+        self._lines: Optional[List[str]] = None
+
+        self.start_line = start_line
+        self.target_index = target_index
+
+    @property
+    def lines(self) -> List[str]:
+        if self._lines is None:
+            self._lines = self._source[self.start_line:self._end_line]
+
+        return self._lines
+
+    @lines.setter
+    def lines(self, value: List[str]) -> None:
+        self._lines = value
+
+    @property
+    def target_line(self) -> str:
+        return self._get_line(self.target_index)
+
+    @target_line.setter
+    def target_line(self, value: str) -> None:
+        self.lines[self.target_index] = value
+
+    @property
+    def previous_line(self) -> str:
+        # This is equivalent to the parent's implementation, without having to slice the lines.
+        if self.target_index == 0 or self._get_num_lines() < self.target_index:
+            return ''
+
+        return self._get_line(self.target_index - 1)
+
+    def _get_num_lines(self) -> int:
+        if self._lines is not None:
+            return len(self._lines)
+
+        return max(min(self._end_line, len(self._source)) - self.start_line, 0)
+
+    def _get_line(self, index: int) -> str:
+        if self._lines is None and 0 <= index < self._get_num_lines():
+            return self._source[self.start_line + index]
+
+        return self.lines[index]
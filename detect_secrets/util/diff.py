@@ -0,0 +1,72 @@
+"""
+Diffs can get rather large (e.g. `git log -p` over the history of a repository), so rather than
+parsing them all at once, we split them up into individual file patches, and parse them one at
+a time. This way, we only ever need to hold a single file's patch in memory.
+"""
+import re
+from typing import Iterable
+from typing import Iterator
+from typing import List
+
+
+_HUNK_HEADER_REGEX = re.compile(r'^@@ -\d+(?:,(\d+))? \+\d+(?:,(\d+))? @@')
+
+
+def split_diff_by_file(lines: Iterable[str]) -> Iterator[List[str]]:
+    """
+    :param lines: lines of a unified diff, including their line endings (e.g. a file object).
+    :returns: the lines for each file in the diff, in order. Any lines in between files
+        (e.g. commit messages) are kept with the preceding file.
+    """
+    patch: List[str] = []
+    has_file = False
+    has_source_file = False
+
+    # Hunks are consumed separately, since lines within them (e.g. a removed line that starts
+    # with `-- `) can look like file headers.
+    source_lines = target_lines = 0
+
+    for line in lines:
+        if source_lines > 0 or target_lines > 0:
+            patch.append(line)
+
+            line_type = line[:1]
+            if line_type == '+':
+                target_lines -= 1
+            elif line_type == '-':
+                source_lines -= 1
+            elif line_type in {' ', '\r', '\n'}:
+                source_lines -= 1
+                target_lines -= 1
+            elif line_type != '\\':
+                # This is an invalid hunk, so we leave it up to the diff parser to complain.
+                source_lines = target_lines = 0
+
+            continue
+
+        if line.startswith('diff '):
+            if has_file:
+                yield patch
+                patch = []
+
+            has_file = True
+            has_source_file = False
+
+        elif line.startswith('--- '):
+            if has_source_file:
+                yield patch
+                patch = []
+
+            has_file = True
+            has_source_file = True
+
+        else:
+            match = _HUNK_HEADER_REGEX.match(line)
+            if match:
+                source_lines = int(match.group(1) or 1)
+                target_lines = int(match.group(2) or 1)
+
+        patch.append(line)
+
+    if patch:
+        yield patch
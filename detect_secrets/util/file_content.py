@@ -0,0 +1,46 @@
+import io
+import os
+from typing import cast
+from typing import List
+from typing import Optional
+
+from ..custom_types import NamedIO
+
+
+class FileContent:
+    """
+    Scanning a single file requires its contents in several forms: transformers parse it as a
+    file object, plugins analyze its lines, and some plugins (e.g. PrivateKeyDetector) analyze
+    it as a whole. This reads the file once, and shares it across all of them.
+    """
+
+    def __init__(self, filename: str) -> None:
+        """
+        :raises: OSError
+        :raises: UnicodeDecodeError
+        """
+        self.filename = filename
+        with open(filename) as f:
+            self.text = f.read()
+
+            # This is the size on disk (in bytes), rather than the length of the decoded text.
+            self.size = os.fstat(f.fileno()).st_size
+
+        self._lines: Optional[List[str]] = None
+
+    @property
+    def lines(self) -> List[str]:
+        """Equivalent to `open(filename).readlines()`."""
+        if self._lines is None:
+            self._lines = self.open().readlines()
+
+        return self._lines
+
+    def open(self) -> NamedIO:
+        """
+        :returns: a new file-like object over the file's content, so that consumers
+            are able to read it without reopening the file.
+        """
+        file = io.StringIO(self.text)
+        file.name = self.filename
+        return cast(NamedIO, file)
@@ -1,5 +1,9 @@
 import os
 import subprocess
+from typing import cast
+from typing import IO
+from typing import Iterator
+from typing import List
 from typing import Set
 
 from ..core.log import log
@@ -56,3 +60,112 @@ def get_changed_but_unstaged_files() -> Set[str]:
         raise ValueError
 
     return set(files)
+
+
+def get_head_revision(path: str = '') -> str:
+    """
+    :raises: CalledProcessError
+    """
+    command = ['git']
+    if path:
+        command.extend(['-C', path])
+
+    command.extend(['rev-parse', 'HEAD'])
+    return subprocess.check_output(    # noqa: S603
+        command,
+        stderr=subprocess.DEVNULL,
+    ).decode('utf-8').strip()
+
+
+def get_changed_files(since: str, path: str = '', include_untracked: bool = False) -> Set[str]:
+    """
+    Lists the files that differ between the `since` revision and the current working tree
+    (this includes committed, staged and unstaged changes, as well as deleted files).
+
+    :param path: paths will be returned relative to this directory (defaults to the current
+        working directory).
+    :param include_untracked: if True, will also list untracked files (including ignored ones,
+        just like scanning all files does).
+    :raises: CalledProcessError
+    """
+    command = ['git']
+    if path:
+        command.extend(['-C', path])
+
+    subcommands = [['diff', '--name-only', '--no-renames', '--relative', since, '--']]
+    if include_untracked:
+        subcommands.append(['ls-files', '--others'])
+
+    output: Set[str] = set()
+    for args in subcommands:
+        files = subprocess.check_output(    # noqa: S603
+            [*command, *args],
+            stderr=subprocess.DEVNULL,
+        )
+        output.update(
+            os.path.normpath(filename)
+            for filename in files.decode('utf-8').splitlines()
+        )
+
+    return output
+
+
+def get_commits(revision_range: str = 'HEAD', path: str = '', since: str = '') -> List[str]:
+    """
+    :param revision_range: e.g. `HEAD`, or `main~10..main`
+    :param since: if provided, commits that are reachable from this commit are excluded.
+    :returns: the non-merge commits in the revision range, oldest first.
+    :raises: CalledProcessError
+    """
+    command = ['git']
+    if path:
+        command.extend(['-C', path])
+
+    command.extend(['rev-list', '--reverse', '--no-merges', revision_range])
+    if since:
+        command.append(f'^{since}')
+
+    command.append('--')
+    return subprocess.check_output(command).decode('utf-8').split()     # noqa: S603
+
+
+def get_commit_diff(commit: str, path: str = '') -> Iterator[str]:
+    """
+    Unlike other functions in this module, this streams the output (rather than reading it all
+    into memory at once), since commits can be arbitrarily large.
+
+    :param path: filenames in the diff will be relative to this directory, and changes outside
+        of it will be excluded.
+    :returns: lines of the diff of the changes introduced by the commit.
+    :raises: CalledProcessError
+    """
+    command = ['git', '-c', 'core.quotePath=false']
+    if path:
+        command.extend(['-C', path])
+
+    command.extend([
+        'diff-tree',
+        '-p',
+        '--root',
+        '--relative',
+        '--no-commit-id',
+        '--no-renames',
+        '--no-color',
+        '--no-ext-diff',
+
+        # Context lines aren't scanned anyway.
+        '-U0',
+
+        commit,
+    ])
+    with subprocess.Popen(  # noqa: S603
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        encoding='utf-8',
+        errors='replace',
+    ) as process:
+        yield from cast(IO[str], process.stdout)
+
+    if process.returncode:
+        raise subprocess.CalledProcessError(process.returncode, command)
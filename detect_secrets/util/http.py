@@ -0,0 +1,59 @@
+import os
+import threading
+from typing import Any
+from typing import cast
+from typing import Dict
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+# Secrets are verified concurrently, so this bounds the number of requests in flight to any
+# single host (e.g. so that we don't get rate limited by the API we are verifying against).
+MAX_CONNECTIONS_PER_HOST = 4
+
+_local = threading.local()
+_host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+
+
+def get_session() -> requests.Session:
+    """
+    Plugins should use this session to verify secrets, so that connections are reused between
+    requests (rather than paying for a new TCP and TLS handshake every time).
+
+    Sessions aren't guaranteed to be thread-safe, so each thread gets a session of its own.
+    However, all of them share the limit on the number of concurrent requests to each host.
+    """
+    session = getattr(_local, 'session', None)
+    if session is None:
+        adapter = _HostLimitedAdapter(pool_maxsize=MAX_CONNECTIONS_PER_HOST)
+
+        session = _local.session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+    return session
+
+
+class _HostLimitedAdapter(HTTPAdapter):
+    def send(self, request: requests.PreparedRequest, *args: Any, **kwargs: Any) -> Any:
+        # NOTE: `setdefault` is atomic, so all threads are guaranteed to share this semaphore.
+        semaphore = _host_semaphores.setdefault(
+            urlparse(cast(str, request.url)).netloc,
+            threading.BoundedSemaphore(MAX_CONNECTIONS_PER_HOST),
+        )
+        with semaphore:
+            return super().send(request, *args, **kwargs)
+
+
+def _reset() -> None:
+    _local.__dict__.clear()
+    _host_semaphores.clear()
+
+
+# Connections can't be shared with a forked process (e.g. a worker in `ScanPool`), so it
+# needs to start with a session of its own. Similarly, semaphores held by other threads would
+# never be released in it.
+if hasattr(os, 'register_at_fork'):    # pragma: no branch
+    os.register_at_fork(after_in_child=_reset)
@@ -0,0 +1,284 @@
+"""
+Baselines for large repositories can get rather large, so rather than holding their entire JSON
+representation in memory (on top of the objects they represent), we encode and decode them
+one value at a time.
+"""
+import json
+import re
+from collections.abc import Iterator as IteratorType
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import IO
+from typing import Iterable
+from typing import Iterator
+from typing import NoReturn
+from typing import Optional
+from typing import Tuple
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# This determines whether to decode a value, given its path (i.e. the keys leading up to it).
+PathFilter = Callable[[Tuple[str, ...]], bool]
+
+# When skipping over a value, these are the only tokens that matter: brackets (which may be
+# nested), and strings (which may contain brackets). Strings may also be truncated at the end of
+# the buffer, in which case the last group matches the end of the buffer (rather than a closing
+# quote).
+_SKIP_TOKENS = re.compile(r'[\[\]{}]|"[^"\\]*(?:\\.[^"\\]*)*("|\\?\Z)')
+
+
+def dump(obj: Dict[str, Any], f: IO[str], indent: int = 2) -> None:
+    """
+    Equivalent to `f.write(json.dumps(obj, indent=indent))`, except that any of its values
+    that are iterators of (key, value) pairs are written as JSON objects, one pair at a time.
+    """
+    for chunk in _iterencode_object(obj.items(), indent=indent, level=0):
+        f.write(chunk)
+
+
+def _iterencode_object(
+    items: Iterable[Tuple[str, Any]],
+    indent: int,
+    level: int,
+) -> Iterator[str]:
+    # Since JSON strings never contain literal newlines, we can indent nested values by
+    # indenting every line they span.
+    newline = '\n' + ' ' * indent * (level + 1)
+
+    is_empty = True
+    yield '{'
+    for key, value in items:
+        yield (newline if is_empty else ',' + newline) + json.dumps(key) + ': '
+        is_empty = False
+
+        if isinstance(value, IteratorType):
+            yield from _iterencode_object(value, indent=indent, level=level + 1)
+        else:
+            yield json.dumps(value, indent=indent).replace('\n', newline)
+
+    yield '}' if is_empty else '\n' + ' ' * indent * level + '}'
+
+
+def load(
+    f: IO[str],
+    depth: int = 2,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    include: Optional[PathFilter] = None,
+) -> Any:
+    """
+    Equivalent to `json.load(f)`, except that the file is read in chunks, and only the part
+    of it that is currently being decoded is held in memory.
+
+    :param depth: objects nested up to this depth will be decoded one value at a time.
+        Anything deeper is decoded in a single pass.
+    :param include: if specified, values (nested up to `depth`) are only decoded if this returns
+        True for their path. Otherwise, they are skipped over (without being validated), and
+        left out of the output.
+    :raises: json.decoder.JSONDecodeError
+    """
+    reader = _Reader(f, chunk_size=chunk_size)
+    output = _decode(reader, depth=depth, include=include, path=())
+
+    reader.skip_whitespace()
+    if reader.peek():
+        reader.fail('Extra data')
+
+    return output
+
+
+def iter_items(
+    f: IO[str],
+    path: Tuple[str, ...],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    include: Optional[PathFilter] = None,
+) -> Iterator[Tuple[str, Any]]:
+    """
+    Decodes the (key, value) pairs of the object at this path (e.g. `('results',)`) one at a
+    time, as they are consumed. Everything else in the file is skipped over.
+
+    :param include: if specified, only values for which this returns True for their path are
+        decoded (and yielded).
+    :raises: json.decoder.JSONDecodeError
+    """
+    reader = _Reader(f, chunk_size=chunk_size)
+    yield from _iter_path(reader, path=path, include=include, prefix=())
+
+
+def _decode(
+    reader: '_Reader',
+    depth: int,
+    include: Optional[PathFilter],
+    path: Tuple[str, ...],
+) -> Any:
+    reader.skip_whitespace()
+    if depth <= 0 or reader.peek() != '{':
+        return reader.decode()
+
+    output: Dict[str, Any] = {}
+    for key in _iter_keys(reader):
+        if include is None or include((*path, key)):
+            output[key] = _decode(reader, depth=depth - 1, include=include, path=(*path, key))
+        else:
+            reader.skip()
+
+    return output
+
+
+def _iter_path(
+    reader: '_Reader',
+    path: Tuple[str, ...],
+    include: Optional[PathFilter],
+    prefix: Tuple[str, ...],
+) -> Iterator[Tuple[str, Any]]:
+    for key in _iter_keys(reader):
+        if path and key != path[0]:
+            reader.skip()
+        elif path:
+            yield from _iter_path(reader, path=path[1:], include=include, prefix=(*prefix, key))
+            return
+        elif include is None or include((*prefix, key)):
+            yield key, reader.decode()
+        else:
+            reader.skip()
+
+
+def _iter_keys(reader: '_Reader') -> Iterator[str]:
+    """
+    Iterates through the keys of the object at the reader's position. The caller is expected
+    to consume each key's value before resuming.
+    """
+    reader.skip_whitespace()
+    reader.expect('{')
+
+    reader.skip_whitespace()
+    if reader.peek() == '}':
+        reader.expect('}')
+        return
+
+    while True:
+        reader.skip_whitespace()
+        key = reader.decode()
+        if not isinstance(key, str):
+            reader.fail('Expecting property name enclosed in double quotes')
+
+        reader.skip_whitespace()
+        reader.expect(':')
+        reader.skip_whitespace()
+        yield key
+
+        reader.skip_whitespace()
+        if reader.peek() == '}':
+            reader.expect('}')
+            return
+
+        reader.expect(',')
+
+
+class _Reader:
+    def __init__(self, f: IO[str], chunk_size: int) -> None:
+        self.file = f
+        self.chunk_size = chunk_size
+
+        self.buffer = ''
+        self.position = 0
+        self.is_eof = False
+
+        self.decoder = json.decoder.JSONDecoder()
+
+    def peek(self) -> str:
+        if self.position >= len(self.buffer):
+            self._read()
+
+        return self.buffer[self.position:self.position + 1]
+
+    def skip_whitespace(self) -> None:
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in ' \t\r\n':
+                self.position += 1
+
+            if self.position < len(self.buffer) or not self._read():
+                return
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            self.fail(f'Expecting {char!r} delimiter')
+
+        self.position += 1
+
+    def decode(self) -> Any:
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+            except json.decoder.JSONDecodeError:
+                if not self._read():
+                    raise
+
+                continue
+
+            # Values (e.g. numbers) may be truncated at the end of the buffer.
+            if end == len(self.buffer) and self._read():
+                continue
+
+            self.position = end
+            return value
+
+    def skip(self) -> None:
+        """
+        Skips over a value, without decoding it. This is considerably cheaper for large values,
+        since we don't need to build their Python representations.
+        """
+        if self.peek() not in ('[', '{'):
+            # Scalars are cheap enough to decode.
+            self.decode()
+            return
+
+        depth = 0
+        while True:
+            match = _SKIP_TOKENS.search(self.buffer, self.position)
+            if not match:
+                # There's nothing of interest in the rest of the buffer.
+                self.position = len(self.buffer)
+            elif match.group(1) not in (None, '"'):
+                # This string is truncated, so we need to read more of it.
+                self.position = match.start()
+            else:
+                self.position = match.end()
+
+                token = match.group(0)
+                if token in ('[', '{'):
+                    depth += 1
+                elif token in (']', '}'):
+                    depth -= 1
+                    if not depth:
+                        return
+
+                continue
+
+            if not self._read():
+                self.fail('Unterminated value')
+
+    def fail(self, message: str) -> NoReturn:
+        raise json.decoder.JSONDecodeError(message, self.buffer, self.position)
+
+    def _read(self) -> bool:
+        """
+        :returns: whether there was anything left to read.
+        """
+        if self.is_eof:
+            return False
+
+        # Discarding what we've already decoded keeps the buffer small.
+        self.buffer = self.buffer[self.position:]
+        self.position = 0
+
+        # Values may be larger than a single chunk. Reading proportionally to what we're
+        # already holding ensures that this doesn't re-decode them a quadratic number of times.
+        chunk = self.file.read(max(self.chunk_size, len(self.buffer)))
+        if not chunk:
+            self.is_eof = True
+            return False
+
+        self.buffer += chunk
+        return True
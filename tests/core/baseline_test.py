@@ -1,5 +1,8 @@
+import io
+import json
 import subprocess
 import tempfile
+import time
 from pathlib import Path
 from unittest import mock
 
@@ -7,6 +10,7 @@ import pytest
 
 from detect_secrets.core import baseline
 from detect_secrets.settings import get_settings
+from detect_secrets.util import json_stream
 from detect_secrets.util.path import get_relative_path_if_in_cwd
 from testing.mocks import mock_named_temporary_file
 
@@ -81,6 +85,66 @@ class TestCreate:
             assert get_relative_path_if_in_cwd(f.name) in secrets.data
 
 
+class TestSaveToFile:
+    @staticmethod
+    @pytest.mark.parametrize('is_slim_mode', (True, False))
+    def test_streamed_results_match_json(is_slim_mode):
+        secrets = baseline.create('test_data/files')
+        with mock.patch('detect_secrets.core.baseline.time.gmtime', return_value=time.gmtime(0)):
+            expected = baseline.format_for_output(secrets, is_slim_mode=is_slim_mode)
+            output = baseline.format_for_output(
+                secrets,
+                is_slim_mode=is_slim_mode,
+                stream_results=True,
+            )
+
+        f = io.StringIO()
+        json_stream.dump(output, f)
+        assert f.getvalue() == json.dumps(expected, indent=2)
+
+    @staticmethod
+    def test_round_trip():
+        secrets = baseline.create('test_data/files')
+        with mock_named_temporary_file() as f:
+            baseline.save_to_file(secrets, f.name)
+
+            output = baseline.load_from_file(f.name)
+            assert output['results'] == secrets.json()
+            assert baseline.load(output, f.name).exactly_equals(secrets)
+
+    @staticmethod
+    def test_round_trip_with_streamed_results():
+        secrets = baseline.create('test_data/files')
+        with mock_named_temporary_file() as f:
+            baseline.save_to_file(secrets, f.name)
+
+            output = baseline.load_from_file(f.name, stream_results=True)
+            assert not isinstance(output['results'], dict)
+            assert baseline.load(output, f.name).exactly_equals(secrets)
+
+
+class TestLoadFromFile:
+    @staticmethod
+    @pytest.mark.parametrize('stream_results', (True, False))
+    def test_only_requested_results_are_decoded(stream_results):
+        with mock_named_temporary_file(mode='w') as f:
+            # Results for other files are skipped over, so they're never decoded.
+            f.write(
+                '{"version": "1.0.0", "results": {'
+                '"a.py": [{"line_number": 1}], "b.py": [{"line_number": }]'
+                '}, "revision": "abc"}',
+            )
+            f.flush()
+
+            output = baseline.load_from_file(
+                f.name,
+                filenames=['a.py'],
+                stream_results=stream_results,
+            )
+            assert output['revision'] == 'abc'
+            assert dict(output['results']) == {'a.py': [{'line_number': 1}]}
+
+
 def test_upgrade_does_nothing_if_newer_version():
     current_baseline = {'version': '3.0.0'}
     assert baseline.upgrade(current_baseline) == current_baseline
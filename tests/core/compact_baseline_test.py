@@ -0,0 +1,130 @@
+import json
+import os
+import tempfile
+
+import pytest
+
+from detect_secrets.core import baseline
+from detect_secrets.core import compact_baseline
+from detect_secrets.exceptions import UnableToReadBaselineError
+from detect_secrets.settings import transient_settings
+
+
+@pytest.fixture
+def output():
+    with transient_settings({
+        'plugins_used': [
+            {'name': 'Base64HighEntropyString', 'limit': 4.5},
+            {'name': 'HexHighEntropyString', 'limit': 3},
+            {'name': 'KeywordDetector'},
+        ],
+    }):
+        secrets = baseline.create('test_data/files', 'test_data/config.ini')
+        output = baseline.format_for_output(secrets)
+
+    output['revision'] = 'abc'
+    return output
+
+
+@pytest.fixture
+def directory():
+    with tempfile.TemporaryDirectory() as d:
+        yield d
+
+
+def test_round_trip(output, directory):
+    # This tests fields that aren't stored in their own columns, and those that are missing.
+    filename = next(iter(output['results']))
+    output['results'][filename][0]['is_secret'] = False
+    output['results'][filename][1]['filename'] = 'different'
+    del output['results'][filename][1]['line_number']
+
+    path = os.path.join(directory, 'baseline.db')
+    compact_baseline.save(output, path)
+
+    assert json.dumps(compact_baseline.load(path)) == json.dumps(output)
+    assert os.listdir(directory) == ['baseline.db']
+
+
+def test_streamed_results(output, directory):
+    path = os.path.join(directory, 'baseline.db')
+    compact_baseline.save({**output, 'results': iter(output['results'].items())}, path)
+
+    assert compact_baseline.load(path) == output
+
+
+def test_partial_load(output, directory):
+    path = os.path.join(directory, 'baseline.db')
+    compact_baseline.save(output, path)
+
+    filenames = list(output['results'])
+    partial = compact_baseline.load(path, filenames=[filenames[1], 'non-existent', filenames[0]])
+    assert partial == {
+        **output,
+        'results': {filename: output['results'][filename] for filename in filenames[:2]},
+    }
+
+
+def test_update(output, directory):
+    path = os.path.join(directory, 'baseline.db')
+    compact_baseline.save(output, path)
+
+    first, second = list(output['results'])[:2]
+    results = {
+        first: [],
+        second: [{**output['results'][second][0], 'type': 'New Type', 'line_number': 100}],
+        'new_file': [{'type': 'Secret Keyword', 'filename': 'new_file', 'hashed_secret': 'a'}],
+        'non_existent': [],
+    }
+    compact_baseline.update(path, results)
+
+    expected = {**output, 'results': {**output['results']}}
+    baseline.replace_results(expected, results)
+    assert compact_baseline.load(path) == expected
+    assert first not in expected['results']
+    assert list(expected['results'])[-1] == 'new_file'
+
+
+class TestBaselineFile:
+    @staticmethod
+    @pytest.mark.parametrize(
+        'name, is_compact',
+        (
+            ('baseline.db', True),
+            ('.secrets.baseline', False),
+        ),
+    )
+    def test_format_is_determined_by_name(output, directory, name, is_compact):
+        path = os.path.join(directory, name)
+        baseline.save_to_file(output, path)
+
+        assert compact_baseline.is_compact_baseline(path) is is_compact
+        assert baseline.load_from_file(path) == output
+
+    @staticmethod
+    def test_existing_format_is_kept(output, directory):
+        path = os.path.join(directory, '.secrets.baseline')
+        compact_baseline.save(output, path)
+
+        baseline.save_to_file(output, path)
+        assert compact_baseline.is_compact_baseline(path)
+
+    @staticmethod
+    @pytest.mark.parametrize('name', ('baseline.db', '.secrets.baseline'))
+    def test_partial_load(output, directory, name):
+        path = os.path.join(directory, name)
+        baseline.save_to_file(output, path)
+
+        filename = sorted(output['results'])[-1]
+        assert baseline.load_from_file(path, filenames=[filename])['results'] == {
+            filename: output['results'][filename],
+        }
+
+    @staticmethod
+    def test_corrupt_baseline(directory):
+        path = os.path.join(directory, 'baseline.db')
+        with open(path, 'wb') as f:
+            f.write(b'SQLite format 3\x00' + b'\x00' * 100)
+
+        with pytest.raises(UnableToReadBaselineError):
+            baseline.load_from_file(path)
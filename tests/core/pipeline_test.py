@@ -0,0 +1,99 @@
+from unittest import mock
+
+import pytest
+
+from detect_secrets.core.pipeline import FilterPipeline
+from detect_secrets.settings import get_filter_pipeline
+from detect_secrets.settings import get_settings
+from detect_secrets.util.inject import get_injectable_variables
+
+
+def make_filter(func):
+    func.injectable_variables = set(get_injectable_variables(func))
+    func.path = func.__name__
+    return func
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def pipeline(calls):
+    @make_filter
+    def filename_filter(filename):
+        calls.append(('filename_filter', filename))
+        return filename == 'skip'
+
+    @make_filter
+    def secret_filter(secret, line=''):
+        calls.append(('secret_filter', secret, line))
+        return secret == 'skip'
+
+    @make_filter
+    def context_filter(secret, context):
+        calls.append(('context_filter', secret, context))
+        return False
+
+    return FilterPipeline([filename_filter, secret_filter, context_filter])
+
+
+class TestFilterPipeline:
+    @staticmethod
+    def test_only_runs_filters_for_stage(pipeline, calls):
+        assert not pipeline.is_filtered_out(('filename',), filename='file')
+        assert calls == [('filename_filter', 'file')]
+
+    @staticmethod
+    def test_injects_available_variables(pipeline, calls):
+        assert not pipeline.is_filtered_out(
+            ('secret',),
+            filename='file',
+            secret='value',
+            line='line',
+            context='context',
+        )
+        assert calls == [
+            ('secret_filter', 'value', 'line'),
+            ('context_filter', 'value', 'context'),
+        ]
+
+    @staticmethod
+    def test_skips_filters_missing_required_variables(pipeline, calls):
+        assert not pipeline.is_filtered_out(('secret',), filename='file', secret='value')
+        assert calls == [('secret_filter', 'value', '')]
+
+    @staticmethod
+    def test_stops_at_first_match(pipeline, calls):
+        assert pipeline.is_filtered_out(('secret',), secret='skip', context='context')
+        assert calls == [('secret_filter', 'skip', '')]
+
+    @staticmethod
+    def test_skips_filters_raising_type_error():
+        @make_filter
+        def broken_filter(secret):
+            raise TypeError
+
+        assert not FilterPipeline([broken_filter]).is_filtered_out(('secret',), secret='value')
+
+
+def test_recompiled_when_filters_change():
+    pipeline = get_filter_pipeline()
+    assert get_filter_pipeline() is pipeline
+
+    get_settings().disable_filters('detect_secrets.filters.heuristic.is_sequential_string')
+    assert get_filter_pipeline() is not pipeline
+    assert 'detect_secrets.filters.heuristic.is_sequential_string' not in {
+        filter_fn.path
+        for filter_fn in get_filter_pipeline().filters
+    }
+
+
+def test_does_not_resolve_arguments_per_call():
+    pipeline = get_filter_pipeline()
+    pipeline.is_filtered_out(('secret',), filename='file', secret='value', line='line')
+
+    with mock.patch.object(pipeline, '_compile') as m:
+        pipeline.is_filtered_out(('secret',), filename='file', secret='other', line='line')
+        assert not m.called
@@ -0,0 +1,99 @@
+import os
+
+import pytest
+
+from detect_secrets.core.pool import ScanPool
+from detect_secrets.core.secrets_collection import SecretsCollection
+from detect_secrets.settings import transient_settings
+
+
+@pytest.fixture(autouse=True)
+def configure_plugins():
+    with transient_settings({
+        'plugins_used': [
+            {'name': 'AWSKeyDetector'},
+            {'name': 'Base64HighEntropyString', 'limit': 4.5},
+        ],
+    }):
+        yield
+
+
+@pytest.fixture
+def filenames():
+    return [
+        os.path.join('test_data', filename)
+        for filename in sorted(os.listdir('test_data'))
+        if os.path.isfile(os.path.join('test_data', filename))
+    ]
+
+
+class TestScanPool:
+    @staticmethod
+    def test_matches_serial_scan(filenames):
+        expected = SecretsCollection()
+        for filename in filenames:
+            expected.scan_file(filename)
+
+        with ScanPool(num_processors=2) as pool:
+            secrets = SecretsCollection()
+            secrets.scan_files(*filenames, pool=pool)
+
+        assert [secret.secret_value for _, secret in expected] == [
+            secret.secret_value for _, secret in secrets
+        ]
+        assert expected.exactly_equals(secrets)
+
+    @staticmethod
+    def test_reuses_workers_across_scans(filenames):
+        with ScanPool(num_processors=2) as pool:
+            SecretsCollection().scan_files(*filenames, pool=pool)
+            workers = pool._pool
+
+            SecretsCollection().scan_files(*filenames, pool=pool)
+            assert pool._pool is workers
+
+    @staticmethod
+    def test_restarts_workers_when_settings_change(filenames):
+        with ScanPool(num_processors=2) as pool:
+            first = SecretsCollection()
+            first.scan_files(*filenames, pool=pool)
+            workers = pool._pool
+
+            with transient_settings({'plugins_used': [{'name': 'AWSKeyDetector'}]}):
+                second = SecretsCollection()
+                second.scan_files(*filenames, pool=pool)
+                assert pool._pool is not workers
+
+        assert {secret.type for _, secret in first} == {
+            'AWS Access Key',
+            'Base64 High Entropy String',
+        }
+        assert {secret.type for _, secret in second} == {'AWS Access Key'}
+
+
+class TestGetChunks:
+    @staticmethod
+    def test_groups_small_files(filenames):
+        pool = ScanPool(num_processors=1)
+        pool.MAX_CHUNK_SIZE = 1024 * 1024 * 1024
+
+        chunks = pool._get_chunks(tuple(filenames))
+        assert 1 < len(chunks) <= pool.MIN_CHUNKS_PER_PROCESS + 1
+        assert sorted(filename for chunk in chunks for filename in chunk) == filenames
+
+    @staticmethod
+    def test_respects_max_chunk_size(filenames):
+        pool = ScanPool(num_processors=1)
+        pool.MAX_CHUNK_SIZE = 1
+
+        chunks = pool._get_chunks(tuple(filenames))
+        assert len(chunks) == len(filenames)
+
+    @staticmethod
+    def test_dispatches_larger_files_first(filenames):
+        pool = ScanPool(num_processors=1)
+        pool.MAX_CHUNK_SIZE = 1
+
+        chunks = pool._get_chunks(tuple(filenames))
+        sizes = [os.path.getsize(chunk[0]) for chunk in chunks]
+        assert sizes == sorted(sizes, reverse=True)
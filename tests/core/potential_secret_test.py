@@ -1,3 +1,6 @@
+import copy
+import pickle
+
 import pytest
 
 from detect_secrets.core.potential_secret import PotentialSecret
@@ -69,3 +72,30 @@ def test_stringify():
         'Secret Type: secret_type\n'
         'Location:    filename:1\n'
     )
+
+
+def test_has_no_instance_dict():
+    secret = potential_secret_factory()
+    assert not hasattr(secret, '__dict__')
+
+    with pytest.raises(AttributeError):
+        secret.unknown_attribute = True
+
+
+def test_interns_repeated_strings():
+    a = potential_secret_factory(type=''.join(['secret', '_type']), filename='file')
+    b = potential_secret_factory(type=''.join(['secret', '_type']), filename='file')
+
+    assert a.type is b.type
+
+
+@pytest.mark.parametrize('method', (copy.copy, lambda x: pickle.loads(pickle.dumps(x))))
+def test_copy(method):
+    secret = potential_secret_factory(is_secret=True, commit_hash='abc')
+    hash(secret)
+
+    new_secret = method(secret)
+    assert new_secret.json() == secret.json()
+    assert new_secret.secret_value == secret.secret_value
+    assert hash(new_secret) == hash(secret)
+    assert {secret} == {new_secret}
@@ -109,6 +109,27 @@ class TestScanFile:
                 assert not list(scan.scan_file(f.name))
                 assert not m.called
 
+    @staticmethod
+    @pytest.mark.parametrize(
+        'filename',
+        (
+            'test_data/config.yaml',
+            'test_data/config.ini',
+            'test_data/each_secret.py',
+        ),
+    )
+    def test_reads_file_once(filename):
+        with transient_settings({
+            'plugins_used': [
+                {'name': 'BasicAuthDetector'},
+                {'name': 'KeywordDetector'},
+                {'name': 'PrivateKeyDetector'},
+            ],
+        }), mock.patch('builtins.open', wraps=open) as m:
+            assert list(scan.scan_file(filename))
+
+        assert [call[0][0] for call in m.call_args_list].count(filename) == 1
+
     @staticmethod
     def test_multi_line_results_accuracy():
         file_name = 'test_data/scan_test_multiline.yaml'
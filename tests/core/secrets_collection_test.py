@@ -1,7 +1,10 @@
+import copy
+import pickle
 from unittest import mock
 
 import pytest
 
+from detect_secrets.core import baseline
 from detect_secrets.core.secrets_collection import SecretsCollection
 from detect_secrets.settings import get_settings
 from detect_secrets.settings import transient_settings
@@ -38,7 +41,7 @@ class TestScanFile:
     @staticmethod
     def test_error_reading_file(mock_log_warning):
         with mock.patch(
-            'detect_secrets.core.scan.open',
+            'detect_secrets.util.file_content.open',
             side_effect=IOError,
         ):
             SecretsCollection().scan_file('test_data/config.env')
@@ -169,6 +172,27 @@ class TestScanDiff:
             '.secrets.baseline',
         }
 
+    @staticmethod
+    def test_stream():
+        with transient_settings({
+            'plugins_used': [
+                {
+                    'name': 'HexHighEntropyString',
+                    'limit': 3,
+                },
+            ],
+            'filters_used': [],
+        }):
+            expected = SecretsCollection()
+            with open('test_data/sample.diff') as f:
+                expected.scan_diff(f.read())
+
+            secrets = SecretsCollection()
+            with open('test_data/sample.diff') as f:
+                secrets.scan_diff(f)
+
+        assert secrets == expected
+
 
 def test_merge():
     old_secrets = SecretsCollection()
@@ -320,6 +344,130 @@ def test_bool():
     assert not secrets
 
 
+class TestIteration:
+    @staticmethod
+    def test_order_is_cached():
+        secrets = SecretsCollection()
+        secrets.scan_file('test_data/each_secret.py')
+
+        with mock.patch(
+            'detect_secrets.core.secrets_collection.sorted',
+            side_effect=sorted,
+            create=True,
+        ) as mock_sorted:
+            assert list(secrets) == list(secrets)
+
+        # Once for the filenames, and once for the file's secrets. After that, only the file's
+        # (already sorted) secrets are sorted again.
+        assert mock_sorted.call_count == 3
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        'modify',
+        (
+            lambda secrets: secrets['blah'].add(potential_secret_factory(secret='b')),
+            lambda secrets: secrets['blah'].pop(),
+            lambda secrets: secrets.data.pop('blah'),
+            lambda secrets: secrets.trim(SecretsCollection(), filelist=['blah']),
+            lambda secrets: secrets.scan_file('test_data/each_secret.py'),
+            lambda secrets: secrets.__setitem__('other', {potential_secret_factory()}),
+            lambda secrets: setattr(secrets, 'data', {}),
+        ),
+    )
+    def test_order_is_invalidated_on_change(modify):
+        secrets = SecretsCollection()
+        secrets['blah'].add(potential_secret_factory(secret='a', line_number=2))
+        list(secrets)
+
+        modify(secrets)
+        expected = [
+            (filename, secret)
+            for filename in sorted(secrets.data)
+            for secret in sorted(
+                secrets.data[filename],
+                key=lambda secret: (secret.line_number, secret.secret_hash, secret.type),
+            )
+        ]
+        assert list(secrets) == expected
+        assert len(secrets) == len(expected)
+
+    @staticmethod
+    def test_line_number_changes_after_trim():
+        secrets = SecretsCollection.load_from_baseline({
+            'results': {
+                'blah': [
+                    potential_secret_factory(secret='a', line_number=1).json(),
+                    potential_secret_factory(secret='b', line_number=2).json(),
+                ],
+            },
+        })
+        assert [secret.line_number for _, secret in secrets] == [1, 2]
+
+        secrets.trim(
+            SecretsCollection.load_from_baseline({
+                'results': {
+                    'blah': [
+                        potential_secret_factory(secret='a', line_number=3).json(),
+                        potential_secret_factory(secret='b', line_number=2).json(),
+                    ],
+                },
+            }),
+        )
+        assert [secret.line_number for _, secret in secrets] == [2, 3]
+
+    @staticmethod
+    def test_line_number_changes_after_iteration():
+        secrets = SecretsCollection()
+        secrets['blah'].update({
+            potential_secret_factory(secret='a', line_number=1),
+            potential_secret_factory(secret='b', line_number=2),
+        })
+
+        for _, secret in secrets:
+            secret.line_number = 3 - secret.line_number
+
+        assert [secret.secret_value for _, secret in secrets] == ['b', 'a']
+
+    @staticmethod
+    def test_results_are_not_copied():
+        secrets = SecretsCollection()
+        results = {potential_secret_factory(secret='a', line_number=2)}
+        secrets['blah'] = results
+
+        assert secrets['blah'] is results
+
+    @staticmethod
+    def test_missing_files_are_stored():
+        secrets = SecretsCollection()
+        secret = potential_secret_factory()
+        secrets['blah'].add(secret)
+
+        assert list(secrets) == [('blah', secret)]
+        assert len(secrets) == 1
+
+
+@pytest.mark.parametrize(
+    'duplicate',
+    (
+        lambda secrets: pickle.loads(pickle.dumps(secrets)),
+        copy.deepcopy,
+    ),
+)
+def test_duplicate(duplicate):
+    secrets = SecretsCollection(root='root')
+    secrets['blah'].add(potential_secret_factory(secret='a', line_number=2))
+    list(secrets)
+
+    output = duplicate(secrets)
+    assert output.root == 'root'
+    assert list(output) == list(secrets)
+
+    # The duplicate's order is independent of the original.
+    output['blah'].add(potential_secret_factory(secret='b', line_number=1))
+    assert [secret.line_number for _, secret in output] == [1, 2]
+    assert [secret.line_number for _, secret in secrets] == [2]
+
+
 class TestEqual:
     @staticmethod
     def test_mismatch_files():
@@ -344,6 +492,17 @@ class TestEqual:
         assert secretsA == secretsB
         assert not secretsA.exactly_equals(secretsB)
 
+    @staticmethod
+    def test_strict_equality_ignores_secret_value():
+        secretsA = SecretsCollection()
+        secretsA.scan_file('test_data/each_secret.py')
+
+        secretsB = baseline.load(baseline.format_for_output(secretsA))
+        assert secretsA.exactly_equals(secretsB)
+
+        # Comparing them shouldn't affect them either.
+        assert all(secret.secret_value for _, secret in secretsA)
+
 
 class TestSubtraction:
     @staticmethod
@@ -0,0 +1,332 @@
+import os
+import re
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from unittest import mock
+
+import pytest
+import requests
+
+from detect_secrets.constants import VerifiedResult
+from detect_secrets.core.scan import scan_file
+from detect_secrets.core.secrets_collection import SecretsCollection
+from detect_secrets.core.usage import ParserBuilder
+from detect_secrets.core.verification import defer_verification
+from detect_secrets.core.verification import get_verification_cache
+from detect_secrets.core.verification import verify_secret
+from detect_secrets.core.verification import verify_secrets
+from detect_secrets.plugins.base import RegexBasedDetector
+from detect_secrets.settings import get_settings
+from detect_secrets.settings import transient_settings
+from detect_secrets.util.code_snippet import CodeSnippet
+from detect_secrets.util.http import get_session
+from detect_secrets.util.http import MAX_CONNECTIONS_PER_HOST
+from testing.plugins import register_plugin
+
+
+class MockPlugin(RegexBasedDetector):
+    denylist = (
+        # We use a hex string here, due to the gibberish detector.
+        re.compile('deadbeef'),
+    )
+    secret_type = 'mock plugin'
+
+    def __init__(self):
+        self.calls = []
+
+    def verify(self, secret):
+        self.calls.append(secret)
+        return VerifiedResult.VERIFIED_TRUE
+
+
+class ContextAwareMockPlugin(MockPlugin):
+    def verify(self, secret, context):
+        return super().verify(secret)
+
+
+class NumberedMockPlugin(MockPlugin):
+    denylist = (
+        re.compile(r'deadbeef\d'),
+    )
+
+
+class ExceptionRaisingMockPlugin(MockPlugin):
+    def verify(self, secret):
+        self.calls.append(secret)
+        raise requests.exceptions.ConnectionError
+
+
+class BrokenMockPlugin(MockPlugin):
+    def verify(self, secret):
+        self.calls.append(secret)
+        raise ValueError
+
+
+class RemoteMockPlugin(NumberedMockPlugin):
+    def __init__(self, url):
+        super().__init__()
+        self.url = url
+
+    def verify(self, secret):
+        self.calls.append(secret)
+        response = get_session().get(f'{self.url}/{secret}')
+        if response.status_code == 200:
+            return VerifiedResult.VERIFIED_TRUE
+
+        return VerifiedResult.VERIFIED_FALSE
+
+
+class StubServer(ThreadingHTTPServer):
+    """Secrets ending with an even digit are valid."""
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), StubHandler)
+
+        self.url = f'http://127.0.0.1:{self.server_address[1]}'
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        # This is set once requests overlap.
+        self.overlapped = threading.Event()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(self.server.max_in_flight, self.server.in_flight)
+            if self.server.in_flight > 1:
+                self.server.overlapped.set()
+
+        # Requests are held until another one arrives, so that they are guaranteed to overlap
+        # (if they are sent concurrently). Otherwise, this eventually times out.
+        self.server.overlapped.wait(timeout=5)
+
+        with self.server.lock:
+            self.server.in_flight -= 1
+
+        self.send_response(200 if int(self.path[-1]) % 2 == 0 else 401)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def directory():
+    with tempfile.TemporaryDirectory() as d:
+        yield d
+
+
+@pytest.fixture
+def server(mocked_requests):
+    server = StubServer()
+    mocked_requests.add_passthru(server.url)
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_shared_between_plugins_and_filters(directory):
+    filename = os.path.join(directory, 'file.py')
+    with open(filename, 'w') as f:
+        f.write('deadbeef\ndeadbeef\n')
+
+    plugin = MockPlugin()
+    with register_plugin(plugin), transient_settings({
+        'plugins_used': [{'name': 'MockPlugin'}],
+        'filters_used': [{
+            'path': 'detect_secrets.filters.common.is_ignored_due_to_verification_policies',
+            'min_level': VerifiedResult.VERIFIED_TRUE.value,
+        }],
+    }):
+        secrets = SecretsCollection()
+        secrets.scan_file(filename)
+        secrets.scan_file(filename)
+
+    assert [secret.is_verified for _, secret in secrets] == [True]
+    assert plugin.calls == ['deadbeef']
+
+
+class TestBatchVerification:
+    @staticmethod
+    def test_verified_concurrently(directory, server):
+        filename = os.path.join(directory, 'file.py')
+        with open(filename, 'w') as f:
+            f.write('\n'.join(f'deadbeef{i}' for i in [*range(8), 0]))
+
+        plugin = RemoteMockPlugin(server.url)
+        with register_plugin(plugin), transient_settings({
+            'plugins_used': [{'name': 'RemoteMockPlugin'}],
+            'filters_used': [{
+                'path': 'detect_secrets.filters.common.is_ignored_due_to_verification_policies',
+                'min_level': VerifiedResult.UNVERIFIED.value,
+            }],
+        }):
+            secrets = SecretsCollection()
+            secrets.scan_file(filename)
+
+        # Secrets that failed verification are filtered out.
+        assert [
+            (secret.line_number, secret.is_verified)
+            for _, secret in secrets
+        ] == [(1, True), (3, True), (5, True), (7, True)]
+        assert sorted(plugin.calls) == [f'deadbeef{i}' for i in range(8)]
+        assert 1 < server.max_in_flight <= MAX_CONNECTIONS_PER_HOST
+
+    @staticmethod
+    def test_secrets_are_reported_in_batches(directory):
+        filename = os.path.join(directory, 'file.py')
+        with open(filename, 'w') as f:
+            f.write('\n'.join(f'deadbeef{i}' for i in range(5)))
+
+        plugin = NumberedMockPlugin()
+        with register_plugin(plugin), transient_settings({
+            'plugins_used': [{'name': 'NumberedMockPlugin'}],
+            'filters_used': [{
+                'path': 'detect_secrets.filters.common.is_ignored_due_to_verification_policies',
+                'min_level': VerifiedResult.UNVERIFIED.value,
+            }],
+        }), mock.patch('detect_secrets.core.scan.BATCH_SIZE', 2):
+            secrets = scan_file(filename)
+
+            # The first secrets are reported before the rest of the file is scanned.
+            assert next(secrets).is_verified
+            assert plugin.calls == ['deadbeef0', 'deadbeef1']
+
+            assert len(list(secrets)) == 4
+            assert plugin.calls == [f'deadbeef{i}' for i in range(5)]
+
+    @staticmethod
+    def test_results_are_deferred():
+        plugin = MockPlugin()
+        with defer_verification() as pending:
+            assert verify_secret(plugin, 'deadbeef') == VerifiedResult.UNVERIFIED
+            assert not plugin.calls
+
+        verify_secrets(pending)
+        assert plugin.calls == ['deadbeef']
+
+        assert verify_secret(plugin, 'deadbeef') == VerifiedResult.VERIFIED_TRUE
+        assert plugin.calls == ['deadbeef']
+
+    @staticmethod
+    def test_request_errors_are_unverified():
+        plugin = ExceptionRaisingMockPlugin()
+        with defer_verification() as pending:
+            verify_secret(plugin, 'deadbeef')
+
+        verify_secrets(pending)
+        assert verify_secret(plugin, 'deadbeef') == VerifiedResult.UNVERIFIED
+        assert plugin.calls == ['deadbeef']
+
+    @staticmethod
+    def test_other_errors_are_raised():
+        plugin = BrokenMockPlugin()
+        with defer_verification() as pending:
+            verify_secret(plugin, 'deadbeef')
+
+        verify_secrets(pending)
+        with pytest.raises(ValueError):
+            verify_secret(plugin, 'deadbeef')
+
+        assert plugin.calls == ['deadbeef', 'deadbeef']
+
+
+class TestVerifySecret:
+    @staticmethod
+    def test_keyed_by_secret():
+        plugin = MockPlugin()
+        verify_secret(plugin, 'deadbeef')
+        verify_secret(plugin, 'deadbeef')
+        verify_secret(plugin, 'deadbeef0')
+
+        assert plugin.calls == ['deadbeef', 'deadbeef0']
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        'plugin, expected_calls',
+        (
+            # Context only matters if the plugin depends on it.
+            (MockPlugin(), 1),
+            (ContextAwareMockPlugin(), 2),
+        ),
+    )
+    def test_keyed_by_relevant_context(plugin, expected_calls):
+        for lines in (['a', 'deadbeef'], ['b', 'deadbeef'], ['b', 'deadbeef']):
+            verify_secret(plugin, 'deadbeef', context=CodeSnippet(lines, 0, 1))
+
+        assert len(plugin.calls) == expected_calls
+
+    @staticmethod
+    def test_request_errors_are_not_cached():
+        plugin = ExceptionRaisingMockPlugin()
+        for _ in range(2):
+            with pytest.raises(requests.exceptions.ConnectionError):
+                verify_secret(plugin, 'deadbeef')
+
+        assert len(plugin.calls) == 2
+
+
+class TestVerificationCache:
+    @staticmethod
+    def test_shared_across_runs(directory):
+        get_verification_cache().configure(directory)
+        assert verify_secret(MockPlugin(), 'deadbeef') == VerifiedResult.VERIFIED_TRUE
+
+        # This simulates a subsequent run.
+        get_verification_cache.cache_clear()
+        get_verification_cache().configure(directory)
+
+        plugin = MockPlugin()
+        assert verify_secret(plugin, 'deadbeef') == VerifiedResult.VERIFIED_TRUE
+        assert not plugin.calls
+
+    @staticmethod
+    def test_expired_results(directory):
+        get_verification_cache().configure(directory, ttl=60)
+        with mock.patch('detect_secrets.core.verification.time.time', return_value=1000):
+            verify_secret(MockPlugin(), 'deadbeef')
+
+        get_verification_cache.cache_clear()
+        get_verification_cache().configure(directory, ttl=60)
+
+        plugin = MockPlugin()
+        with mock.patch('detect_secrets.core.verification.time.time', return_value=1061):
+            verify_secret(plugin, 'deadbeef')
+
+        assert plugin.calls == ['deadbeef']
+
+    @staticmethod
+    def test_corrupted_entry(directory, mock_log_warning):
+        cache = get_verification_cache().configure(directory)
+        cache.storage.set('key', b'not json')
+
+        assert cache.get('key') is None
+        assert 'Ignoring corrupted verification cache entry: key' in (
+            mock_log_warning.warning_messages
+        )
+
+
+def test_configured_through_arguments(directory):
+    ParserBuilder().add_pre_commit_arguments().parse_args([
+        '--verification-cache-dir', directory,
+        '--verification-cache-ttl', '10',
+    ])
+
+    assert get_verification_cache().json() == {
+        'directory': directory,
+        'ttl': 10,
+    }
+    assert 'verification_cache' not in get_settings().json()
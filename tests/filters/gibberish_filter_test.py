@@ -1,4 +1,5 @@
 import os
+from unittest import mock
 
 import pytest
 
@@ -48,6 +49,25 @@ class TestShouldExcludeSecret:
             plugin=PrivateKeyDetector(),
         )
 
+    @staticmethod
+    def test_verdicts_are_memoized():
+        with mock.patch.object(
+            filters.gibberish.get_detector(),
+            'is_gibberish',
+            return_value=False,
+        ) as mock_is_gibberish:
+            assert filters.gibberish.should_exclude_secret('clearly-not-a-secret')
+            assert filters.gibberish.should_exclude_secret('CLEARLY-not-a-secret')
+
+        mock_is_gibberish.assert_called_once_with('clearly-not-a-secret')
+
+    @staticmethod
+    def test_initialize_resets_verdicts():
+        assert filters.gibberish.should_exclude_secret('clearly-not-a-secret')
+
+        filters.gibberish.initialize(limit=0)
+        assert not filters.gibberish.should_exclude_secret('clearly-not-a-secret')
+
 
 def test_load_from_baseline():
     with transient_settings({
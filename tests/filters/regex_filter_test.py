@@ -1,9 +1,14 @@
+import re
+from unittest import mock
+
 import pytest
 
 from detect_secrets import filters
 from detect_secrets.core.usage import ParserBuilder
+from detect_secrets.filters.util import compile_patterns
 from detect_secrets.settings import default_settings
 from detect_secrets.settings import get_settings
+from detect_secrets.settings import transient_settings
 
 
 @pytest.fixture
@@ -102,3 +107,71 @@ def test_cache_should_be_cleared_with_different_settings(parser):
     # when trying to obtain the patterns.
     with pytest.raises(KeyError):
         assert filters.regex.should_exclude_line('abcde')
+
+
+class TestCompilePatterns:
+    @staticmethod
+    def test_literals_are_combined():
+        regexes = compile_patterns(('canarytoken', 'not-real-secret', '^[0-9]+$', '^[0-9]+$'))
+        assert len(regexes) == 2
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        'patterns',
+        (
+            ('abc', 'abd', 'ab', 'b', 'x y', 'a-c'),
+            ('abc', ''),
+            ('a.c', '^ab', '[xy]{2}', '(?i)AB', 'bc'),
+        ),
+    )
+    def test_matches_any_pattern(patterns):
+        regexes = compile_patterns(patterns)
+        for string in ('', 'a', 'ab', 'xabx', 'abd', 'aBd', 'x yz', 'a-c', 'abc', 'axc', 'yx'):
+            assert (
+                any(regex.search(string) for regex in regexes)
+                == any(re.search(pattern, string) for pattern in patterns)
+            )
+
+    @staticmethod
+    def test_long_literals():
+        # This is longer than the recursion limit.
+        pattern = 'a' * 2000 + 'b'
+        regexes = compile_patterns((pattern, pattern[:-1] + 'c'))
+
+        assert any(regex.search(pattern) for regex in regexes)
+        assert not any(regex.search(pattern[:-1]) for regex in regexes)
+
+    @staticmethod
+    def test_survives_cache_bust(parser):
+        parser.parse_args(['--exclude-lines', 'abcde'])
+        assert filters.regex.should_exclude_line('abcde') is True
+
+        misses = compile_patterns.cache_info().misses
+        with transient_settings(get_settings().json()):
+            assert filters.regex.should_exclude_line('abcde') is True
+
+        assert compile_patterns.cache_info().misses == misses
+
+
+def test_file_decisions_are_memoized(parser):
+    parser.parse_args(['--exclude-files', '^tests/.*'])
+    assert filters.regex.should_exclude_file('tests/blah.py') is True
+
+    hits = filters.regex._should_exclude_file.cache_info().hits
+    assert filters.regex.should_exclude_file('tests/blah.py') is True
+    assert filters.regex._should_exclude_file.cache_info().hits == hits + 1
+
+
+def test_file_decisions_depend_on_patterns(parser):
+    parser.parse_args(['--exclude-files', '^tests/.*'])
+    assert filters.regex.should_exclude_file('tests/blah.py') is True
+
+    # Even if the memoized decisions aren't cleared, they aren't used for other patterns.
+    with mock.patch('detect_secrets.filters.regex._should_exclude_file.cache_clear'):
+        with transient_settings({
+            'filters_used': [{
+                'path': 'detect_secrets.filters.regex.should_exclude_file',
+                'pattern': ['^other/.*'],
+            }],
+        }):
+            assert filters.regex.should_exclude_file('tests/blah.py') is False
@@ -1,9 +1,11 @@
 from pathlib import Path
+from unittest import mock
 
 import pytest
 
 from detect_secrets import filters
 from detect_secrets.filters.util import compute_file_hash
+from detect_secrets.settings import configure_settings_from_baseline
 from detect_secrets.settings import get_settings
 from detect_secrets.settings import transient_settings
 
@@ -51,3 +53,46 @@ def test_load_from_baseline():
         }],
     }):
         assert filters.wordlist.should_exclude_secret('testPass') is True
+
+
+class TestReinitialize:
+    @staticmethod
+    def test_automaton_is_reused():
+        automaton = filters.wordlist.initialize('test_data/word_list.txt', min_length=8)
+
+        with mock.patch('detect_secrets.filters.wordlist.open') as mock_open:
+            assert filters.wordlist.initialize('test_data/word_list.txt', min_length=8) is automaton
+
+            # This is how scan workers are configured, after inheriting the parent's state.
+            get_settings().clear()
+            configure_settings_from_baseline({
+                'filters_used': [{
+                    'path': 'detect_secrets.filters.wordlist.should_exclude_secret',
+                    'min_length': 8,
+                    'file_name': 'test_data/word_list.txt',
+                    'file_hash': 'stale',
+                }],
+            })
+            assert filters.wordlist.get_automaton() is automaton
+
+        assert not mock_open.called
+
+    @staticmethod
+    def test_keyed_by_min_length():
+        filters.wordlist.initialize('test_data/word_list.txt', min_length=8)
+        filters.wordlist.initialize('test_data/word_list.txt', min_length=9)
+
+        assert filters.wordlist.should_exclude_secret('testPass') is False
+        assert filters.wordlist.should_exclude_secret('AKIAnotreal') is True
+
+    @staticmethod
+    def test_keyed_by_file_hash(tmp_path):
+        wordlist = tmp_path / 'wordlist.txt'
+        wordlist.write_text('password\n')
+        filters.wordlist.initialize(str(wordlist))
+
+        wordlist.write_text('something\n')
+        filters.wordlist.initialize(str(wordlist))
+
+        assert filters.wordlist.should_exclude_secret('password') is False
+        assert filters.wordlist.should_exclude_secret('something') is True
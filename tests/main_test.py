@@ -12,9 +12,12 @@ import pytest
 
 from detect_secrets import main as main_module
 from detect_secrets.core import baseline
+from detect_secrets.core.scan import scan_commit
 from detect_secrets.core.secrets_collection import SecretsCollection
 from detect_secrets.main import scan_adhoc_string
+from detect_secrets.settings import get_settings
 from detect_secrets.settings import transient_settings
+from detect_secrets.util import git
 from testing.mocks import disable_gibberish_filter
 from testing.mocks import mock_named_temporary_file
 from testing.mocks import mock_printer
@@ -116,6 +119,233 @@ class TestSlimScan:
             assert list(secrets[file_b])[0].line_number
 
 
+class TestIncrementalScan:
+    @staticmethod
+    def test_only_rescans_changed_files(repository, baseline_file):
+        main_module.main(['-C', repository, 'scan', '--baseline', baseline_file])
+
+        with open(baseline_file) as f:
+            old_baseline = json.loads(f.read())
+
+        assert old_baseline['revision'] == _git(repository, 'rev-parse', 'HEAD')
+        assert set(old_baseline['results']) == {'a.py', 'b.py', 'd.py'}
+
+        # This allows us to verify that unchanged files are carried over, rather than rescanned.
+        old_baseline['results']['d.py'][0]['is_secret'] = True
+        old_baseline['results']['d.py'].append({
+            **old_baseline['results']['d.py'][0],
+            'hashed_secret': 'not rescanned',
+        })
+        with open(baseline_file, 'w') as f:
+            f.write(json.dumps(old_baseline))
+
+        os.remove(os.path.join(repository, 'a.py'))
+        with open(os.path.join(repository, 'b.py'), 'w') as f:
+            f.write('nothing to see here\n')
+        with open(os.path.join(repository, 'c.py'), 'w') as f:
+            f.write('secret = "asxeqFLAGMEfxuwma!"\n')
+        _git(repository, 'add', 'c.py')
+
+        main_module.main(['-C', repository, 'scan', '--baseline', baseline_file, '--since'])
+
+        with open(baseline_file) as f:
+            new_baseline = json.loads(f.read())
+
+        assert set(new_baseline['results']) == {'c.py', 'd.py'}
+        assert new_baseline['results']['d.py'] == old_baseline['results']['d.py']
+
+    @staticmethod
+    def test_all_files(repository, baseline_file):
+        main_module.main(['-C', repository, 'scan', '--baseline', baseline_file])
+
+        with open(os.path.join(repository, '.gitignore'), 'w') as f:
+            f.write('e.py\n')
+        with open(os.path.join(repository, 'e.py'), 'w') as f:
+            f.write('secret = "asxeqFLAGMEfxuwma!"\n')
+
+        main_module.main([
+            '-C', repository,
+            'scan', '--baseline', baseline_file, '--since', '--all-files',
+        ])
+        with open(baseline_file) as f:
+            results = json.loads(f.read())['results']
+
+        # This should be consistent with a full scan.
+        with mock_printer(main_module) as printer:
+            main_module.main(['-C', repository, 'scan', '--all-files'])
+
+        assert set(results) == set(json.loads(printer.message)['results']) == {
+            'a.py', 'b.py', 'd.py', 'e.py',
+        }
+
+    @staticmethod
+    def test_falls_back_to_full_scan(repository, baseline_file):
+        main_module.main([
+            '-C', repository,
+            'scan', '--baseline', baseline_file, '--since', 'invalid-revision',
+        ])
+
+        with open(baseline_file) as f:
+            assert set(json.loads(f.read())['results']) == {'a.py', 'b.py', 'd.py'}
+
+    @staticmethod
+    def test_requires_recorded_revision(baseline_file):
+        with pytest.raises(SystemExit):
+            main_module.main(['scan', '--baseline', baseline_file, '--since'])
+
+    @staticmethod
+    def test_requires_baseline():
+        with pytest.raises(SystemExit):
+            main_module.main(['scan', '--since', 'HEAD'])
+
+    @staticmethod
+    @pytest.fixture
+    def repository():
+        with tempfile.TemporaryDirectory() as d:
+            _git(d, 'init')
+            for filename in ['a.py', 'b.py', 'd.py']:
+                with open(os.path.join(d, filename), 'w') as f:
+                    f.write(f'secret = "{filename}-asxeqFLAGMEfxuwma!"\n')
+
+            _git(d, 'add', '.')
+            _git(d, '-c', 'user.name=test', '-c', 'user.email=test@example.com', 'commit', '-m', '.')
+
+            yield d
+
+    @staticmethod
+    @pytest.fixture
+    def baseline_file():
+        with transient_settings({'plugins_used': [{'name': 'KeywordDetector'}]}):
+            old_secrets = baseline.format_for_output(SecretsCollection())
+
+        with mock_named_temporary_file() as f:
+            baseline.save_to_file(old_secrets, f.name)
+            yield f.name
+
+
+class TestHistoryScan:
+    @staticmethod
+    def test_finds_secrets_in_history(repository):
+        first_commit = _commit(repository, {'a.py': 'first'})
+        second_commit = _commit(repository, {'a.py': None, 'b.py': 'second'})
+        _commit(repository, {'a.py': 'first'})
+
+        with mock_printer(main_module) as printer:
+            main_module.main(['-C', repository, 'scan', '--history'])
+
+        output = json.loads(printer.message)
+        assert output['history_revision'] == _git(repository, 'rev-parse', 'HEAD')
+        assert {
+            filename: {secret['commit_hash'] for secret in secrets}
+            for filename, secrets in output['results'].items()
+        } == {
+            # Even though this file was deleted, and later re-added.
+            'a.py': {first_commit},
+            'b.py': {second_commit},
+        }
+
+    @staticmethod
+    def test_resumes_from_baseline(repository):
+        first_commit = _commit(repository, {'a.py': 'first'})
+        with mock_named_temporary_file() as f:
+            with mock_printer(main_module) as printer:
+                main_module.main(['-C', repository, 'scan', '--history'])
+
+            f.write(printer.message.encode())
+            f.seek(0)
+
+            second_commit = _commit(repository, {'a.py': 'second', 'b.py': 'first'})
+            with mock.patch(
+                'detect_secrets.core.scan.git.get_commit_diff',
+                wraps=git.get_commit_diff,
+            ) as m:
+                main_module.main([
+                    '-C', repository, 'scan', '--history', '--baseline', f.name,
+                ])
+
+            assert m.call_args_list == [mock.call(second_commit, path=repository)]
+
+            with open(f.name) as g:
+                output = json.loads(g.read())
+
+        assert output['history_revision'] == second_commit
+        assert {
+            filename: {secret['commit_hash'] for secret in secrets}
+            for filename, secrets in output['results'].items()
+        } == {
+            'a.py': {first_commit, second_commit},
+            'b.py': {second_commit},
+        }
+
+    @staticmethod
+    def test_requires_history_baseline(repository):
+        _commit(repository, {'a.py': 'first'})
+        with mock_named_temporary_file() as f:
+            with mock_printer(main_module) as printer:
+                main_module.main(['-C', repository, 'scan'])
+
+            f.write(printer.message.encode())
+            f.seek(0)
+
+            with pytest.raises(SystemExit):
+                main_module.main(['-C', repository, 'scan', '--history', '--baseline', f.name])
+
+            with open(f.name) as g:
+                assert g.read() == printer.message
+
+    @staticmethod
+    def test_settings_are_only_changed_while_scanning(repository):
+        commit = _commit(repository, {'a.py': 'first'})
+        with transient_settings({'plugins_used': [{'name': 'KeywordDetector'}]}):
+            secrets = scan_commit(commit, root=repository)
+            assert next(secrets)
+
+            # The caller may run any code before resuming (or even abandoning) the scan.
+            assert 'detect_secrets.filters.common.is_invalid_file' in get_settings().filters
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        'flag',
+        (
+            '--since',
+            '--only-allowlisted',
+        ),
+    )
+    def test_incompatible_flags(flag):
+        with pytest.raises(SystemExit):
+            main_module.main(['scan', '--history', flag])
+
+    @staticmethod
+    @pytest.fixture
+    def repository():
+        with tempfile.TemporaryDirectory() as d:
+            _git(d, 'init')
+            yield d
+
+
+def _commit(repository, files):
+    """
+    :param files: mapping of filenames to the secret they should contain. If None, the file
+        will be deleted.
+    :returns: the commit hash
+    """
+    for filename, secret in files.items():
+        path = os.path.join(repository, filename)
+        if secret is None:
+            os.remove(path)
+        else:
+            with open(path, 'w') as f:
+                f.write(f'secret = "{secret}-Zq8wPx2mKv7LtR4n"\n')
+
+    _git(repository, 'add', '--all')
+    _git(repository, '-c', 'user.name=test', '-c', 'user.email=test@example.com', 'commit', '-m', '.')
+    return _git(repository, 'rev-parse', 'HEAD')
+
+
+def _git(repository, *args):
+    return subprocess.check_output(['git', '-C', repository, *args]).decode().strip()
+
+
 class TestScanString:
     @staticmethod
     def test_basic():
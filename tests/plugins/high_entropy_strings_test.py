@@ -1,3 +1,6 @@
+import math
+import random
+
 import pytest
 
 from detect_secrets.plugins.high_entropy_strings import Base64HighEntropyString
@@ -139,3 +142,27 @@ class TestHexEntropyCalculation:
             HexHighEntropyString().calculate_shannon_entropy(value)
             == original_hex_detector().calculate_shannon_entropy(value)
         )
+
+
+@pytest.mark.parametrize('plugin', (Base64HighEntropyString, HexHighEntropyString))
+def test_entropy_matches_reference_implementation(plugin):
+    def calculate_shannon_entropy(data, charset):
+        entropy = 0.0
+        for x in charset:
+            p_x = float(data.count(x)) / len(data)
+            if p_x > 0:
+                entropy += - p_x * math.log(p_x, 2)
+
+        return entropy
+
+    detector = plugin()
+    generator = random.Random(0)
+    for length in range(1, 200):
+        value = ''.join(generator.choice(detector.charset + '!@ ') for _ in range(length))
+
+        # We compare these exactly, since a difference in rounding can change whether
+        # a secret is found.
+        assert HighEntropyStringsPlugin.calculate_shannon_entropy(
+            detector,
+            value,
+        ) == calculate_shannon_entropy(value, detector.charset)
@@ -1,9 +1,12 @@
 import base64
 from random import randint
+from unittest import mock
 
 import pytest
 
 from detect_secrets.core.scan import scan_line
+from detect_secrets.plugins.keyword import DENYLIST
+from detect_secrets.plugins.keyword import DENYLIST_KEYWORDS
 from detect_secrets.plugins.keyword import KeywordDetector
 from detect_secrets.settings import transient_settings
 
@@ -231,6 +234,31 @@ def test_keyword(file_extension, line, expected_secret):
         assert not secrets
 
 
+def test_denylist_keywords():
+    # If this fails, the keyword gate would hide secrets matched by this DENYLIST entry.
+    for entry in DENYLIST:
+        assert any(keyword in entry for keyword in DENYLIST_KEYWORDS), entry
+
+
+@pytest.mark.parametrize(
+    'line, is_gated',
+    (
+        ('x = "hello world"', True),
+        ('PASSWORD = "hello world"', False),
+        ('ſecret = "hello world"', False),
+    ),
+)
+def test_keyword_gate(line, is_gated):
+    with mock.patch(
+        'detect_secrets.plugins.keyword.QUOTES_REQUIRED_DENYLIST_REGEX_TO_GROUP',
+        {mock.Mock(): 0},
+    ) as denylist:
+        list(KeywordDetector().analyze_string(line))
+
+    regex = list(denylist)[0]
+    assert regex.search.called is not is_gated
+
+
 @pytest.fixture(autouse=True)
 def use_keyword_detector():
     with transient_settings({
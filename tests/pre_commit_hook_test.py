@@ -205,6 +205,43 @@ class TestLineNumberChanges:
                 f.name,
             ])
 
+    @pytest.mark.parametrize('suffix', ('', '.db'))
+    def test_only_modifies_affected_files(self, modified_baseline, suffix):
+        modified_baseline.scan_file('test_data/each_secret.py')
+        with mock_named_temporary_file(suffix=suffix) as f:
+            data = baseline.format_for_output(modified_baseline)
+            data['revision'] = 'abc'
+            baseline.save_to_file(data, f.name)
+
+            with mock.patch(
+                'detect_secrets.core.baseline.load_from_file',
+                wraps=baseline.load_from_file,
+            ) as m:
+                assert_commit_blocked_with_diff_exit_code([
+                    self.FILENAME,
+                    '--baseline',
+                    f.name,
+                ])
+
+            # Only the results for the checked files were loaded for comparison.
+            assert m.call_args_list[0] == mock.call(
+                f.name,
+                filenames=[self.FILENAME],
+                stream_results=True,
+            )
+
+            new_data = baseline.load_from_file(f.name)
+
+        assert new_data['revision'] == 'abc'
+        assert list(new_data['results']) == list(data['results'])
+        assert new_data['results']['test_data/each_secret.py'] == (
+            data['results']['test_data/each_secret.py']
+        )
+        assert [secret['line_number'] for secret in new_data['results'][self.FILENAME]] == [
+            secret['line_number'] - 1
+            for secret in data['results'][self.FILENAME]
+        ]
+
     @pytest.fixture
     def modified_baseline(self):
         secrets = SecretsCollection()
@@ -1,5 +1,6 @@
 import configparser
 import textwrap
+from unittest import mock
 
 import pytest
 
@@ -187,6 +188,54 @@ def test_not_ini_file(content):
         list(IniFileParser(file))
 
 
+@pytest.mark.parametrize(
+    'content, add_header',
+    (
+        ('import os\n[section]\nkey = value\n', False),
+        ('key = value\n[section]\n', False),
+        ('[section]\nkey = value\nnot an option\n', False),
+        ('key = value\nnot an option\n', True),
+    ),
+)
+def test_rules_out_non_config_files(content, add_header):
+    with mock.patch.object(configparser.ConfigParser, 'read_string') as m:
+        with pytest.raises(configparser.Error):
+            IniFileParser(mock_file_object(content), add_header=add_header)
+
+    assert not m.called
+
+
+def test_value_starting_with_separator():
+    file = mock_file_object(
+        textwrap.dedent("""
+            [section]
+            key =:value
+            other = :=value
+        """)[1:-1],
+    )
+
+    assert list(IniFileParser(file)) == [
+        ('key', ':value', 2),
+        ('other', ':=value', 3),
+    ]
+
+
+def test_large_file():
+    file = mock_file_object(
+        '[section]\n' + ''.join(
+            f'key{i} = value{i}\n    continued{i}\n'
+            for i in range(10000)
+        ),
+    )
+
+    values = list(IniFileParser(file))
+    assert len(values) == 20000
+    assert values[-2:] == [
+        ('key9999', 'value9999', 20000),
+        ('key9999', 'continued9999', 20001),
+    ]
+
+
 def test_add_header():
     file = mock_file_object(
         textwrap.dedent("""
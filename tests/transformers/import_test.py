@@ -1,4 +1,8 @@
+import pytest
+
 from detect_secrets.transformers import get_transformers
+from detect_secrets.transformers import get_transformers_for_file_type
+from detect_secrets.util.filetype import FileType
 
 
 def test_success():
@@ -11,3 +15,22 @@ def test_success():
         'EagerConfigFileTransformer',
         'YAMLTransformer',
     }
+
+
+@pytest.mark.parametrize(
+    'file_type, use_eager_transformers, expected',
+    (
+        (FileType.YAML, False, {'ConfigFileTransformer', 'YAMLTransformer'}),
+        (FileType.PYTHON, False, {'ConfigFileTransformer'}),
+        (FileType.PYTHON, True, set()),
+        (FileType.OTHER, True, {'EagerConfigFileTransformer'}),
+    ),
+)
+def test_get_transformers_for_file_type(file_type, use_eager_transformers, expected):
+    assert {
+        transformer.__class__.__name__
+        for transformer in get_transformers_for_file_type(
+            file_type,
+            use_eager_transformers=use_eager_transformers,
+        )
+    } == expected
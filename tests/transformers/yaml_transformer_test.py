@@ -3,6 +3,8 @@ from unittest import mock
 
 import pytest
 
+from detect_secrets.transformers.yaml import LibYAMLFileParser
+from detect_secrets.transformers.yaml import UnsupportedYAMLError
 from detect_secrets.transformers.yaml import YAMLFileParser
 from detect_secrets.transformers.yaml import YAMLTransformer
 from testing.mocks import mock_file_object
@@ -122,6 +124,69 @@ class TestYAMLTransformer:
         ]
 
 
+@pytest.mark.skipif(
+    not LibYAMLFileParser.is_supported(),
+    reason='PyYAML was built without LibYAML',
+)
+class TestLibYAMLFileParser:
+    @staticmethod
+    @pytest.mark.parametrize(
+        'filename',
+        (
+            'test_data/config.yaml',
+            'test_data/config2.yaml',
+            'test_data/only_comments.yaml',
+            'test_data/scan_test_multiline.yaml',
+            'test_data/short_files/middle_line.yml',
+        ),
+    )
+    def test_same_as_yaml_file_parser(filename):
+        with open(filename) as f:
+            expected = list(YAMLFileParser(f))
+
+        with open(filename) as f:
+            assert sorted(LibYAMLFileParser(f), key=lambda x: x.line_number) == sorted(
+                expected,
+                key=lambda x: x.line_number,
+            )
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        'content',
+        (
+            # Flow mappings
+            'a: {b: "2"}\n',
+
+            # Aliases
+            'a: &anchor value\nb: *anchor\n',
+            'base: &anchor\n    a: "1"\nother:\n    <<: *anchor\n',
+
+            # Duplicate keys
+            'a: "1"\na: "2"\n',
+
+            # Complex keys
+            '? a\n: "1"\n',
+        ),
+    )
+    def test_unsupported(content):
+        with pytest.raises(UnsupportedYAMLError):
+            list(LibYAMLFileParser(mock_file_object(content)))
+
+    @staticmethod
+    def test_falls_back_to_yaml_file_parser():
+        content = 'a: &anchor value\nb: *anchor\n'
+        with mock.patch.object(LibYAMLFileParser, 'is_supported', return_value=False):
+            expected = YAMLTransformer().parse_file(mock_file_object(content))
+
+        with mock.patch(
+            'detect_secrets.transformers.yaml.YAMLFileParser',
+            wraps=YAMLFileParser,
+        ) as m:
+            assert YAMLTransformer().parse_file(mock_file_object(content)) == expected
+
+        assert m.called
+
+
 class TestYAMLFileParser:
     @staticmethod
     def test_basic():
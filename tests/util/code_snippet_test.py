@@ -1,5 +1,6 @@
 import pytest
 
+from detect_secrets.util.code_snippet import CodeSnippet
 from detect_secrets.util.code_snippet import get_code_snippet
 
 
@@ -24,3 +25,32 @@ def test_target_line():
 
 def test_previous_line():
     assert get_code_snippet(list('abcde'), 3, lines_of_context=2).previous_line == 'b'
+
+
+@pytest.mark.parametrize('num_lines', (1, 3, 12))
+def test_lazy_snippet_matches_eager_snippet(num_lines):
+    lines = [str(index) for index in range(num_lines)]
+    for line_number in range(1, num_lines + 1):
+        snippet = get_code_snippet(lines, line_number, lines_of_context=2)
+        expected = CodeSnippet(
+            snippet=lines[snippet.start_line:snippet._end_line],
+            start_line=snippet.start_line,
+            target_index=snippet.target_index,
+        )
+
+        assert snippet.target_line == expected.target_line
+        assert snippet.previous_line == expected.previous_line
+        assert snippet._lines is None
+
+        assert snippet.lines == expected.lines
+        assert snippet.previous_line == expected.previous_line
+
+
+def test_lazy_snippet_does_not_modify_lines():
+    lines = list('abcde')
+    snippet = get_code_snippet(lines, 3, lines_of_context=2)
+    snippet.target_line = 'z'
+
+    assert snippet.target_line == 'z'
+    assert list(snippet) == list('abzde')
+    assert lines == list('abcde')
@@ -0,0 +1,67 @@
+import textwrap
+
+from detect_secrets.util.diff import split_diff_by_file
+
+
+def test_git_diff():
+    with open('test_data/sample.diff') as f:
+        lines = f.readlines()
+
+    patches = list(split_diff_by_file(lines))
+    assert [patch[0] for patch in patches] == [
+        line
+        for line in lines
+        if line.startswith('diff --git ')
+    ]
+    assert [line for patch in patches for line in patch] == lines
+
+
+def test_unified_diff_without_git_headers():
+    diff = textwrap.dedent("""
+        --- a/first
+        +++ b/first
+        @@ -1,2 +1,2 @@
+         context
+        --- removed line that looks like a header
+        +added
+        --- a/second
+        +++ b/second
+        @@ -1 +1 @@
+        -removed
+        +added
+    """)[1:]
+
+    assert [patch[0] for patch in split_diff_by_file(diff.splitlines(keepends=True))] == [
+        '--- a/first\n',
+        '--- a/second\n',
+    ]
+
+
+def test_keeps_lines_between_files_with_preceding_file():
+    diff = textwrap.dedent("""
+        commit abcdef
+        Author: Someone
+
+            message
+
+        diff --git a/first b/first
+        index 0000000..1111111 100644
+        --- a/first
+        +++ b/first
+        @@ -0,0 +1 @@
+        +added
+
+        commit 123456
+        diff --git a/second b/second
+        --- a/second
+        +++ b/second
+        @@ -1 +0,0 @@
+        -removed
+    """)[1:]
+
+    patches = list(split_diff_by_file(diff.splitlines(keepends=True)))
+    assert [patch[0] for patch in patches] == [
+        'commit abcdef\n',
+        'diff --git a/second b/second\n',
+    ]
+    assert patches[0][-2:] == ['\n', 'commit 123456\n']
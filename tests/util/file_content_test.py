@@ -0,0 +1,38 @@
+import pytest
+
+from detect_secrets.util.file_content import FileContent
+from testing.mocks import mock_named_temporary_file
+
+
+def test_matches_reading_file():
+    with mock_named_temporary_file() as f:
+        f.write('first\r\nsecond\x0cline\nthird'.encode())
+        f.seek(0)
+
+        content = FileContent(f.name)
+        with open(f.name) as g:
+            assert content.lines == g.readlines()
+
+        with open(f.name) as g:
+            assert content.text == g.read()
+
+        assert content.size == 24
+
+
+def test_open_is_independent():
+    content = FileContent('test_data/config.ini')
+
+    first = content.open()
+    assert first.name == 'test_data/config.ini'
+    assert first.readline()
+
+    assert content.open().read() == content.text
+
+
+def test_binary_file():
+    with mock_named_temporary_file() as f:
+        f.write(b'\x86')
+        f.seek(0)
+
+        with pytest.raises(UnicodeDecodeError):
+            FileContent(f.name)
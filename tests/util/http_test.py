@@ -0,0 +1,13 @@
+import threading
+
+from detect_secrets.util.http import get_session
+
+
+def test_sessions_are_per_thread():
+    sessions = []
+    thread = threading.Thread(target=lambda: sessions.append(get_session()))
+    thread.start()
+    thread.join()
+
+    assert get_session() is get_session()
+    assert sessions[0] is not get_session()
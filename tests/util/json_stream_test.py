@@ -0,0 +1,138 @@
+import io
+import json
+
+import pytest
+
+from detect_secrets.util import json_stream
+
+
+@pytest.mark.parametrize(
+    'obj',
+    (
+        {},
+        {'a': 1},
+        {'a': {}, 'b': [], 'c': {'d': [1, {'e': None}]}, 'f': 'g\nhé'},
+    ),
+)
+def test_dump_matches_json(obj):
+    f = io.StringIO()
+    json_stream.dump(obj, f)
+
+    assert f.getvalue() == json.dumps(obj, indent=2)
+
+
+@pytest.mark.parametrize(
+    'items',
+    (
+        [],
+        [('a', [{'b': 1}]), ('c', [])],
+    ),
+)
+def test_dump_streams_iterators(items):
+    f = io.StringIO()
+    json_stream.dump({'a': 1, 'results': iter(items), 'b': 2}, f)
+
+    assert f.getvalue() == json.dumps({'a': 1, 'results': dict(items), 'b': 2}, indent=2)
+
+
+@pytest.mark.parametrize('chunk_size', (1, 3, 1024))
+@pytest.mark.parametrize(
+    'content',
+    (
+        '{}',
+        ' { "a" : 12345 , "b": {"c": [1, 2], "d": {}}, "e": {"f": {"g": true}}}\n',
+        json.dumps({'results': {'a.py': [{'line_number': 1234}]}}, indent=2),
+        '[1, 2]',
+        '123',
+    ),
+)
+def test_load_matches_json(content, chunk_size):
+    assert json_stream.load(io.StringIO(content), chunk_size=chunk_size) == json.loads(content)
+
+
+@pytest.mark.parametrize(
+    'content',
+    (
+        '',
+        '{',
+        '{"a": 1',
+        '{"a" 1}',
+        '{"a": 1,}',
+        '{1: 2}',
+        '{"a": 1} {}',
+    ),
+)
+def test_load_invalid(content):
+    with pytest.raises(json.decoder.JSONDecodeError):
+        json_stream.load(io.StringIO(content), chunk_size=2)
+
+
+@pytest.mark.parametrize('chunk_size', (1, 3, 1024))
+@pytest.mark.parametrize(
+    'include, expected',
+    (
+        (lambda path: path != ('results',), {'a': 1, 'b': {'c': 2}}),
+        (
+            lambda path: path[0] != 'results' or len(path) == 1 or path[1] == 'd.py',
+            {'a': 1, 'results': {'d.py': [{'e': '}'}]}, 'b': {'c': 2}},
+        ),
+    ),
+)
+def test_load_skips_excluded_values(include, expected, chunk_size):
+    content = json.dumps({
+        'a': 1,
+        'results': {
+            'c.py': [{'d': 'x"]}{\\', 'e': [1, {'f': '['}]}],
+            'd.py': [{'e': '}'}],
+        },
+        'b': {'c': 2},
+    })
+
+    assert json_stream.load(
+        io.StringIO(content),
+        chunk_size=chunk_size,
+        include=include,
+    ) == expected
+
+
+@pytest.mark.parametrize(
+    'content',
+    (
+        '{"a": [1, ',
+        '{"a": {"b": "c}',
+        '{"a": {"b": "c\\',
+    ),
+)
+def test_load_invalid_skipped_value(content):
+    with pytest.raises(json.decoder.JSONDecodeError):
+        json_stream.load(io.StringIO(content), chunk_size=2, include=lambda path: False)
+
+
+@pytest.mark.parametrize('chunk_size', (1, 3, 1024))
+def test_iter_items(chunk_size):
+    content = json.dumps({
+        'a': {'b': '}'},
+        'results': {'c.py': [{'d': 1}], 'e.py': []},
+        'f': 2,
+    })
+
+    items = json_stream.iter_items(io.StringIO(content), ('results',), chunk_size=chunk_size)
+    assert list(items) == [('c.py', [{'d': 1}]), ('e.py', [])]
+
+
+def test_iter_items_is_lazy():
+    f = io.StringIO(json.dumps({'results': {'a.py': [], 'b.py': {'c': ['d']}}}))
+
+    items = json_stream.iter_items(f, ('results',), chunk_size=4)
+    assert next(items) == ('a.py', [])
+    assert f.tell() < len(f.getvalue())
+
+
+def test_load_does_not_read_whole_file():
+    class Reader(io.StringIO):
+        def read(self, size=-1):
+            assert 0 < size < 1024
+            return super().read(size)
+
+    content = json.dumps({'results': {str(index): [index] for index in range(1000)}}, indent=2)
+    assert json_stream.load(Reader(content), chunk_size=16) == json.loads(content)